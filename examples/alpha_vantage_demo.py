@@ -100,8 +100,10 @@ async def test_screening_criteria(provider: AlphaVantageProvider) -> None:
     print(f"Testing {len(symbols)} symbols...")
     print("-" * 60)
 
-    for symbol in symbols:
-        overview = await provider.get_company_overview(symbol)
+    # Issue all requests in one batch; the provider caps concurrency at its rate limit
+    overviews = await provider.get_many_overviews(symbols)
+
+    for symbol, overview in zip(symbols, overviews, strict=True):
         meets = overview.meets_screener_criteria(
             min_revenue=min_revenue, min_market_cap=min_market_cap
         )
@@ -131,7 +133,7 @@ async def fetch_historical_data(provider: AlphaVantageProvider, symbol: str) ->
     print("-" * 70)
 
     # Show last 5 bars
-    for bar in data[-5:]:
+    for bar in data[-5:].to_ohlcv_list():
         print(
             f"{bar.timestamp.date()}  "
             f"${bar.open:>7.2f}  "
@@ -141,11 +143,10 @@ async def fetch_historical_data(provider: AlphaVantageProvider, symbol: str) ->
             f"{bar.volume:>10,}"
         )
 
-    # Calculate simple metrics
-    closes = [float(bar.close) for bar in data]
-    avg_close = sum(closes) / len(closes)
-    high = max(float(bar.high) for bar in data)
-    low = min(float(bar.low) for bar in data)
+    # Calculate simple metrics on the price columns
+    avg_close = float(data.close.mean())
+    high = float(data.high.max())
+    low = float(data.low.min())
 
     print()
     print(f"60-day average close: ${avg_close:.2f}")
@@ -174,23 +175,22 @@ async def main() -> None:
     print(f"\nAPI Key: {api_key[:8]}...{api_key[-4:]}")
     print("\nInitializing provider...")
 
-    # Create provider with rate limiting
+    # Create provider with rate limiting; the context manager closes its HTTP session
     config = DataProviderConfig(api_key=api_key, rate_limit=5)
-    provider = AlphaVantageProvider(config)
-
-    print("Rate limit: 5 requests/minute (12 seconds between calls)")
+    async with AlphaVantageProvider(config) as provider:
+        print("Rate limit: 5 requests/minute (bursts of 5, then one call every 12 seconds)")
 
-    # Demo 1: Fetch comprehensive company data
-    print("\n" + "=" * 60)
-    print("Demo 1: Company Fundamentals")
-    print("=" * 60)
-    await fetch_company_overview(provider, "IBM")
+        # Demo 1: Fetch comprehensive company data
+        print("\n" + "=" * 60)
+        print("Demo 1: Company Fundamentals")
+        print("=" * 60)
+        await fetch_company_overview(provider, "IBM")
 
-    # Demo 2: Test screening criteria
-    await test_screening_criteria(provider)
+        # Demo 2: Test screening criteria
+        await test_screening_criteria(provider)
 
-    # Demo 3: Historical data
-    await fetch_historical_data(provider, "IBM")
+        # Demo 3: Historical data
+        await fetch_historical_data(provider, "IBM")
 
     print("\n" + "#" * 60)
     print("# Demo Complete!")
@@ -1,44 +1,424 @@
 """
-Technical indicator calculations using pandas-ta.
+Technical indicator calculations using NumPy.
 
 This module provides the IndicatorCalculator class for computing various technical
 indicators from OHLCV data, including moving averages, RSI, and volume averages.
+
+Only the latest value of each indicator is needed for screening, so the indicators
+are computed directly from the tail of the close/volume arrays in a single fused
+kernel instead of materializing a full-length series per indicator. Results match
+pandas-ta's SMA and RSI (RMA smoothing) definitions.
+
+When numba is installed (``poetry install -E jit``) the indicators are computed
+by a single JIT-compiled kernel specialized for the fixed screener periods;
+otherwise vectorized NumPy equivalents are used.
 """
 
+import logging
+import math
+from datetime import datetime
+from operator import attrgetter
+from typing import TYPE_CHECKING
+
+import numpy as np
+from cachetools import TTLCache
 
-import pandas as pd
-import pandas_ta as ta
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - numba is an optional dependency
+    njit = None
+    prange = range
 
-from orion.data.models import OHLCV, TechnicalIndicators
+from orion.data.models import OHLCV, IndicatorPanel, OhlcvSeries, TechnicalIndicators
 from orion.utils.logging import get_logger
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = get_logger(__name__, component="IndicatorCalculator")
 
+# C-level field accessors for converting OHLCV bars to column arrays
+_timestamp = attrgetter("timestamp")
+_open = attrgetter("open")
+_high = attrgetter("high")
+_low = attrgetter("low")
+_close = attrgetter("close")
+_volume = attrgetter("volume")
+
+SMA_SHORT_PERIOD = 20
+SMA_LONG_PERIOD = 60
+RSI_PERIOD = 14
+VOLUME_AVG_PERIOD = 20
+
+# Results shared by all caching calculators, keyed by (symbol, last bar timestamp,
+# bar count, last close, last volume). Module-level so it survives across warm
+# Lambda invocations.
+_RESULT_CACHE_SIZE = 1000
+_RESULT_CACHE_TTL = 3600
+_MemoKey = tuple[str, datetime, int, float, float]
+_result_cache: TTLCache[_MemoKey, TechnicalIndicators] = TTLCache(
+    maxsize=_RESULT_CACHE_SIZE, ttl=_RESULT_CACHE_TTL
+)
+
+_PANEL_COLUMNS = ("sma_20", "sma_60", "rsi_14", "volume_avg_20")
+
+
+def _finite_or_none(value: float) -> float | None:
+    """Convert a NaN/inf kernel result to None."""
+    return value if math.isfinite(value) else None
+
+
+def _sma_tail(values: np.ndarray, period: int) -> float | None:
+    """
+    Calculate the latest Simple Moving Average value.
+
+    Args:
+        values: 1-D array of values, oldest first
+        period: SMA period
+
+    Returns:
+        Mean of the last `period` values, or None if insufficient data
+    """
+    if len(values) < period:
+        return None
+    return _finite_or_none(float(values[-period:].mean()))
+
+
+def _rma_tail(values: np.ndarray, period: int) -> float:
+    """
+    Calculate the latest Wilder (RMA) smoothed value of a series.
+
+    Equivalent to ``ewm(alpha=1/period, adjust=False).mean().iloc[-1]`` seeded
+    with the first value. The recurrence unrolls to a weighted sum, so the tail
+    value is a single dot product with geometrically decaying weights.
+
+    Args:
+        values: 1-D array of values, oldest first (must be non-empty)
+        period: Smoothing period
+
+    Returns:
+        Latest smoothed value
+    """
+    alpha = 1.0 / period
+    decay = 1.0 - alpha
+    n = len(values)
+    weights = alpha * decay ** np.arange(n - 1, -1, -1, dtype=np.float64)
+    weights[0] = decay ** (n - 1)
+    return float(values @ weights)
+
+
+def _wilder_step(
+    avg_gain: float, avg_loss: float, change: float, period: int
+) -> tuple[float, float]:
+    """
+    Advance Wilder-smoothed average gain and loss by one price change.
+
+    Args:
+        avg_gain: Current average gain
+        avg_loss: Current average loss
+        change: Latest close-to-close price change
+        period: RSI period
+
+    Returns:
+        Tuple of the updated (avg_gain, avg_loss)
+    """
+    alpha = 1.0 / period
+    decay = 1.0 - alpha
+    return (
+        decay * avg_gain + alpha * max(change, 0.0),
+        decay * avg_loss + alpha * max(-change, 0.0),
+    )
+
+
+if njit is not None:
+    _wilder_step = njit(cache=True, inline="always")(_wilder_step)
+
+
+def _wilder_averages(close: np.ndarray, period: int) -> tuple[float, float]:
+    """
+    Return the final Wilder-smoothed average gain and loss of a close series.
+
+    Args:
+        close: 1-D float64 array of closing prices, oldest first (at least 2)
+        period: RSI period
+
+    Returns:
+        Tuple of (avg_gain, avg_loss), seeded from the first price change
+    """
+    d = close[1] - close[0]
+    avg_gain = max(d, 0.0)
+    avg_loss = max(-d, 0.0)
+    for i in range(2, len(close)):
+        avg_gain, avg_loss = _wilder_step(avg_gain, avg_loss, close[i] - close[i - 1], period)
+    return avg_gain, avg_loss
+
+
+if njit is not None:
+    _wilder_averages = njit(cache=True)(_wilder_averages)
+
+
+def _rsi_last(close: np.ndarray, period: int) -> float:
+    """
+    Calculate the latest RSI value from the Wilder-smoothed averages.
+
+    Uses the same seeding as pandas-ta (smoothing starts from the first price
+    change), so it is interchangeable with the NumPy path in `_rsi_tail`.
+
+    Args:
+        close: 1-D float64 array of closing prices, oldest first
+        period: RSI period
+
+    Returns:
+        Latest RSI value, or NaN if insufficient data or prices never change
+    """
+    if len(close) < period + 1:
+        return np.nan
+
+    avg_gain, avg_loss = _wilder_averages(close, period)
+    total = avg_gain + avg_loss
+    if total == 0.0:
+        return np.nan
+    return float(100.0 * avg_gain / total)
+
+
+def _rsi_last_rows(closes: np.ndarray, period: int) -> np.ndarray:
+    """
+    Calculate the latest RSI value for each row of a left-NaN-padded 2-D array.
+
+    Args:
+        closes: 2-D float64 array of shape (symbols, bars), oldest bar first
+        period: RSI period
+
+    Returns:
+        1-D array with the latest RSI per row (NaN if undefined)
+    """
+    n_rows, n_cols = closes.shape
+    out = np.empty(n_rows, dtype=np.float64)
+    for s in prange(n_rows):
+        start = 0
+        while start < n_cols and np.isnan(closes[s, start]):
+            start += 1
+        out[s] = _rsi_last(closes[s, start:], period)
+    return out
+
+
+if njit is not None:
+    _rsi_last = njit(cache=True)(_rsi_last)
+    _rsi_last_rows = njit(cache=True, parallel=True)(_rsi_last_rows)
+
+
+def _rsi_series(close: np.ndarray, period: int) -> np.ndarray:
+    """
+    Calculate the full RSI series in one Wilder smoothing pass.
+
+    Element i equals `_rsi_last(close[: i + 1], period)`, so every prefix RSI
+    comes out of a single O(N) loop instead of one pass per prefix.
+
+    Args:
+        close: 1-D float64 array of closing prices, oldest first
+        period: RSI period
+
+    Returns:
+        Array the length of `close`; NaN for the first `period` bars and
+        wherever prices never changed
+    """
+    n = len(close)
+    out = np.full(n, np.nan)
+    if n < period + 1:
+        return out
+
+    d = close[1] - close[0]
+    avg_gain = max(d, 0.0)
+    avg_loss = max(-d, 0.0)
+    for i in range(2, n):
+        avg_gain, avg_loss = _wilder_step(avg_gain, avg_loss, close[i] - close[i - 1], period)
+        if i >= period:
+            total = avg_gain + avg_loss
+            if total != 0.0:
+                out[i] = 100.0 * avg_gain / total
+    return out
+
+
+if njit is not None:
+    _rsi_series = njit(cache=True)(_rsi_series)
+
+
+def _tail_kernel(close: np.ndarray, volume: np.ndarray) -> tuple[float, float, float, float]:
+    """
+    Fused tail kernel specialized for the screener's fixed periods.
+
+    The period constants are module globals, which numba freezes into the
+    compiled code, so every loop has a constant trip count. The SMA-60 sum
+    reuses the SMA-20 sum for its most recent 20 bars.
+
+    Args:
+        close: 1-D float64 array of closing prices, oldest first
+        volume: 1-D array of volumes, oldest first
+
+    Returns:
+        Tuple of (sma_20, sma_60, rsi_14, volume_avg_20); NaN where there is
+        insufficient data
+    """
+    n = len(close)
+    sma_short = np.nan
+    sma_long = np.nan
+    volume_avg = np.nan
+
+    if n >= SMA_SHORT_PERIOD:
+        short_sum = 0.0
+        for i in range(n - SMA_SHORT_PERIOD, n):
+            short_sum += close[i]
+        sma_short = short_sum / SMA_SHORT_PERIOD
+
+        if n >= SMA_LONG_PERIOD:
+            long_sum = short_sum
+            for i in range(n - SMA_LONG_PERIOD, n - SMA_SHORT_PERIOD):
+                long_sum += close[i]
+            sma_long = long_sum / SMA_LONG_PERIOD
+
+    if len(volume) >= VOLUME_AVG_PERIOD:
+        volume_sum = 0.0
+        for i in range(len(volume) - VOLUME_AVG_PERIOD, len(volume)):
+            volume_sum += volume[i]
+        volume_avg = volume_sum / VOLUME_AVG_PERIOD
+
+    return sma_short, sma_long, _rsi_last(close, RSI_PERIOD), volume_avg
+
+
+if njit is not None:
+    _tail_kernel = njit(cache=True)(_tail_kernel)
+
+
+def _rsi_tail(close: np.ndarray, period: int) -> float | None:
+    """
+    Calculate the latest Relative Strength Index value.
+
+    Args:
+        close: 1-D array of closing prices, oldest first
+        period: RSI period
+
+    Returns:
+        Latest RSI value (0-100), or None if insufficient data
+    """
+    if len(close) < period + 1:
+        return None
+
+    if njit is not None:
+        return _finite_or_none(float(_rsi_last(close, period)))
+
+    diff = np.diff(close)
+    avg_gain = _rma_tail(np.where(diff > 0, diff, 0.0), period)
+    avg_loss = _rma_tail(np.where(diff < 0, -diff, 0.0), period)
+
+    total = avg_gain + avg_loss
+    if total == 0:
+        return None
+    return _finite_or_none(100.0 * avg_gain / total)
+
+
+def _sma_tail_rows(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    Calculate the latest SMA for each row of a left-NaN-padded 2-D array.
+
+    Rows whose tail window contains padding (fewer than `period` bars) yield NaN.
+
+    Args:
+        values: 2-D float64 array of shape (symbols, bars), oldest bar first
+        period: SMA period
+
+    Returns:
+        1-D array with the latest SMA per row
+    """
+    if values.shape[1] < period:
+        return np.full(values.shape[0], np.nan)
+    result: np.ndarray = values[:, -period:].mean(axis=1)
+    return result
+
+
+def _rsi_rows(closes: np.ndarray, period: int) -> np.ndarray:
+    """Calculate the latest RSI per row, using the JIT kernel when available."""
+    if njit is not None:
+        result: np.ndarray = _rsi_last_rows(closes, period)
+        return result
+
+    out = np.empty(closes.shape[0], dtype=np.float64)
+    for s, row in enumerate(closes):
+        rsi = _rsi_tail(row[~np.isnan(row)], period)
+        out[s] = rsi if rsi is not None else np.nan
+    return out
+
+
+def _compute_tail_indicators(
+    close: np.ndarray, volume: np.ndarray
+) -> tuple[float | None, float | None, float | None, float | None]:
+    """
+    Compute the latest SMA-20, SMA-60, RSI-14 and volume avg-20 in one fused pass.
+
+    Args:
+        close: 1-D float64 array of closing prices, oldest first
+        volume: 1-D array of volumes, oldest first
+
+    Returns:
+        Tuple of (sma_20, sma_60, rsi_14, volume_avg_20); each is None if
+        there is insufficient data for that indicator
+    """
+    if njit is not None:
+        sma_20, sma_60, rsi_14, volume_avg_20 = _tail_kernel(close, volume)
+        return (
+            _finite_or_none(sma_20),
+            _finite_or_none(sma_60),
+            _finite_or_none(rsi_14),
+            _finite_or_none(volume_avg_20),
+        )
+
+    return (
+        _sma_tail(close, SMA_SHORT_PERIOD),
+        _sma_tail(close, SMA_LONG_PERIOD),
+        _rsi_tail(close, RSI_PERIOD),
+        _sma_tail(volume, VOLUME_AVG_PERIOD),
+    )
+
 
 class IndicatorCalculator:
     """
     Calculate technical indicators from historical OHLCV data.
 
-    This calculator uses the pandas-ta library to efficiently compute
+    This calculator uses vectorized NumPy kernels to efficiently compute
     technical indicators including Simple Moving Averages (SMA),
     Relative Strength Index (RSI), and volume averages.
 
+    With ``cache_results=True`` results are memoized for an hour by
+    (symbol, last bar timestamp, bar count, last close, last volume), so
+    re-screening the same symbols before the data changes skips the
+    computation. Intraday updates to the latest bar change the key; a revised
+    older bar does not, and returns the stale result until the entry expires.
+
     Example:
         >>> calculator = IndicatorCalculator()
-        >>> indicators = calculator.calculate(ohlcv_list, "AAPL")
+        >>> indicators = calculator.calculate(OhlcvSeries.from_bars(ohlcv_list), "AAPL")
         >>> print(indicators.sma_20, indicators.rsi_14)
     """
 
-    def __init__(self) -> None:
-        """Initialize the IndicatorCalculator."""
+    def __init__(self, cache_results: bool = False) -> None:
+        """Initialize the IndicatorCalculator.
+
+        Args:
+            cache_results: Memoize results by symbol, bar count and the latest
+                bar's timestamp, close and volume in a process-wide TTL cache.
+                Only enable this when `symbol` is the real ticker, since results
+                for different bars under the same key would collide.
+        """
         self._logger = logger
+        self._cache = _result_cache if cache_results else None
 
-    def calculate(self, ohlcv_list: list[OHLCV], symbol: str) -> TechnicalIndicators:
+    def calculate(self, ohlcv: list[OHLCV] | OhlcvSeries, symbol: str) -> TechnicalIndicators:
         """
-        Calculate technical indicators from a list of OHLCV data.
+        Calculate technical indicators from OHLCV data.
 
         Args:
-            ohlcv_list: List of OHLCV objects, sorted chronologically
+            ohlcv: OhlcvSeries or list of OHLCV objects, sorted chronologically.
+                Passing an OhlcvSeries avoids re-extracting the columns when the
+                same bars are analyzed several times.
             symbol: Stock symbol for the indicators
 
         Returns:
@@ -46,21 +426,27 @@ class IndicatorCalculator:
             Indicator values will be None if insufficient data is available.
 
         Raises:
-            ValueError: If ohlcv_list is empty
+            ValueError: If ohlcv is empty
 
         Note:
             Minimum data requirements:
             - SMA-20: 20 data points
             - SMA-60: 60 data points
-            - RSI-14: 15 data points (pandas-ta needs warmup period)
+            - RSI-14: 15 data points (one extra bar for the first price change)
             - Volume avg-20: 20 data points
         """
-        if not ohlcv_list:
+        if not len(ohlcv):
             self._logger.warning("empty_ohlcv_list", symbol=symbol)
             raise ValueError(f"Cannot calculate indicators for {symbol}: OHLCV list is empty")
 
-        data_points = len(ohlcv_list)
-        timestamp = ohlcv_list[-1].timestamp
+        data_points = len(ohlcv)
+        cache_key = self._memo_key(ohlcv, symbol)
+        timestamp = cache_key[1]
+        if self._cache is not None:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self._logger.debug("indicators_cache_hit", symbol=symbol)
+                return cached
 
         # Log if we have limited data
         if data_points < 60:
@@ -71,14 +457,12 @@ class IndicatorCalculator:
                 note="Full indicator calculation requires at least 60 data points",
             )
 
-        # Convert OHLCV list to pandas DataFrame
-        df = self._ohlcv_to_dataframe(ohlcv_list)
-
-        # Calculate indicators
-        sma_20 = self._calculate_sma(df, period=20)
-        sma_60 = self._calculate_sma(df, period=60)
-        rsi_14 = self._calculate_rsi(df, period=14)
-        volume_avg_20 = self._calculate_volume_avg(df, period=20)
+        # Extract close/volume columns and calculate indicators in one fused pass
+        if isinstance(ohlcv, OhlcvSeries):
+            close, volume = ohlcv.close, ohlcv.volume
+        else:
+            close, volume = self._close_volume_arrays(ohlcv)
+        sma_20, sma_60, rsi_14, volume_avg_20 = _compute_tail_indicators(close, volume)
 
         indicators = TechnicalIndicators(
             symbol=symbol,
@@ -89,102 +473,214 @@ class IndicatorCalculator:
             volume_avg_20=volume_avg_20,
         )
 
-        self._logger.debug(
-            "indicators_calculated",
-            symbol=symbol,
-            sma_20=sma_20,
-            sma_60=sma_60,
-            rsi_14=rsi_14,
-            volume_avg_20=volume_avg_20,
-        )
+        if self._cache is not None:
+            self._cache[cache_key] = indicators
+
+        if self._logger.is_enabled_for(logging.DEBUG):
+            self._logger.debug(
+                "indicators_calculated",
+                symbol=symbol,
+                sma_20=sma_20,
+                sma_60=sma_60,
+                rsi_14=rsi_14,
+                volume_avg_20=volume_avg_20,
+            )
 
         return indicators
 
-    def _ohlcv_to_dataframe(self, ohlcv_list: list[OHLCV]) -> pd.DataFrame:
+    def rsi_series(self, ohlcv: list[OHLCV] | OhlcvSeries, period: int = RSI_PERIOD) -> np.ndarray:
         """
-        Convert a list of OHLCV objects to a pandas DataFrame.
+        Calculate the RSI as of every bar.
+
+        Element i is the RSI that `calculate` would report for the first i + 1
+        bars, computed for all bars in a single pass.
 
         Args:
-            ohlcv_list: List of OHLCV objects
+            ohlcv: OhlcvSeries or list of OHLCV objects, sorted chronologically
+            period: RSI period
 
         Returns:
-            DataFrame with columns: timestamp, open, high, low, close, volume
+            1-D float64 array aligned with the bars; NaN where RSI is undefined
+        """
+        if isinstance(ohlcv, OhlcvSeries):
+            close = ohlcv.close
+        else:
+            close, _ = self._close_volume_arrays(ohlcv)
+        result: np.ndarray = _rsi_series(np.ascontiguousarray(close, dtype=np.float64), period)
+        return result
+
+    def calculate_batch(self, closes: np.ndarray, volumes: np.ndarray) -> dict[str, np.ndarray]:
+        """
+        Calculate the latest indicators for many symbols at once.
+
+        Each row holds one symbol's series, oldest bar first. Series shorter
+        than the row width must be left-padded with NaN (see `stack_series`)
+        so that the last column is every symbol's latest bar.
+
+        Args:
+            closes: 2-D float64 array of closing prices, shape (symbols, bars)
+            volumes: 2-D float64 array of volumes, shape (symbols, bars)
+
+        Returns:
+            Dict mapping indicator name (sma_20, sma_60, rsi_14, volume_avg_20)
+            to a 1-D array with one value per symbol; NaN where there is
+            insufficient data
+
+        Raises:
+            ValueError: If closes and volumes are not 2-D arrays of the same shape
         """
-        data = {
-            "timestamp": [bar.timestamp for bar in ohlcv_list],
-            "open": [float(bar.open) for bar in ohlcv_list],
-            "high": [float(bar.high) for bar in ohlcv_list],
-            "low": [float(bar.low) for bar in ohlcv_list],
-            "close": [float(bar.close) for bar in ohlcv_list],
-            "volume": [bar.volume for bar in ohlcv_list],
+        closes = np.asarray(closes, dtype=np.float64)
+        volumes = np.asarray(volumes, dtype=np.float64)
+        if closes.ndim != 2 or closes.shape != volumes.shape:
+            raise ValueError(
+                f"closes and volumes must be 2-D arrays of the same shape, "
+                f"got {closes.shape} and {volumes.shape}"
+            )
+
+        return {
+            "sma_20": _sma_tail_rows(closes, SMA_SHORT_PERIOD),
+            "sma_60": _sma_tail_rows(closes, SMA_LONG_PERIOD),
+            "rsi_14": _rsi_rows(closes, RSI_PERIOD),
+            "volume_avg_20": _sma_tail_rows(volumes, VOLUME_AVG_PERIOD),
         }
-        df = pd.DataFrame(data)
-        df.set_index("timestamp", inplace=True)
-        return df
 
-    def _calculate_sma(self, df: pd.DataFrame, period: int) -> float | None:
+    def calculate_panel(
+        self, histories: list[list[OHLCV] | OhlcvSeries], symbols: list[str]
+    ) -> IndicatorPanel:
         """
-        Calculate Simple Moving Average.
+        Calculate the latest indicators for many symbols into an IndicatorPanel.
+
+        With ``cache_results=True`` rows already memoized by `calculate` or an
+        earlier panel are reused, and only the remaining symbols are computed.
 
         Args:
-            df: DataFrame with OHLCV data
-            period: SMA period
+            histories: Non-empty OHLCV data per symbol, sorted chronologically
+            symbols: Symbols aligned with `histories`
 
         Returns:
-            Latest SMA value or None if insufficient data
+            IndicatorPanel with one row per symbol
+
+        Raises:
+            ValueError: If the lengths differ or any history is empty
+        """
+        if len(histories) != len(symbols):
+            raise ValueError(
+                f"Got {len(histories)} histories for {len(symbols)} symbols; lengths must match"
+            )
+
+        series = [h if isinstance(h, OhlcvSeries) else OhlcvSeries.from_bars(h) for h in histories]
+        for symbol, s in zip(symbols, series, strict=True):
+            if not len(s):
+                raise ValueError(f"Cannot calculate indicators for {symbol}: OHLCV list is empty")
+
+        keys = [self._memo_key(s, symbol) for symbol, s in zip(symbols, series, strict=True)]
+        cached: list[TechnicalIndicators | None] = (
+            [self._cache.get(key) for key in keys]
+            if self._cache is not None
+            else [None] * len(keys)
+        )
+        misses = [i for i, hit in enumerate(cached) if hit is None]
+
+        columns = {name: np.full(len(series), np.nan) for name in _PANEL_COLUMNS}
+        if misses:
+            batch = self.calculate_batch(
+                self.stack_series([series[i].close for i in misses]),
+                self.stack_series([series[i].volume for i in misses]),
+            )
+            for name, values in batch.items():
+                columns[name][misses] = values
+        for i, hit in enumerate(cached):
+            if hit is not None:
+                for name, column in columns.items():
+                    value = getattr(hit, name)
+                    column[i] = np.nan if value is None else value
+
+        panel = IndicatorPanel(
+            symbols=list(symbols),
+            timestamps=[s.last_timestamp for s in series],
+            **columns,
+        )
+        if self._cache is not None:
+            for i in misses:
+                self._cache[keys[i]] = panel.row(i)
+        return panel
+
+    @staticmethod
+    def stack_series(series: list[np.ndarray]) -> np.ndarray:
         """
-        if len(df) < period:
-            return None
+        Stack per-symbol 1-D series into a left-NaN-padded 2-D float64 array.
+
+        Args:
+            series: List of 1-D arrays, one per symbol, oldest value first
 
-        try:
-            sma = ta.sma(df["close"], length=period)
-            latest = sma.iloc[-1]
-            return float(latest) if pd.notna(latest) else None
-        except Exception as e:
-            self._logger.error("sma_calculation_failed", period=period, error=str(e))
-            return None
+        Returns:
+            Array of shape (len(series), max length) aligned on the latest value
+        """
+        width = max((len(s) for s in series), default=0)
+        stacked = np.full((len(series), width), np.nan)
+        for i, s in enumerate(series):
+            if len(s):
+                stacked[i, -len(s) :] = s
+        return stacked
+
+    @staticmethod
+    def _memo_key(ohlcv: list[OHLCV] | OhlcvSeries, symbol: str) -> _MemoKey:
+        """Build the result cache key of a non-empty history.
+
+        The latest bar changes intraday without a new timestamp, so its close
+        and volume are part of the key.
+        """
+        if isinstance(ohlcv, OhlcvSeries):
+            return (
+                symbol,
+                ohlcv.last_timestamp,
+                len(ohlcv),
+                float(ohlcv.close[-1]),
+                float(ohlcv.volume[-1]),
+            )
+        last = ohlcv[-1]
+        return (symbol, last.timestamp, len(ohlcv), float(last.close), float(last.volume))
 
-    def _calculate_rsi(self, df: pd.DataFrame, period: int) -> float | None:
+    def _close_volume_arrays(self, ohlcv_list: list[OHLCV]) -> tuple[np.ndarray, np.ndarray]:
         """
-        Calculate Relative Strength Index.
+        Extract close prices and volumes from a list of OHLCV objects.
 
         Args:
-            df: DataFrame with OHLCV data
-            period: RSI period
+            ohlcv_list: List of OHLCV objects
 
         Returns:
-            Latest RSI value or None if insufficient data
+            Tuple of (close float64 array, volume int64 array)
         """
-        # pandas-ta RSI needs at least period+1 data points
-        if len(df) < period + 1:
-            return None
+        n = len(ohlcv_list)
+        closes = np.fromiter(map(_close, ohlcv_list), dtype=np.float64, count=n)
+        volumes = np.fromiter(map(_volume, ohlcv_list), dtype=np.int64, count=n)
 
-        try:
-            rsi = ta.rsi(df["close"], length=period)
-            latest = rsi.iloc[-1]
-            return float(latest) if pd.notna(latest) else None
-        except Exception as e:
-            self._logger.error("rsi_calculation_failed", period=period, error=str(e))
-            return None
+        return closes, volumes
 
-    def _calculate_volume_avg(self, df: pd.DataFrame, period: int) -> float | None:
+    def _ohlcv_to_dataframe(self, ohlcv_list: list[OHLCV]) -> "pd.DataFrame":
         """
-        Calculate volume moving average.
+        Convert a list of OHLCV objects to a pandas DataFrame.
+
+        pandas is imported lazily: the indicator kernels do not need it, so
+        the screening path does not pay its import cost.
 
         Args:
-            df: DataFrame with OHLCV data
-            period: Averaging period
+            ohlcv_list: List of OHLCV objects
 
         Returns:
-            Latest volume average value or None if insufficient data
-        """
-        if len(df) < period:
-            return None
-
-        try:
-            vol_avg = ta.sma(df["volume"], length=period)
-            latest = vol_avg.iloc[-1]
-            return float(latest) if pd.notna(latest) else None
-        except Exception as e:
-            self._logger.error("volume_avg_calculation_failed", period=period, error=str(e))
-            return None
+            DataFrame with columns: timestamp, open, high, low, close, volume
+        """
+        import pandas as pd
+
+        n = len(ohlcv_list)
+        opens = np.fromiter(map(_open, ohlcv_list), dtype=np.float64, count=n)
+        highs = np.fromiter(map(_high, ohlcv_list), dtype=np.float64, count=n)
+        lows = np.fromiter(map(_low, ohlcv_list), dtype=np.float64, count=n)
+        closes = np.fromiter(map(_close, ohlcv_list), dtype=np.float64, count=n)
+        volumes = np.fromiter(map(_volume, ohlcv_list), dtype=np.int64, count=n)
+        timestamps = list(map(_timestamp, ohlcv_list))
+
+        return pd.DataFrame(
+            {"open": opens, "high": highs, "low": lows, "close": closes, "volume": volumes},
+            index=pd.DatetimeIndex(timestamps, name="timestamp"),
+        )
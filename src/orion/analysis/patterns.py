@@ -5,13 +5,20 @@ This module provides the PatternDetector class for identifying chart patterns
 such as Higher High + Higher Low (bounce) and volume confirmation.
 """
 
+import logging
 from dataclasses import dataclass
+from operator import attrgetter
 
-from orion.data.models import OHLCV
+import numpy as np
+
+from orion.data.models import OHLCV, OhlcvSeries
 from orion.utils.logging import get_logger
 
 logger = get_logger(__name__, component="PatternDetector")
 
+# C-level field accessor for OHLCV bar volumes
+_volume = attrgetter("volume")
+
 
 @dataclass
 class BouncePatternResult:
@@ -68,7 +75,7 @@ class PatternDetector:
 
     def detect_bounce(
         self,
-        ohlcv_list: list[OHLCV],
+        ohlcv: list[OHLCV] | OhlcvSeries,
         lookback: int | None = None,
     ) -> bool:
         """
@@ -80,7 +87,7 @@ class PatternDetector:
         3. This indicates bullish momentum with higher support
 
         Args:
-            ohlcv_list: List of OHLCV objects, sorted chronologically
+            ohlcv: OhlcvSeries or list of OHLCV objects, sorted chronologically
             lookback: Number of bars to look back for previous high/low
                      (defaults to instance default_lookback)
 
@@ -88,18 +95,19 @@ class PatternDetector:
             True if bounce pattern is detected, False otherwise
 
         Raises:
-            ValueError: If ohlcv_list has fewer than 2 elements
+            ValueError: If ohlcv has fewer than 2 bars
 
         Example:
             >>> detector = PatternDetector()
             >>> is_bouncing = detector.detect_bounce(ohlcv_list, lookback=5)
         """
-        result = self.detect_bounce_detailed(ohlcv_list, lookback)
-        return result.is_bounce
+        lookback = lookback if lookback is not None else self._default_lookback
+        highs, lows = self._high_low_arrays(ohlcv, lookback)
+        return self._bounce_core(highs, lows, lookback)[0]
 
     def detect_bounce_detailed(
         self,
-        ohlcv_list: list[OHLCV],
+        ohlcv: list[OHLCV] | OhlcvSeries,
         lookback: int | None = None,
     ) -> BouncePatternResult:
         """
@@ -109,61 +117,142 @@ class PatternDetector:
         information about the detected pattern.
 
         Args:
-            ohlcv_list: List of OHLCV objects, sorted chronologically
+            ohlcv: OhlcvSeries or list of OHLCV objects, sorted chronologically
             lookback: Number of bars to look back for previous high/low
 
         Returns:
             BouncePatternResult with detection status and price details
         """
         lookback = lookback if lookback is not None else self._default_lookback
+        highs, lows = self._high_low_arrays(ohlcv, lookback)
+        return self.detect_bounce_arrays(highs, lows, lookback)
+
+    def detect_bounce_arrays(
+        self,
+        highs: np.ndarray,
+        lows: np.ndarray,
+        lookback: int | None = None,
+    ) -> BouncePatternResult:
+        """
+        Detect bounce pattern from parallel arrays of highs and lows.
+
+        The previous high/low are found with NumPy reductions over the
+        lookback window.
+
+        Args:
+            highs: 1-D float64 array of bar highs, sorted chronologically
+            lows: 1-D float64 array of bar lows, sorted chronologically
+            lookback: Number of bars to look back for previous high/low
+
+        Returns:
+            BouncePatternResult with detection status and price details
 
-        if len(ohlcv_list) < 2:
-            self._logger.warning("insufficient_data_for_bounce_detection", count=len(ohlcv_list))
+        Raises:
+            ValueError: If fewer than 2 bars are provided
+        """
+        lookback = lookback if lookback is not None else self._default_lookback
+        is_bounce, previous_high, previous_low, current_high, current_low, lookback_used = (
+            self._bounce_core(highs, lows, lookback)
+        )
+
+        return BouncePatternResult(
+            is_bounce=is_bounce,
+            previous_high=float(previous_high),
+            previous_low=float(previous_low),
+            current_high=float(current_high),
+            current_low=float(current_low),
+            lookback_used=lookback_used,
+        )
+
+    @staticmethod
+    def _high_low_arrays(
+        ohlcv: list[OHLCV] | OhlcvSeries, lookback: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Extract highs and lows of the current bar and its lookback window.
+
+        Args:
+            ohlcv: OhlcvSeries or list of OHLCV objects, sorted chronologically
+            lookback: Number of bars before the current bar to include
+
+        Returns:
+            Tuple of (highs, lows) float64 arrays
+        """
+        if isinstance(ohlcv, OhlcvSeries):
+            return ohlcv.high[-lookback - 1 :], ohlcv.low[-lookback - 1 :]
+
+        # Index the window directly: one pass, no intermediate list slice
+        start = max(len(ohlcv) - lookback - 1, 0)
+        n = len(ohlcv) - start
+        highs = np.empty(n, dtype=np.float64)
+        lows = np.empty(n, dtype=np.float64)
+        for j in range(n):
+            bar = ohlcv[start + j]
+            highs[j] = bar.high
+            lows[j] = bar.low
+        return highs, lows
+
+    def _bounce_core(
+        self,
+        highs: np.ndarray,
+        lows: np.ndarray,
+        lookback: int,
+    ) -> tuple[bool, float, float, float, float, int]:
+        """
+        Core higher-high + higher-low check shared by the bounce detectors.
+
+        Args:
+            highs: 1-D float64 array of bar highs, sorted chronologically
+            lows: 1-D float64 array of bar lows, sorted chronologically
+            lookback: Number of bars to look back for previous high/low
+
+        Returns:
+            Tuple of (is_bounce, previous_high, previous_low, current_high,
+            current_low, lookback_used)
+
+        Raises:
+            ValueError: If fewer than 2 bars are provided
+        """
+        n = len(highs)
+
+        if n < 2:
+            self._logger.warning("insufficient_data_for_bounce_detection", count=n)
             raise ValueError("Need at least 2 OHLCV bars to detect bounce pattern")
 
-        if len(ohlcv_list) < lookback + 1:
+        if n < lookback + 1:
             self._logger.debug(
                 "adjusting_lookback",
                 requested=lookback,
-                adjusted=len(ohlcv_list) - 1,
+                adjusted=n - 1,
             )
-            lookback = len(ohlcv_list) - 1
-
-        current = ohlcv_list[-1]
-        lookback_bars = ohlcv_list[-lookback - 1 : -1]
+            lookback = n - 1
 
         # Find previous high and low in lookback period
-        previous_high = max(float(bar.high) for bar in lookback_bars)
-        previous_low = min(float(bar.low) for bar in lookback_bars)
+        previous_high = highs[-lookback - 1 : -1].max()
+        previous_low = lows[-lookback - 1 : -1].min()
 
-        current_high = float(current.high)
-        current_low = float(current.low)
+        current_high = highs[-1]
+        current_low = lows[-1]
 
         # Check for higher high AND higher low
-        is_bounce = current_high > previous_high and current_low > previous_low
+        is_bounce = bool(current_high > previous_high and current_low > previous_low)
 
-        self._logger.debug(
-            "bounce_detection_complete",
-            is_bounce=is_bounce,
-            previous_high=previous_high,
-            previous_low=previous_low,
-            current_high=current_high,
-            current_low=current_low,
-            lookback=lookback,
-        )
+        if self._logger.is_enabled_for(logging.DEBUG):
+            self._logger.debug(
+                "bounce_detection_complete",
+                is_bounce=is_bounce,
+                previous_high=float(previous_high),
+                previous_low=float(previous_low),
+                current_high=float(current_high),
+                current_low=float(current_low),
+                lookback=lookback,
+            )
 
-        return BouncePatternResult(
-            is_bounce=is_bounce,
-            previous_high=previous_high,
-            previous_low=previous_low,
-            current_high=current_high,
-            current_low=current_low,
-            lookback_used=lookback,
-        )
+        return is_bounce, previous_high, previous_low, current_high, current_low, lookback
 
     def confirm_volume(
         self,
-        ohlcv_list: list[OHLCV],
+        ohlcv: list[OHLCV] | OhlcvSeries,
         threshold: float | None = None,
         period: int = 20,
     ) -> bool:
@@ -174,7 +263,7 @@ class PatternDetector:
         average volume by the specified threshold multiplier.
 
         Args:
-            ohlcv_list: List of OHLCV objects, sorted chronologically
+            ohlcv: OhlcvSeries or list of OHLCV objects, sorted chronologically
             threshold: Volume multiplier threshold (e.g., 1.2 = 20% above average)
                       (defaults to instance default_volume_threshold)
             period: Period for calculating average volume
@@ -183,7 +272,7 @@ class PatternDetector:
             True if volume spike is detected (current > threshold * avg), False otherwise
 
         Raises:
-            ValueError: If ohlcv_list is empty
+            ValueError: If ohlcv has fewer than 2 bars
 
         Example:
             >>> detector = PatternDetector()
@@ -191,25 +280,31 @@ class PatternDetector:
         """
         threshold = threshold if threshold is not None else self._default_volume_threshold
 
-        if not ohlcv_list:
+        n = len(ohlcv)
+        if not n:
             self._logger.warning("empty_ohlcv_list_for_volume_confirmation")
             raise ValueError("Cannot confirm volume with empty OHLCV list")
 
-        if len(ohlcv_list) < period:
+        if n < period:
             self._logger.debug(
                 "insufficient_data_for_volume_avg",
-                available=len(ohlcv_list),
+                available=n,
                 required=period,
             )
             # Use available data
-            period = len(ohlcv_list) - 1
+            period = n - 1
 
-        current_volume = ohlcv_list[-1].volume
-        period_bars = (
-            ohlcv_list[-period - 1 : -1] if len(ohlcv_list) > period + 1 else ohlcv_list[:-1]
-        )
+        if isinstance(ohlcv, OhlcvSeries):
+            volumes = ohlcv.volume
+        else:
+            bars = ohlcv[-period - 1 :]
+            volumes = np.fromiter(map(_volume, bars), dtype=np.int64, count=len(bars))
 
-        avg_volume = sum(bar.volume for bar in period_bars) / len(period_bars)
+        if len(volumes) < 2:
+            raise ValueError("Need at least 2 OHLCV bars to confirm volume")
+
+        current_volume = int(volumes[-1])
+        avg_volume = float(volumes[-period - 1 : -1].mean())
 
         # Avoid division by zero
         if avg_volume == 0:
@@ -219,20 +314,21 @@ class PatternDetector:
         volume_ratio = current_volume / avg_volume
         is_confirmed = volume_ratio >= threshold
 
-        self._logger.debug(
-            "volume_confirmation_complete",
-            current_volume=current_volume,
-            avg_volume=avg_volume,
-            volume_ratio=volume_ratio,
-            threshold=threshold,
-            is_confirmed=is_confirmed,
-        )
+        if self._logger.is_enabled_for(logging.DEBUG):
+            self._logger.debug(
+                "volume_confirmation_complete",
+                current_volume=current_volume,
+                avg_volume=avg_volume,
+                volume_ratio=volume_ratio,
+                threshold=threshold,
+                is_confirmed=is_confirmed,
+            )
 
         return is_confirmed
 
     def detect_bounce_with_volume(
         self,
-        ohlcv_list: list[OHLCV],
+        ohlcv: list[OHLCV] | OhlcvSeries,
         lookback: int | None = None,
         volume_threshold: float | None = None,
     ) -> bool:
@@ -240,26 +336,28 @@ class PatternDetector:
         Detect bounce pattern with volume confirmation.
 
         This combines both bounce pattern detection and volume confirmation
-        for a stronger signal. Both conditions must be true.
+        for a stronger signal. Both conditions must be true; volume is only
+        checked when a bounce is detected.
 
         Args:
-            ohlcv_list: List of OHLCV objects, sorted chronologically
+            ohlcv: OhlcvSeries or list of OHLCV objects, sorted chronologically
             lookback: Lookback period for bounce detection
             volume_threshold: Volume multiplier threshold
 
         Returns:
             True if both bounce pattern and volume confirmation are detected
         """
-        has_bounce = self.detect_bounce(ohlcv_list, lookback)
-        has_volume = self.confirm_volume(ohlcv_list, volume_threshold)
+        has_bounce = self.detect_bounce(ohlcv, lookback)
 
-        result = has_bounce and has_volume
+        # Volume confirmation only matters if the bounce is present
+        has_volume = has_bounce and self.confirm_volume(ohlcv, volume_threshold)
 
-        self._logger.debug(
-            "combined_bounce_volume_detection",
-            has_bounce=has_bounce,
-            has_volume=has_volume,
-            combined_signal=result,
-        )
+        if self._logger.is_enabled_for(logging.DEBUG):
+            self._logger.debug(
+                "combined_bounce_volume_detection",
+                has_bounce=has_bounce,
+                has_volume=has_volume,
+                combined_signal=has_volume,
+            )
 
-        return result
+        return has_volume
@@ -260,7 +260,9 @@ async def _run_screening(
     # Initialize data provider
     config = load_config()
     if provider == "yahoo":
-        data_provider: YahooFinanceProvider | AlphaVantageProvider = YahooFinanceProvider()
+        data_provider: YahooFinanceProvider | AlphaVantageProvider = YahooFinanceProvider(
+            executor_workers=config.data_provider.executor_workers
+        )
     else:
         if not config.data_provider.api_key:
             click.echo(
@@ -277,9 +279,10 @@ async def _run_screening(
         max_concurrent=config.screening.max_concurrent_requests,
     )
 
-    # Run screening
+    # Run screening, then release the provider's pooled HTTP connections
     click.echo("Running screening...")
-    matches, stats = await screener.screen_and_filter(symbol_list)
+    async with data_provider:
+        matches, stats = await screener.screen_and_filter(symbol_list)
 
     # Display results
     click.echo()
@@ -6,7 +6,7 @@ and YAML files with validation.
 """
 
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 import yaml
 from pydantic import Field, field_validator
@@ -19,6 +19,25 @@ class DataProviderConfig(BaseSettings):
     provider: str = Field(default="alpha_vantage", description="Data provider name")
     api_key: str = Field(description="API key for data provider")
     rate_limit: int = Field(default=5, description="Requests per minute")
+    max_connections: int = Field(
+        default=10,
+        ge=0,
+        description="Maximum open HTTP connections (0 = unlimited; avoid with free-tier keys)",
+    )
+    max_connections_per_host: int = Field(
+        default=5, ge=0, description="Maximum open HTTP connections per host (0 = unlimited)"
+    )
+    output_size: Literal["compact", "full"] = Field(
+        default="compact",
+        description="Alpha Vantage daily history size ('full' requires a premium key)",
+    )
+    executor_workers: int = Field(
+        default=8, ge=1, description="Threads for blocking Yahoo Finance calls"
+    )
+    http2: bool = Field(
+        default=False,
+        description="Use an HTTP/2 httpx client instead of aiohttp (requires the 'http2' extra)",
+    )
 
     model_config = SettingsConfigDict(env_prefix="DATA_PROVIDER__")
 
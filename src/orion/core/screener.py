@@ -6,11 +6,14 @@ and finding options for trading opportunities.
 """
 
 import asyncio
+import time
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 
 from orion.analysis.indicators import IndicatorCalculator
-from orion.data.models import Quote, TechnicalIndicators
+from orion.data.cache import CacheManager
+from orion.data.models import OHLCV, OhlcvSeries, Quote, TechnicalIndicators
 from orion.data.provider import DataProvider
 from orion.strategies.evaluator import RuleEvaluator
 from orion.strategies.models import OptionRecommendation, Strategy
@@ -19,8 +22,11 @@ from orion.utils.logging import get_logger
 
 logger = get_logger(__name__, component="StockScreener")
 
+# Bars needed for the longest indicator (SMA-60)
+MIN_HISTORICAL_BARS = 60
 
-@dataclass
+
+@dataclass(slots=True)
 class ScreeningResult:
     """Result of screening a single symbol.
 
@@ -51,7 +57,7 @@ class ScreeningResult:
     error: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ScreeningStats:
     """Statistics from a screening run.
 
@@ -108,6 +114,8 @@ class StockScreener:
         strategy: Strategy,
         max_concurrent: int = 5,
         historical_days: int = 252,
+        batch_size: int = 50,
+        cache: CacheManager | None = None,
     ) -> None:
         """Initialize the StockScreener.
 
@@ -116,17 +124,28 @@ class StockScreener:
             strategy: Trading strategy to evaluate against
             max_concurrent: Maximum number of concurrent screenings
             historical_days: Number of days of historical data to fetch (default 252 = 1 year)
+            batch_size: Number of symbols whose quotes and history are fetched
+                together in `screen_batch`
+            cache: Optional cache for historical prices, keyed by symbol and date
+                window so repeated screens on the same day reuse fetched bars
         """
         self.provider = provider
         self.strategy = strategy
         self.max_concurrent = max_concurrent
         self.historical_days = historical_days
+        self.batch_size = batch_size
+        self.cache = cache
 
-        self.indicator_calc = IndicatorCalculator()
+        self.indicator_calc = IndicatorCalculator(cache_results=True)
         self.option_analyzer = OptionAnalyzer()
         self._evaluator = RuleEvaluator(strategy)
         self._logger = logger
         self._semaphore = asyncio.Semaphore(max_concurrent)
+        # Reported as missed on every error or insufficient-data result
+        self._all_condition_types = tuple(c.type for c in strategy.entry_conditions)
+        # Filtered target expirations keyed by (today, expirations); many symbols
+        # share the same listed expirations
+        self._target_expirations_cache: dict[tuple[date, tuple[date, ...]], list[date]] = {}
 
     async def screen_symbol(self, symbol: str) -> ScreeningResult:
         """Screen a single symbol through the full pipeline.
@@ -139,185 +158,407 @@ class StockScreener:
         """
         async with self._semaphore:
             start_time = datetime.now()
+            started = time.monotonic()
+            today = date.today()
             self._logger.info("screening_start", symbol=symbol, strategy=self.strategy.name)
 
             try:
                 # Step 1: Fetch quote
                 quote = await self.provider.get_quote(symbol)
-                if quote is None:
-                    return ScreeningResult(
-                        symbol=symbol,
-                        timestamp=start_time,
-                        matches=False,
-                        signal_strength=0.0,
-                        conditions_met=[],
-                        conditions_missed=[c.type for c in self.strategy.entry_conditions],
-                        quote=None,
-                        indicators=None,
-                        option_recommendation=None,
-                        error="Failed to fetch quote",
-                    )
 
                 # Step 2: Fetch historical prices
-                end_date = date.today()
-                start_date = date.fromordinal(end_date.toordinal() - self.historical_days)
-                historical = await self.provider.get_historical_prices(
-                    symbol, start=start_date, end=end_date, interval="1d"
-                )
+                historical = None
+                if quote is not None:
+                    start_date, end_date = self._history_range(today)
+                    historical = await self._get_historical(symbol, start_date, end_date)
+            except Exception as e:
+                return self._error_result(symbol, start_time, e)
 
-                if not historical or len(historical) < 60:
-                    self._logger.warning(
-                        "insufficient_historical_data",
-                        symbol=symbol,
-                        data_points=len(historical) if historical else 0,
-                    )
-                    return ScreeningResult(
-                        symbol=symbol,
-                        timestamp=start_time,
-                        matches=False,
-                        signal_strength=0.0,
-                        conditions_met=[],
-                        conditions_missed=[c.type for c in self.strategy.entry_conditions],
-                        quote=quote,
-                        indicators=None,
-                        option_recommendation=None,
-                        error=f"Insufficient historical data: {len(historical) if historical else 0} points",
-                    )
+            return await self._screen_fetched(
+                symbol, start_time, started, today, quote, historical, limit_options=False
+            )
 
-                # Step 3: Calculate technical indicators
-                indicators = self.indicator_calc.calculate(historical, symbol)
-
-                # Step 4: Evaluate strategy conditions
-                evaluation = await self._evaluator.evaluate(symbol, quote, historical, indicators)
-
-                # Step 5: If match, fetch options and find best opportunity
-                option_recommendation: OptionRecommendation | None = None
-                if evaluation.matches:
-                    self._logger.info("strategy_match_found", symbol=symbol)
-                    try:
-                        # Get available expirations
-                        expirations = await self.provider.get_available_expirations(symbol)
-
-                        if expirations:
-                            # Filter by target DTE range
-                            target_expirations = [
-                                exp
-                                for exp in expirations
-                                if self.strategy.option_screening.min_dte
-                                <= (exp - date.today()).days
-                                <= self.strategy.option_screening.max_dte
-                            ]
-
-                            if target_expirations:
-                                # Get option chains for target expirations
-                                option_chains = []
-                                for exp in target_expirations[:3]:  # Limit to 3 expirations
-                                    try:
-                                        chain = await self.provider.get_option_chain(symbol, exp)
-                                        if chain:
-                                            option_chains.append(chain)
-                                    except Exception as e:
-                                        self._logger.warning(
-                                            "option_chain_fetch_failed",
-                                            symbol=symbol,
-                                            expiration=exp,
-                                            error=str(e),
-                                        )
-                                        continue
-
-                                if option_chains:
-                                    option_recommendation = (
-                                        self.option_analyzer.analyze_all_expirations(
-                                            option_chains,
-                                            self.strategy.option_screening,
-                                            date.today(),
-                                        )
-                                    )
-                                    if option_recommendation:
-                                        self._logger.info(
-                                            "option_recommendation_found",
-                                            symbol=symbol,
-                                            option=option_recommendation.symbol,
-                                            yield_val=option_recommendation.premium_yield,
-                                        )
-
-                    except Exception as e:
-                        self._logger.error(
-                            "option_analysis_failed",
-                            symbol=symbol,
-                            error=str(e),
-                        )
+    async def screen_symbol_prefetched(
+        self,
+        symbol: str,
+        quote: Quote | Exception | None,
+        historical: OhlcvSeries | list[OHLCV] | Exception | None,
+        today: date | None = None,
+        indicators: TechnicalIndicators | None = None,
+    ) -> ScreeningResult:
+        """Screen a symbol whose quote and history were already fetched.
 
-                duration = (datetime.now() - start_time).total_seconds()
+        Skips the per-symbol quote and history requests (steps 1-2); only the
+        option-chain fetch for matches goes through the concurrency limit.
 
-                self._logger.info(
-                    "screening_complete",
-                    symbol=symbol,
-                    matches=evaluation.matches,
-                    signal_strength=evaluation.signal_strength,
-                    conditions_met=len(evaluation.conditions_met),
-                    duration_seconds=duration,
-                )
+        Args:
+            symbol: Stock symbol to screen
+            quote: Prefetched quote, or the exception raised fetching it
+            historical: Prefetched OHLCV history, or the exception raised fetching it
+            today: Reference date for days-to-expiration (defaults to date.today())
+            indicators: Precomputed indicators for the history (e.g. a row of an
+                IndicatorPanel); calculated here when omitted
 
-                return ScreeningResult(
-                    symbol=symbol,
-                    timestamp=start_time,
-                    matches=evaluation.matches,
-                    signal_strength=evaluation.signal_strength,
-                    conditions_met=evaluation.conditions_met,
-                    conditions_missed=evaluation.conditions_missed,
-                    quote=quote,
-                    indicators=indicators,
-                    option_recommendation=option_recommendation,
-                    evaluation_details=evaluation.details or {},
-                )
+        Returns:
+            ScreeningResult with match status and recommendation
+        """
+        start_time = datetime.now()
+        started = time.monotonic()
+        self._logger.info("screening_start", symbol=symbol, strategy=self.strategy.name)
+
+        if isinstance(quote, Exception):
+            return self._error_result(symbol, start_time, quote)
+        if isinstance(historical, Exception):
+            return self._error_result(symbol, start_time, historical)
+
+        return await self._screen_fetched(
+            symbol,
+            start_time,
+            started,
+            today or date.today(),
+            quote,
+            historical,
+            limit_options=True,
+            indicators=indicators,
+        )
 
-            except Exception as e:
-                self._logger.error(
-                    "screening_error",
+    def _history_range(self, today: date) -> tuple[date, date]:
+        """Return the (start, end) dates of the historical window ending today."""
+        end_date = today
+        start_date = end_date - timedelta(days=self.historical_days)
+        return start_date, end_date
+
+    async def _get_historical(self, symbol: str, start_date: date, end_date: date) -> OhlcvSeries:
+        """Fetch daily history for one symbol, going through the cache if configured."""
+        if self.cache is None:
+            return await self.provider.get_historical_prices(
+                symbol, start=start_date, end=end_date, interval="1d"
+            )
+        series: OhlcvSeries = await self.cache.get_or_fetch(
+            "historical",
+            f"{symbol}:{start_date}:{end_date}",
+            lambda: self.provider.get_historical_prices(
+                symbol, start=start_date, end=end_date, interval="1d"
+            ),
+        )
+        return series
+
+    async def _get_batch_historical(
+        self, symbols: list[str], start_date: date, end_date: date
+    ) -> dict[str, OhlcvSeries | Exception]:
+        """Fetch daily history for a chunk, requesting only symbols missing from the cache."""
+        if self.cache is None:
+            return await self.provider.get_batch_historical(
+                symbols, start=start_date, end=end_date, interval="1d"
+            )
+
+        histories: dict[str, OhlcvSeries | Exception] = {}
+        missing: list[str] = []
+        for symbol in symbols:
+            cached = self.cache.get("historical", f"{symbol}:{start_date}:{end_date}")
+            if cached is None:
+                missing.append(symbol)
+            else:
+                histories[symbol] = cached
+
+        if missing:
+            fetched = await self.provider.get_batch_historical(
+                missing, start=start_date, end=end_date, interval="1d"
+            )
+            for symbol, bars in fetched.items():
+                if not isinstance(bars, Exception):
+                    self.cache.set("historical", f"{symbol}:{start_date}:{end_date}", bars)
+            histories.update(fetched)
+        return histories
+
+    def _error_result(self, symbol: str, start_time: datetime, error: Exception) -> ScreeningResult:
+        """Build the result for a symbol whose screening raised an error."""
+        self._logger.error(
+            "screening_error",
+            symbol=symbol,
+            error=str(error),
+            error_type=type(error).__name__,
+        )
+        return self._failure(symbol, start_time, None, f"Screening error: {str(error)}")
+
+    def _failure(
+        self, symbol: str, start_time: datetime, quote: Quote | None, error: str
+    ) -> ScreeningResult:
+        """Build a non-matching result that reports every condition as missed."""
+        return ScreeningResult(
+            symbol=symbol,
+            timestamp=start_time,
+            matches=False,
+            signal_strength=0.0,
+            conditions_met=[],
+            conditions_missed=list(self._all_condition_types),
+            quote=quote,
+            indicators=None,
+            option_recommendation=None,
+            error=error,
+        )
+
+    async def _screen_fetched(
+        self,
+        symbol: str,
+        start_time: datetime,
+        started: float,
+        today: date,
+        quote: Quote | None,
+        historical: OhlcvSeries | list[OHLCV] | None,
+        limit_options: bool,
+        indicators: TechnicalIndicators | None = None,
+    ) -> ScreeningResult:
+        """Run the analysis steps on an already fetched quote and history.
+
+        Args:
+            symbol: Stock symbol being screened
+            start_time: When screening of the symbol started
+            started: time.monotonic() reading taken at start, for the duration
+            today: Reference date for days-to-expiration
+            quote: Current quote, or None if it could not be fetched
+            historical: OHLCV history, or None if it was not fetched
+            limit_options: Hold the concurrency semaphore while fetching option
+                chains (False when the caller already holds it)
+            indicators: Precomputed indicators, or None to calculate them
+
+        Returns:
+            ScreeningResult with match status and recommendation
+        """
+        try:
+            if quote is None:
+                return self._failure(symbol, start_time, None, "Failed to fetch quote")
+
+            if historical is None or len(historical) < MIN_HISTORICAL_BARS:
+                data_points = len(historical) if historical is not None else 0
+                self._logger.warning(
+                    "insufficient_historical_data",
                     symbol=symbol,
-                    error=str(e),
-                    error_type=type(e).__name__,
+                    data_points=data_points,
                 )
-                return ScreeningResult(
-                    symbol=symbol,
-                    timestamp=start_time,
-                    matches=False,
-                    signal_strength=0.0,
-                    conditions_met=[],
-                    conditions_missed=[c.type for c in self.strategy.entry_conditions],
-                    quote=None,
-                    indicators=None,
-                    option_recommendation=None,
-                    error=f"Screening error: {str(e)}",
+                return self._failure(
+                    symbol,
+                    start_time,
+                    quote,
+                    f"Insufficient historical data: {data_points} points",
                 )
 
-    async def screen_batch(self, symbols: list[str]) -> asyncio.Queue[ScreeningResult]:
-        """Screen multiple symbols concurrently.
-
-        Processes symbols in batches with controlled concurrency to respect
-        API rate limits and resource constraints.
+            # Step 3: Calculate technical indicators on columnar bars, converted
+            # once and shared with the strategy evaluation
+            series = (
+                historical
+                if isinstance(historical, OhlcvSeries)
+                else OhlcvSeries.from_bars(historical)
+            )
+            if indicators is None:
+                indicators = self.indicator_calc.calculate(series, symbol)
+
+            # Step 4: Evaluate strategy conditions
+            evaluation = await self._evaluator.evaluate(symbol, quote, series, indicators)
+
+            # Step 5: If match, fetch options and find best opportunity
+            option_recommendation: OptionRecommendation | None = None
+            if evaluation.matches:
+                self._logger.info("strategy_match_found", symbol=symbol)
+                if limit_options:
+                    async with self._semaphore:
+                        option_recommendation = await self._find_option_recommendation(
+                            symbol, today
+                        )
+                else:
+                    option_recommendation = await self._find_option_recommendation(symbol, today)
+
+            duration = time.monotonic() - started
+
+            self._logger.info(
+                "screening_complete",
+                symbol=symbol,
+                matches=evaluation.matches,
+                signal_strength=evaluation.signal_strength,
+                conditions_met=len(evaluation.conditions_met),
+                duration_seconds=duration,
+            )
+
+            return ScreeningResult(
+                symbol=symbol,
+                timestamp=start_time,
+                matches=evaluation.matches,
+                signal_strength=evaluation.signal_strength,
+                conditions_met=evaluation.conditions_met,
+                conditions_missed=evaluation.conditions_missed,
+                quote=quote,
+                indicators=indicators,
+                option_recommendation=option_recommendation,
+                evaluation_details=evaluation.details or {},
+            )
+
+        except Exception as e:
+            return self._error_result(symbol, start_time, e)
+
+    def _target_expirations(self, expirations: list[date], today: date) -> list[date]:
+        """Filter expirations to the strategy's days-to-expiration range.
+
+        Results are memoized per (today, expirations), since the DTE bounds are
+        fixed for the screener and symbols often share the same expirations.
 
         Args:
-            symbols: List of stock symbols to screen
+            expirations: Available expiration dates
+            today: Reference date for days-to-expiration
 
-        Yields:
-            ScreeningResult for each symbol as it completes
+        Returns:
+            Expirations whose DTE lies within [min_dte, max_dte], in input order
         """
-        results: asyncio.Queue[ScreeningResult] = asyncio.Queue()
+        key = (today, tuple(expirations))
+        cached = self._target_expirations_cache.get(key)
+        if cached is None:
+            min_dte = self.strategy.option_screening.min_dte
+            max_dte = self.strategy.option_screening.max_dte
+            cached = [exp for exp in expirations if min_dte <= (exp - today).days <= max_dte]
+            self._target_expirations_cache[key] = cached
+        return cached
+
+    async def _find_option_recommendation(
+        self, symbol: str, today: date
+    ) -> OptionRecommendation | None:
+        """Fetch option chains for a matched symbol and pick the best contract.
 
-        async def screen_and_queue(symbol: str) -> None:
-            """Screen a symbol and put result in queue."""
-            result = await self.screen_symbol(symbol)
-            await results.put(result)
+        Args:
+            symbol: Stock symbol that matched the strategy
+            today: Reference date for days-to-expiration
+
+        Returns:
+            The recommended option, or None if no suitable contract was found
+            or the option data could not be fetched
+        """
+        option_recommendation: OptionRecommendation | None = None
+        try:
+            # Get available expirations
+            expirations = await self.provider.get_available_expirations(symbol)
+
+            if expirations:
+                # Filter by target DTE range
+                target_expirations = self._target_expirations(expirations, today)
+
+                if target_expirations:
+                    # Get option chains for target expirations concurrently
+                    expirations_to_fetch = target_expirations[:3]  # Limit to 3 expirations
+                    chains = await asyncio.gather(
+                        *(
+                            self.provider.get_option_chain(symbol, exp)
+                            for exp in expirations_to_fetch
+                        ),
+                        return_exceptions=True,
+                    )
 
-        # Create tasks for all symbols
-        tasks = [screen_and_queue(symbol) for symbol in symbols]
+                    option_chains = []
+                    for exp, chain in zip(expirations_to_fetch, chains, strict=True):
+                        if isinstance(chain, BaseException):
+                            self._logger.warning(
+                                "option_chain_fetch_failed",
+                                symbol=symbol,
+                                expiration=exp,
+                                error=str(chain),
+                            )
+                        elif chain:
+                            option_chains.append(chain)
+
+                    if option_chains:
+                        option_recommendation = self.option_analyzer.analyze_all_expirations(
+                            option_chains,
+                            self.strategy.option_screening,
+                            today,
+                        )
+                        if option_recommendation:
+                            self._logger.info(
+                                "option_recommendation_found",
+                                symbol=symbol,
+                                option=option_recommendation.symbol,
+                                yield_val=option_recommendation.premium_yield,
+                            )
+
+        except Exception as e:
+            self._logger.error(
+                "option_analysis_failed",
+                symbol=symbol,
+                error=str(e),
+            )
+
+        return option_recommendation
+
+    async def screen_batch(self, symbols: list[str]) -> AsyncIterator[ScreeningResult]:
+        """Screen multiple symbols concurrently, yielding results as they complete.
+
+        Symbols are processed in chunks of `batch_size`: quotes and historical
+        prices for a whole chunk are fetched with the provider's batch methods,
+        then the chunk's indicators are computed together as an IndicatorPanel
+        and its symbols are analyzed concurrently. Symbols whose quote fetch
+        failed are yielded immediately and skip the history fetch. Only
+        option-chain fetches for matches are limited by `max_concurrent`.
+
+        Results are yielded in completion order, not input order, so consumers
+        can act on fast symbols while slow ones are still being screened.
 
-        # Wait for all tasks to complete
-        await asyncio.gather(*tasks, return_exceptions=True)
+        Args:
+            symbols: List of stock symbols to screen
 
-        return results
+        Yields:
+            A ScreeningResult for each symbol
+        """
+        today = date.today()
+        start_date, end_date = self._history_range(today)
+
+        for i in range(0, len(symbols), self.batch_size):
+            chunk = symbols[i : i + self.batch_size]
+
+            quotes = await self.provider.get_quotes(chunk)
+
+            # Symbols without a quote can't be screened: report them right away
+            # and leave them out of the history fetch and analysis
+            viable: list[str] = []
+            for symbol in chunk:
+                quote = quotes.get(symbol)
+                if isinstance(quote, Quote):
+                    viable.append(symbol)
+                else:
+                    yield await self.screen_symbol_prefetched(symbol, quote, None, today)
+            if not viable:
+                continue
+
+            histories = await self._get_batch_historical(viable, start_date, end_date)
+
+            # Compute indicators of all usable histories in one vectorized pass
+            series: dict[str, OhlcvSeries] = {}
+            for symbol in viable:
+                bars = histories.get(symbol)
+                if isinstance(bars, list):
+                    # Bar lists from providers predating the columnar contract
+                    bars = OhlcvSeries.from_bars(bars)
+                if isinstance(bars, OhlcvSeries) and len(bars) >= MIN_HISTORICAL_BARS:
+                    series[symbol] = bars
+            rows: dict[str, TechnicalIndicators] = {}
+            if series:
+                panel = self.indicator_calc.calculate_panel(list(series.values()), list(series))
+                rows = {symbol: panel.row(i) for i, symbol in enumerate(panel.symbols)}
+
+            tasks = [
+                asyncio.ensure_future(
+                    self.screen_symbol_prefetched(
+                        symbol,
+                        quotes[symbol],
+                        series.get(symbol, histories.get(symbol)),
+                        today,
+                        indicators=rows.get(symbol),
+                    )
+                )
+                for symbol in viable
+            ]
+            try:
+                for next_result in asyncio.as_completed(tasks):
+                    yield await next_result
+            finally:
+                # Consumer stopped early: don't leave screening tasks running
+                for task in tasks:
+                    task.cancel()
 
     async def screen_batch_iter(self, symbols: list[str]) -> list[ScreeningResult]:
         """Screen multiple symbols and return results as a list.
@@ -326,17 +567,9 @@ class StockScreener:
             symbols: List of stock symbols to screen
 
         Returns:
-            List of ScreeningResult objects
+            List of ScreeningResult objects, in completion order
         """
-        results_queue = await self.screen_batch(symbols)
-        results = []
-        while not results_queue.empty():
-            try:
-                result = results_queue.get_nowait()
-                results.append(result)
-            except asyncio.QueueEmpty:
-                break
-        return results
+        return [result async for result in self.screen_batch(symbols)]
 
     async def screen_and_filter(
         self, symbols: list[str]
@@ -350,20 +583,26 @@ class StockScreener:
             Tuple of (matching results, screening statistics)
         """
         start_time = datetime.now()
-
-        all_results = await self.screen_batch_iter(symbols)
-
-        matches = [r for r in all_results if r.matches]
-        failed = [r for r in all_results if r.error is not None]
-        successful = [r for r in all_results if r.error is None]
+        started = time.monotonic()
+
+        matches: list[ScreeningResult] = []
+        successful = 0
+        failed = 0
+        async for result in self.screen_batch(symbols):
+            if result.error is not None:
+                failed += 1
+            else:
+                successful += 1
+            if result.matches:
+                matches.append(result)
 
         end_time = datetime.now()
-        duration = (end_time - start_time).total_seconds()
+        duration = time.monotonic() - started
 
         stats = ScreeningStats(
             total_symbols=len(symbols),
-            successful=len(successful),
-            failed=len(failed),
+            successful=successful,
+            failed=failed,
             matches=len(matches),
             start_time=start_time,
             end_time=end_time,
@@ -1,23 +1,33 @@
 """Data layer for market data and financial information."""
 
+from typing import TYPE_CHECKING, Any
+
 from .cache import CacheManager
+from .cached_provider import CachedDataProvider
 from .models import (
     OHLCV,
     CompanyOverview,
+    IndicatorPanel,
+    OhlcvSeries,
     OptionChain,
     OptionContract,
     Quote,
     TechnicalIndicators,
 )
 from .provider import DataProvider, MockDataProvider
-from .providers import AlphaVantageProvider, YahooFinanceProvider
+
+if TYPE_CHECKING:
+    from .providers import AlphaVantageProvider, YahooFinanceProvider
 
 __all__ = [
     "CacheManager",
+    "CachedDataProvider",
     "CompanyOverview",
     "DataProvider",
+    "IndicatorPanel",
     "MockDataProvider",
     "OHLCV",
+    "OhlcvSeries",
     "OptionChain",
     "OptionContract",
     "Quote",
@@ -25,3 +35,12 @@ __all__ = [
     "AlphaVantageProvider",
     "YahooFinanceProvider",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import provider classes lazily; see orion.data.providers."""
+    if name in ("AlphaVantageProvider", "YahooFinanceProvider"):
+        from . import providers
+
+        return getattr(providers, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,5 +1,7 @@
 """Cache manager for market data."""
 
+import asyncio
+import time
 from collections.abc import Callable
 from typing import Any, TypeVar
 
@@ -13,11 +15,62 @@ logger = get_logger(__name__)
 T = TypeVar("T")
 
 
+class _FastTTL:
+    """Minimal TTL cache: a dict of (expiry, value) pairs.
+
+    Entries expire lazily when read. When full, the oldest inserted entry is
+    evicted (FIFO rather than LRU), which avoids the per-access linked-list
+    bookkeeping of cachetools.TTLCache on hot, short-lived caches.
+    """
+
+    __slots__ = ("maxsize", "ttl", "_data")
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: dict[str, tuple[float, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        if entry[0] <= time.monotonic():
+            del self._data[key]
+            return default
+        return entry[1]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        data = self._data
+        # Re-insert so an overwritten key moves to the back of the FIFO order
+        data.pop(key, None)
+        if len(data) >= self.maxsize:
+            data.pop(next(iter(data)))
+        data[key] = (time.monotonic() + self.ttl, value)
+
+    def pop(self, key: str, default: Any = None) -> Any:
+        entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+_Cache = TTLCache[str, Any] | _FastTTL
+
+
 class CacheManager:
     """Simple in-memory cache manager with TTL support.
 
-    Uses cachetools.TTLCache for automatic expiration.
-    Cache keys should be descriptive strings like 'quote:AAPL' or 'historical:MSFT:2024-01-01:2024-12-31'.
+    Uses cachetools.TTLCache for automatic expiration, except for the
+    high-traffic quote and historical caches which use the lighter `_FastTTL`.
+    Lookups and stores are plain synchronous calls since they do no I/O.
+
+    Since every cache type has its own cache, keys are stored as given, without
+    a type prefix. Keys should be descriptive strings within their type, like
+    'AAPL' for a quote or 'MSFT:2024-01-01:2024-12-31' for historical data.
     """
 
     def __init__(self, config: CacheConfig) -> None:
@@ -27,7 +80,9 @@ class CacheManager:
             config: Cache configuration
         """
         self.config = config
-        self._caches: dict[str, TTLCache[str, Any]] = {}
+        self._caches: dict[str, _Cache] = {}
+        # Fetches currently running in get_or_fetch, keyed by (cache type, key)
+        self._inflight: dict[tuple[str, str], asyncio.Future[Any]] = {}
         self._stats = {
             "hits": 0,
             "misses": 0,
@@ -46,35 +101,45 @@ class CacheManager:
     def _init_caches(self) -> None:
         """Initialize TTL caches for different data types."""
         # Quote cache
-        self._caches["quote"] = TTLCache(maxsize=self.config.max_size, ttl=self.config.quote_ttl)
+        self._caches["quote"] = self._make_cache(
+            self.config.max_size, self.config.quote_ttl, fast=True
+        )
 
         # Historical data cache
-        self._caches["historical"] = TTLCache(
-            maxsize=self.config.max_size // 2, ttl=self.config.historical_ttl
+        self._caches["historical"] = self._make_cache(
+            self.config.max_size // 2, self.config.historical_ttl, fast=True
         )
 
         # Option chain cache
-        self._caches["options"] = TTLCache(
-            maxsize=self.config.max_size // 4, ttl=self.config.option_chain_ttl
+        self._caches["options"] = self._make_cache(
+            self.config.max_size // 4, self.config.option_chain_ttl
+        )
+
+        # Available option expirations, refreshed with the option chains
+        self._caches["expirations"] = self._make_cache(
+            self.config.max_size // 10, self.config.option_chain_ttl
         )
 
         # Company overview cache (fundamentals change slowly)
-        self._caches["overview"] = TTLCache(
-            maxsize=self.config.max_size // 10, ttl=self.config.historical_ttl
+        self._caches["overview"] = self._make_cache(
+            self.config.max_size // 10, self.config.historical_ttl
         )
 
-    def _get_cache(self, cache_type: str) -> TTLCache[str, Any]:
+    @staticmethod
+    def _make_cache(maxsize: int, ttl: float, fast: bool = False) -> _Cache:
+        """Create the cache for one data type."""
+        if fast:
+            return _FastTTL(maxsize=maxsize, ttl=ttl)
+        return TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def _get_cache(self, cache_type: str) -> _Cache:
         """Get cache for a specific data type."""
         if cache_type not in self._caches:
             # Default cache with 1 hour TTL
-            self._caches[cache_type] = TTLCache(maxsize=self.config.max_size, ttl=3600)
+            self._caches[cache_type] = self._make_cache(self.config.max_size, 3600)
         return self._caches[cache_type]
 
-    def _make_key(self, cache_type: str, *parts: str) -> str:
-        """Create cache key from parts."""
-        return f"{cache_type}:" + ":".join(str(p) for p in parts)
-
-    async def get(self, cache_type: str, key: str) -> Any | None:
+    def get(self, cache_type: str, key: str) -> Any | None:
         """Get value from cache.
 
         Args:
@@ -88,10 +153,9 @@ class CacheManager:
             return None
 
         cache = self._get_cache(cache_type)
-        full_key = self._make_key(cache_type, key)
 
         try:
-            value = cache.get(full_key)
+            value = cache.get(key)
             if value is not None:
                 self._stats["hits"] += 1
                 logger.debug(
@@ -120,7 +184,7 @@ class CacheManager:
             )
             return None
 
-    async def set(self, cache_type: str, key: str, value: Any) -> None:
+    def set(self, cache_type: str, key: str, value: Any) -> None:
         """Set value in cache.
 
         Args:
@@ -132,10 +196,9 @@ class CacheManager:
             return
 
         cache = self._get_cache(cache_type)
-        full_key = self._make_key(cache_type, key)
 
         try:
-            cache[full_key] = value
+            cache[key] = value
             logger.debug(
                 "cache_set",
                 cache_type=cache_type,
@@ -158,6 +221,11 @@ class CacheManager:
     ) -> Any:
         """Get from cache or fetch if not present.
 
+        Concurrent misses for the same key are coalesced: the first caller runs
+        fetch_fn and the others await its result (or exception) instead of
+        fetching again. If the first caller is cancelled, the others retry
+        the fetch themselves.
+
         Args:
             cache_type: Type of cache
             key: Cache key
@@ -167,21 +235,53 @@ class CacheManager:
             Cached or freshly fetched value
         """
         # Try cache first
-        cached = await self.get(cache_type, key)
+        cached = self.get(cache_type, key)
         if cached is not None:
             return cached
 
-        # Cache miss - fetch data
+        # Cache miss - join a fetch already in flight for this key
+        inflight_key = (cache_type, key)
+        inflight = self._inflight.get(inflight_key)
+        if inflight is not None:
+            logger.debug(
+                "cache_fetch_coalesced",
+                cache_type=cache_type,
+                key=key,
+            )
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                task = asyncio.current_task()
+                if not inflight.cancelled() or (task is not None and task.cancelling()):
+                    raise
+                # The leading caller was cancelled, not this one: fetch again
+                return await self.get_or_fetch(cache_type, key, fetch_fn)
+
+        # Otherwise fetch data
         logger.debug(
             "cache_fetch",
             cache_type=cache_type,
             key=key,
         )
 
-        value = await fetch_fn()
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._inflight[inflight_key] = future
+        try:
+            value = await fetch_fn()
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so a failure nobody else awaited isn't logged
+            future.exception()
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            del self._inflight[inflight_key]
 
         # Store in cache
-        await self.set(cache_type, key, value)
+        self.set(cache_type, key, value)
+        future.set_result(value)
 
         return value
 
@@ -206,8 +306,7 @@ class CacheManager:
             )
         else:
             # Clear specific key
-            full_key = self._make_key(cache_type, key)
-            cache.pop(full_key, None)
+            cache.pop(key, None)
             logger.debug(
                 "cache_invalidated",
                 cache_type=cache_type,
@@ -0,0 +1,163 @@
+"""Data provider wrapper that serves repeated requests from a cache."""
+
+from datetime import date
+
+from ..utils.logging import get_logger
+from .cache import CacheManager
+from .models import CompanyOverview, OhlcvSeries, OptionChain, Quote
+from .provider import DataProvider
+
+logger = get_logger(__name__)
+
+
+class CachedDataProvider(DataProvider):
+    """Wrap a data provider so repeated requests are answered from a CacheManager.
+
+    Each method goes through the cache type matching its data, so TTLs follow
+    the CacheConfig settings: quotes expire after ``quote_ttl``, option chains
+    and expirations after ``option_chain_ttl``, and historical prices and
+    company overviews after ``historical_ttl``. Concurrent misses for the same
+    key are coalesced into one upstream request by
+    `CacheManager.get_or_fetch`. Batch methods only forward the symbols
+    missing from the cache to the wrapped provider.
+
+    The Lambda handler wraps its shared provider in one when caching is
+    enabled. Do not also pass the same CacheManager to a StockScreener: its
+    history lookups use the same keys, and a nested fetch of an in-flight key
+    would wait on itself.
+
+    Example:
+        >>> provider = CachedDataProvider(YahooFinanceProvider(), CacheManager(CacheConfig()))
+        >>> quote = await provider.get_quote("AAPL")  # fetched
+        >>> quote = await provider.get_quote("AAPL")  # served from cache
+    """
+
+    def __init__(self, provider: DataProvider, cache: CacheManager) -> None:
+        """Initialize the cached provider.
+
+        Args:
+            provider: Provider to fetch from on cache misses
+            cache: Cache to serve repeated requests from
+        """
+        self.provider = provider
+        self.cache = cache
+        self.max_concurrent_requests = provider.max_concurrent_requests
+
+    async def aclose(self) -> None:
+        """Release the wrapped provider's resources."""
+        await self.provider.aclose()
+
+    async def get_quote(self, symbol: str) -> Quote:
+        """Get current quote for a symbol, from the cache when fresh."""
+        quote: Quote = await self.cache.get_or_fetch(
+            "quote", symbol, lambda: self.provider.get_quote(symbol)
+        )
+        return quote
+
+    async def get_historical_prices(
+        self, symbol: str, start: date, end: date, interval: str = "1d"
+    ) -> OhlcvSeries:
+        """Get historical OHLCV data for a symbol, from the cache when fresh."""
+        series: OhlcvSeries = await self.cache.get_or_fetch(
+            "historical",
+            self._historical_key(symbol, start, end, interval),
+            lambda: self.provider.get_historical_prices(symbol, start, end, interval),
+        )
+        return series
+
+    async def get_option_chain(self, symbol: str, expiration: date | None = None) -> OptionChain:
+        """Get option chain for a symbol, from the cache when fresh."""
+        chain: OptionChain = await self.cache.get_or_fetch(
+            "options",
+            f"{symbol}:{expiration}",
+            lambda: self.provider.get_option_chain(symbol, expiration),
+        )
+        return chain
+
+    async def get_available_expirations(self, symbol: str) -> list[date]:
+        """Get available option expiration dates, from the cache when fresh."""
+        expirations: list[date] = await self.cache.get_or_fetch(
+            "expirations", symbol, lambda: self.provider.get_available_expirations(symbol)
+        )
+        return expirations
+
+    async def get_company_overview(self, symbol: str) -> CompanyOverview:
+        """Get company fundamental information, from the cache when fresh."""
+        overview: CompanyOverview = await self.cache.get_or_fetch(
+            "overview", symbol, lambda: self.provider.get_company_overview(symbol)
+        )
+        return overview
+
+    async def get_quotes(self, symbols: list[str]) -> dict[str, Quote | Exception]:
+        """Get quotes for several symbols, fetching only those not cached.
+
+        Args:
+            symbols: Stock ticker symbols
+
+        Returns:
+            Dict mapping each symbol to its Quote or to the exception raised
+            while fetching it
+        """
+        results: dict[str, Quote | Exception] = {}
+        missing: list[str] = []
+        for symbol in symbols:
+            cached = self.cache.get("quote", symbol)
+            if cached is None:
+                missing.append(symbol)
+            else:
+                results[symbol] = cached
+
+        if missing:
+            fetched = await self.provider.get_quotes(missing)
+            for symbol, quote in fetched.items():
+                if not isinstance(quote, Exception):
+                    self.cache.set("quote", symbol, quote)
+            results.update(fetched)
+
+        logger.debug("cached_quotes", requested=len(symbols), fetched=len(missing))
+        return results
+
+    async def get_batch_historical(
+        self, symbols: list[str], start: date, end: date, interval: str = "1d"
+    ) -> dict[str, OhlcvSeries | Exception]:
+        """Get historical OHLCV data for several symbols, fetching only those not cached.
+
+        Args:
+            symbols: Stock ticker symbols
+            start: Start date for historical data
+            end: End date for historical data
+            interval: Data interval ('1d', '1wk', '1mo')
+
+        Returns:
+            Dict mapping each symbol to its OhlcvSeries or to the exception
+            raised while fetching it
+        """
+        results: dict[str, OhlcvSeries | Exception] = {}
+        missing: list[str] = []
+        for symbol in symbols:
+            cached = self.cache.get(
+                "historical", self._historical_key(symbol, start, end, interval)
+            )
+            if cached is None:
+                missing.append(symbol)
+            else:
+                results[symbol] = cached
+
+        if missing:
+            fetched = await self.provider.get_batch_historical(missing, start, end, interval)
+            for symbol, series in fetched.items():
+                if not isinstance(series, Exception):
+                    self.cache.set(
+                        "historical", self._historical_key(symbol, start, end, interval), series
+                    )
+            results.update(fetched)
+
+        logger.debug("cached_batch_historical", requested=len(symbols), fetched=len(missing))
+        return results
+
+    @staticmethod
+    def _historical_key(symbol: str, start: date, end: date, interval: str) -> str:
+        """Build the historical cache key; daily bars use StockScreener's format."""
+        if interval == "1d":
+            return f"{symbol}:{start}:{end}"
+        return f"{symbol}:{start}:{end}:{interval}"
@@ -1,25 +1,29 @@
 """Data models for market data and financial information."""
 
+import math
 from dataclasses import dataclass, field
-from datetime import date, datetime
-from decimal import Decimal
+from datetime import UTC, date, datetime
+from itertools import chain
+from operator import attrgetter
 from typing import Literal
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class Quote:
     """Real-time quote for a stock symbol."""
 
     symbol: str
-    price: Decimal
+    price: float
     volume: int
     timestamp: datetime
-    open: Decimal
-    high: Decimal
-    low: Decimal
-    close: Decimal
-    previous_close: Decimal | None = None
-    change: Decimal | None = None
+    open: float
+    high: float
+    low: float
+    close: float
+    previous_close: float | None = None
+    change: float | None = None
     change_percent: float | None = None
 
     def __post_init__(self) -> None:
@@ -32,18 +36,18 @@ class Quote:
             )
 
 
-@dataclass
+@dataclass(slots=True)
 class OptionContract:
     """Individual option contract details."""
 
     symbol: str
     underlying_symbol: str
-    strike: Decimal
+    strike: float
     expiration: date
     option_type: Literal["call", "put"]
-    bid: Decimal
-    ask: Decimal
-    last_price: Decimal
+    bid: float
+    ask: float
+    last_price: float
     volume: int
     open_interest: int
     implied_volatility: float | None = None
@@ -53,12 +57,12 @@ class OptionContract:
     vega: float | None = None
 
     @property
-    def mid_price(self) -> Decimal:
+    def mid_price(self) -> float:
         """Calculate mid price between bid and ask."""
         return (self.bid + self.ask) / 2
 
     @property
-    def spread(self) -> Decimal:
+    def spread(self) -> float:
         """Calculate bid-ask spread."""
         return self.ask - self.bid
 
@@ -68,25 +72,31 @@ class OptionContract:
         return self.volume >= 10 and self.open_interest >= 100
 
 
-@dataclass
+@dataclass(slots=True)
 class OptionChain:
     """Complete option chain for a symbol at a given expiration."""
 
     symbol: str
     expiration: date
-    underlying_price: Decimal
+    underlying_price: float
     calls: list[OptionContract] = field(default_factory=list)
     puts: list[OptionContract] = field(default_factory=list)
     timestamp: datetime = field(default_factory=datetime.now)
 
-    def get_atm_strike(self) -> Decimal:
+    def get_atm_strike(self) -> float:
         """Get the at-the-money strike price closest to underlying price."""
-        all_strikes = sorted({c.strike for c in self.calls + self.puts})
-        if not all_strikes:
+        count = len(self.calls) + len(self.puts)
+        if not count:
             return self.underlying_price
 
+        strikes = np.fromiter(
+            map(attrgetter("strike"), chain(self.calls, self.puts)), dtype=np.float64, count=count
+        )
+        # Sorted unique strikes, so ties resolve to the lower strike
+        all_strikes = np.unique(strikes)
+
         # Find closest strike to underlying price
-        return min(all_strikes, key=lambda x: abs(x - self.underlying_price))
+        return float(all_strikes[np.abs(all_strikes - self.underlying_price).argmin()])
 
     def get_atm_put(self) -> OptionContract | None:
         """Get the ATM put option."""
@@ -95,30 +105,145 @@ class OptionChain:
         return atm_puts[0] if atm_puts else None
 
 
-@dataclass
+@dataclass(slots=True)
 class OHLCV:
     """OHLCV (candlestick) data point."""
 
     timestamp: datetime
-    open: Decimal
-    high: Decimal
-    low: Decimal
-    close: Decimal
+    open: float
+    high: float
+    low: float
+    close: float
     volume: int
-    adjusted_close: Decimal | None = None
+    adjusted_close: float | None = None
 
     @property
-    def price_range(self) -> Decimal:
+    def price_range(self) -> float:
         """Calculate price range for the period."""
         return self.high - self.low
 
     @property
-    def body_size(self) -> Decimal:
+    def body_size(self) -> float:
         """Calculate candle body size."""
         return abs(self.close - self.open)
 
 
-@dataclass
+def _to_datetime64(timestamps: list[datetime]) -> np.ndarray:
+    """Convert datetimes to a datetime64[us] array, normalizing aware values to UTC."""
+    if timestamps and timestamps[0].tzinfo is not None:
+        timestamps = [ts.astimezone(UTC).replace(tzinfo=None) for ts in timestamps]
+    return np.array(timestamps, dtype="datetime64[us]")
+
+
+@dataclass(frozen=True, slots=True)
+class OhlcvSeries:
+    """Columnar OHLCV data backed by NumPy arrays.
+
+    Holds the same data as a list of OHLCV bars, but as one array per field so
+    bars are unpacked once and analysis code can work on whole columns. This is
+    the form providers return historical prices in.
+    Timezone-aware timestamps are stored as naive UTC.
+    """
+
+    timestamps: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    adjusted_close: np.ndarray | None = None
+
+    @classmethod
+    def from_bars(cls, bars: list[OHLCV]) -> "OhlcvSeries":
+        """Convert a list of OHLCV bars, sorted chronologically, to columns.
+
+        Args:
+            bars: List of OHLCV objects
+
+        Returns:
+            OhlcvSeries with datetime64 timestamps, float64 prices and int64 volumes;
+            adjusted_close is set (NaN where missing) if any bar has one
+        """
+        n = len(bars)
+        adjusted = list(map(attrgetter("adjusted_close"), bars))
+        return cls(
+            timestamps=_to_datetime64(list(map(attrgetter("timestamp"), bars))),
+            open=np.fromiter(map(attrgetter("open"), bars), dtype=np.float64, count=n),
+            high=np.fromiter(map(attrgetter("high"), bars), dtype=np.float64, count=n),
+            low=np.fromiter(map(attrgetter("low"), bars), dtype=np.float64, count=n),
+            close=np.fromiter(map(attrgetter("close"), bars), dtype=np.float64, count=n),
+            volume=np.fromiter(map(attrgetter("volume"), bars), dtype=np.int64, count=n),
+            adjusted_close=(
+                np.array([np.nan if a is None else a for a in adjusted], dtype=np.float64)
+                if any(a is not None for a in adjusted)
+                else None
+            ),
+        )
+
+    def to_ohlcv_list(self) -> list[OHLCV]:
+        """Convert back to a list of OHLCV bars, e.g. for display or serialization.
+
+        Returns:
+            List of OHLCV objects in the series order
+        """
+        adjusted: list[float | None] = (
+            [None if math.isnan(a) else a for a in self.adjusted_close.tolist()]
+            if self.adjusted_close is not None
+            else [None] * len(self)
+        )
+        return [
+            OHLCV(
+                timestamp=ts,
+                open=o,
+                high=h,
+                low=lo,
+                close=c,
+                volume=v,
+                adjusted_close=a,
+            )
+            for ts, o, h, lo, c, v, a in zip(
+                self.timestamps.astype("datetime64[us]").tolist(),
+                self.open.tolist(),
+                self.high.tolist(),
+                self.low.tolist(),
+                self.close.tolist(),
+                self.volume.tolist(),
+                adjusted,
+                strict=True,
+            )
+        ]
+
+    def __len__(self) -> int:
+        """Number of bars in the series."""
+        return len(self.close)
+
+    def __getitem__(self, key: slice) -> "OhlcvSeries":
+        """Slice the series by bar position; columns are views, not copies.
+
+        Raises:
+            TypeError: If key is not a slice; use the columns or
+                to_ohlcv_list() to read individual bars
+        """
+        if not isinstance(key, slice):
+            raise TypeError(f"OhlcvSeries indices must be slices, not {type(key).__name__}")
+        return OhlcvSeries(
+            timestamps=self.timestamps[key],
+            open=self.open[key],
+            high=self.high[key],
+            low=self.low[key],
+            close=self.close[key],
+            volume=self.volume[key],
+            adjusted_close=None if self.adjusted_close is None else self.adjusted_close[key],
+        )
+
+    @property
+    def last_timestamp(self) -> datetime:
+        """Timestamp of the latest bar."""
+        result: datetime = self.timestamps[-1].astype("datetime64[us]").item()
+        return result
+
+
+@dataclass(slots=True)
 class CompanyOverview:
     """Company fundamental information."""
 
@@ -129,22 +254,22 @@ class CompanyOverview:
     industry: str | None = None
     market_cap: int | None = None
     revenue: int | None = None
-    revenue_per_share: Decimal | None = None
+    revenue_per_share: float | None = None
     profit_margin: float | None = None
     operating_margin: float | None = None
     pe_ratio: float | None = None
     peg_ratio: float | None = None
-    book_value: Decimal | None = None
-    dividend_per_share: Decimal | None = None
+    book_value: float | None = None
+    dividend_per_share: float | None = None
     dividend_yield: float | None = None
-    eps: Decimal | None = None
+    eps: float | None = None
     revenue_growth_yoy: float | None = None
     earnings_growth_yoy: float | None = None
     beta: float | None = None
-    week_52_high: Decimal | None = None
-    week_52_low: Decimal | None = None
-    moving_average_50: Decimal | None = None
-    moving_average_200: Decimal | None = None
+    week_52_high: float | None = None
+    week_52_low: float | None = None
+    moving_average_50: float | None = None
+    moving_average_200: float | None = None
     shares_outstanding: int | None = None
 
     def meets_screener_criteria(
@@ -160,7 +285,7 @@ class CompanyOverview:
         return True
 
 
-@dataclass
+@dataclass(slots=True)
 class TechnicalIndicators:
     """Technical analysis indicators for a symbol."""
 
@@ -194,3 +319,54 @@ class TechnicalIndicators:
     def is_bullish_trend(self) -> bool:
         """Check if showing bullish trend (20 SMA > 60 SMA)."""
         return self.sma_20 is not None and self.sma_60 is not None and self.sma_20 > self.sma_60
+
+
+@dataclass(slots=True)
+class IndicatorPanel:
+    """Latest technical indicators for many symbols, one array per indicator.
+
+    Row i of every array belongs to ``symbols[i]``. Missing values (insufficient
+    data) are NaN, so every comparison on them is False, mirroring the None
+    checks in TechnicalIndicators.
+    """
+
+    symbols: list[str]
+    timestamps: list[datetime]
+    sma_20: np.ndarray
+    sma_60: np.ndarray
+    rsi_14: np.ndarray
+    volume_avg_20: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def oversold_mask(self, threshold: float = 30.0) -> np.ndarray:
+        """Boolean mask of symbols whose RSI indicates an oversold condition."""
+        mask: np.ndarray = self.rsi_14 < threshold
+        return mask
+
+    def overbought_mask(self, threshold: float = 70.0) -> np.ndarray:
+        """Boolean mask of symbols whose RSI indicates an overbought condition."""
+        mask: np.ndarray = self.rsi_14 > threshold
+        return mask
+
+    def bullish_trend_mask(self) -> np.ndarray:
+        """Boolean mask of symbols showing a bullish trend (20 SMA > 60 SMA)."""
+        mask: np.ndarray = self.sma_20 > self.sma_60
+        return mask
+
+    def row(self, index: int) -> TechnicalIndicators:
+        """Return the indicators of one symbol as a TechnicalIndicators instance."""
+
+        def value(column: np.ndarray) -> float | None:
+            item = float(column[index])
+            return None if np.isnan(item) else item
+
+        return TechnicalIndicators(
+            symbol=self.symbols[index],
+            timestamp=self.timestamps[index],
+            sma_20=value(self.sma_20),
+            sma_60=value(self.sma_60),
+            rsi_14=value(self.rsi_14),
+            volume_avg_20=value(self.volume_avg_20),
+        )
@@ -1,9 +1,22 @@
 """Abstract data provider interface for market data."""
 
+import asyncio
 from abc import ABC, abstractmethod
-from datetime import date, datetime
+from collections.abc import Awaitable, Callable
+from datetime import date, datetime, timedelta
+from types import TracebackType
+from typing import Self, TypeVar
 
-from .models import OHLCV, CompanyOverview, OptionChain, Quote
+import numpy as np
+
+from .models import CompanyOverview, OhlcvSeries, OptionChain, OptionContract, Quote
+
+T = TypeVar("T")
+
+# MockDataProvider sample data, built once at import
+_MOCK_CLOSE = 150.0 + np.arange(5, dtype=np.float64)
+_MOCK_VOLUME = 1_000_000 + np.arange(5, dtype=np.int64) * 10_000
+_MOCK_EXPIRATION_DAYS = (7, 14, 30)
 
 
 class DataProvider(ABC):
@@ -11,8 +24,37 @@ class DataProvider(ABC):
 
     All data providers must implement these methods to provide
     market data from various sources (Alpha Vantage, Yahoo Finance, etc).
+
+    Providers can be used as async context managers so that any pooled
+    network resources are released when the caller is done:
+
+        async with AlphaVantageProvider(config) as provider:
+            quote = await provider.get_quote("AAPL")
     """
 
+    max_concurrent_requests: int | None = None
+    """Cap on in-flight requests for batch helpers (None = no cap)."""
+
+    async def __aenter__(self) -> Self:
+        """Enter the provider's async context."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Exit the provider's async context, releasing resources."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Release any resources (e.g. HTTP sessions) held by the provider.
+
+        The default implementation holds no resources and does nothing.
+        """
+        return None
+
     @abstractmethod
     async def get_quote(self, symbol: str) -> Quote:
         """Get current quote for a symbol.
@@ -32,7 +74,7 @@ class DataProvider(ABC):
     @abstractmethod
     async def get_historical_prices(
         self, symbol: str, start: date, end: date, interval: str = "1d"
-    ) -> list[OHLCV]:
+    ) -> OhlcvSeries:
         """Get historical OHLCV data for a symbol.
 
         Args:
@@ -42,7 +84,7 @@ class DataProvider(ABC):
             interval: Data interval ('1d', '1wk', '1mo')
 
         Returns:
-            List of OHLCV data points in chronological order
+            Columnar OHLCV data in chronological order
 
         Raises:
             ValueError: If symbol or date range is invalid
@@ -99,6 +141,101 @@ class DataProvider(ABC):
         """
         pass
 
+    async def get_many_overviews(self, symbols: list[str]) -> list[CompanyOverview]:
+        """Get company overviews for several symbols concurrently.
+
+        All requests are submitted together and at most
+        `max_concurrent_requests` are in flight at once.
+
+        Args:
+            symbols: Stock ticker symbols
+
+        Returns:
+            CompanyOverview for each symbol, in the same order as `symbols`
+
+        Raises:
+            ValueError: If any symbol is invalid or not found
+            RuntimeError: If any API request fails
+        """
+        if not symbols:
+            return []
+
+        limit = min(self.max_concurrent_requests or len(symbols), len(symbols))
+        semaphore = asyncio.Semaphore(limit)
+
+        async def fetch(symbol: str) -> CompanyOverview:
+            async with semaphore:
+                return await self.get_company_overview(symbol)
+
+        return list(await asyncio.gather(*(fetch(symbol) for symbol in symbols)))
+
+    async def get_quotes(self, symbols: list[str]) -> dict[str, Quote | Exception]:
+        """Get current quotes for several symbols.
+
+        The default implementation issues the single-symbol requests
+        concurrently; providers with a multi-symbol endpoint can override it.
+
+        Args:
+            symbols: Stock ticker symbols
+
+        Returns:
+            Dict mapping each symbol to its Quote, or to the exception raised
+            while fetching it, so one failing symbol does not fail the batch
+        """
+        return await self._gather_by_symbol(symbols, self.get_quote)
+
+    async def get_batch_historical(
+        self, symbols: list[str], start: date, end: date, interval: str = "1d"
+    ) -> dict[str, OhlcvSeries | Exception]:
+        """Get historical OHLCV data for several symbols.
+
+        The default implementation issues the single-symbol requests
+        concurrently; providers with a multi-symbol endpoint can override it.
+
+        Args:
+            symbols: Stock ticker symbols
+            start: Start date for historical data
+            end: End date for historical data
+            interval: Data interval ('1d', '1wk', '1mo')
+
+        Returns:
+            Dict mapping each symbol to its OhlcvSeries (chronological order),
+            or to the exception raised while fetching it
+        """
+        return await self._gather_by_symbol(
+            symbols, lambda symbol: self.get_historical_prices(symbol, start, end, interval)
+        )
+
+    async def _gather_by_symbol(
+        self, symbols: list[str], fetch: Callable[[str], Awaitable[T]]
+    ) -> dict[str, T | Exception]:
+        """Run a per-symbol fetch concurrently, capturing failures per symbol.
+
+        At most `max_concurrent_requests` fetches are in flight at once.
+
+        Args:
+            symbols: Stock ticker symbols
+            fetch: Coroutine function fetching data for one symbol
+
+        Returns:
+            Dict mapping each symbol to its result or raised exception
+        """
+        if not symbols:
+            return {}
+
+        limit = min(self.max_concurrent_requests or len(symbols), len(symbols))
+        semaphore = asyncio.Semaphore(limit)
+
+        async def run(symbol: str) -> T | Exception:
+            async with semaphore:
+                try:
+                    return await fetch(symbol)
+                except Exception as e:
+                    return e
+
+        results = await asyncio.gather(*(run(symbol) for symbol in symbols))
+        return dict(zip(symbols, results, strict=True))
+
 
 class MockDataProvider(DataProvider):
     """Mock data provider for testing.
@@ -109,55 +246,38 @@ class MockDataProvider(DataProvider):
 
     def __init__(self) -> None:
         """Initialize mock provider with sample data."""
-        from decimal import Decimal
-
-        self._mock_price = Decimal("150.00")
+        self._mock_price = 150.0
 
     async def get_quote(self, symbol: str) -> Quote:
         """Return a mock quote."""
-        from decimal import Decimal
-
         return Quote(
             symbol=symbol,
             price=self._mock_price,
             volume=1000000,
             timestamp=datetime.now(),
-            open=Decimal("148.00"),
-            high=Decimal("151.00"),
-            low=Decimal("147.50"),
+            open=148.0,
+            high=151.0,
+            low=147.5,
             close=self._mock_price,
-            previous_close=Decimal("149.00"),
+            previous_close=149.0,
         )
 
     async def get_historical_prices(
         self, symbol: str, start: date, end: date, interval: str = "1d"
-    ) -> list[OHLCV]:
+    ) -> OhlcvSeries:
         """Return mock historical data."""
-        from decimal import Decimal
-
-        # Generate simple mock data for 5 days
-        data = []
-        base_price = Decimal("150.00")
-        for i in range(5):
-            price = base_price + Decimal(i)
-            data.append(
-                OHLCV(
-                    timestamp=datetime.combine(start, datetime.min.time()),
-                    open=price - Decimal("1"),
-                    high=price + Decimal("2"),
-                    low=price - Decimal("2"),
-                    close=price,
-                    volume=1000000 + i * 10000,
-                )
-            )
-        return data
+        # Simple mock data for 5 days; copies so callers can't alter the samples
+        return OhlcvSeries(
+            timestamps=np.full(5, np.datetime64(start, "us")),
+            open=_MOCK_CLOSE - 1.0,
+            high=_MOCK_CLOSE + 2.0,
+            low=_MOCK_CLOSE - 2.0,
+            close=_MOCK_CLOSE.copy(),
+            volume=_MOCK_VOLUME.copy(),
+        )
 
     async def get_option_chain(self, symbol: str, expiration: date | None = None) -> OptionChain:
         """Return mock option chain."""
-        from decimal import Decimal
-
-        from .models import OptionContract
-
         if expiration is None:
             expiration = date.today()
 
@@ -165,12 +285,12 @@ class MockDataProvider(DataProvider):
         put = OptionContract(
             symbol=f"{symbol}240119P00150000",
             underlying_symbol=symbol,
-            strike=Decimal("150.00"),
+            strike=150.0,
             expiration=expiration,
             option_type="put",
-            bid=Decimal("2.50"),
-            ask=Decimal("2.55"),
-            last_price=Decimal("2.52"),
+            bid=2.5,
+            ask=2.55,
+            last_price=2.52,
             volume=100,
             open_interest=500,
             implied_volatility=0.25,
@@ -187,19 +307,11 @@ class MockDataProvider(DataProvider):
 
     async def get_available_expirations(self, symbol: str) -> list[date]:
         """Return mock expiration dates."""
-        from datetime import timedelta
-
         today = date.today()
-        return [
-            today + timedelta(days=7),
-            today + timedelta(days=14),
-            today + timedelta(days=30),
-        ]
+        return [today + timedelta(days=days) for days in _MOCK_EXPIRATION_DAYS]
 
     async def get_company_overview(self, symbol: str) -> CompanyOverview:
         """Return mock company overview."""
-        from decimal import Decimal
-
         return CompanyOverview(
             symbol=symbol,
             name=f"{symbol} Inc.",
@@ -209,6 +321,6 @@ class MockDataProvider(DataProvider):
             market_cap=1_000_000_000_000,  # $1T
             revenue=100_000_000_000,  # $100B
             pe_ratio=25.0,
-            eps=Decimal("6.00"),
+            eps=6.0,
             beta=1.2,
         )
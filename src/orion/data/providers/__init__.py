@@ -1,6 +1,27 @@
-"""Data provider implementations."""
+"""Data provider implementations.
 
-from .alpha_vantage import AlphaVantageProvider
-from .yahoo_finance import YahooFinanceProvider
+The providers are imported on first access, so importing one does not load the
+other's dependencies (aiohttp for Alpha Vantage, yfinance for Yahoo Finance).
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .alpha_vantage import AlphaVantageProvider
+    from .yahoo_finance import YahooFinanceProvider
+
+# Provider class name -> defining submodule
+_PROVIDER_MODULES = {
+    "AlphaVantageProvider": ".alpha_vantage",
+    "YahooFinanceProvider": ".yahoo_finance",
+}
 
 __all__ = ["AlphaVantageProvider", "YahooFinanceProvider"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a provider class from its submodule on first access."""
+    if name in _PROVIDER_MODULES:
+        return getattr(import_module(_PROVIDER_MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
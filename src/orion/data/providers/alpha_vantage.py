@@ -1,29 +1,132 @@
 """Alpha Vantage data provider implementation."""
 
-import asyncio
+import json
+from collections.abc import Callable
 from datetime import date, datetime
-from decimal import Decimal
-from typing import Any
+from typing import TYPE_CHECKING, Any, NoReturn
 
 import aiohttp
-from tenacity import retry, stop_after_attempt, wait_exponential
+import numpy as np
+from tenacity import retry, retry_if_not_exception_type, stop_after_attempt, wait_exponential
 
 from ...config import DataProviderConfig
 from ...utils.logging import get_logger
-from ..models import OHLCV, CompanyOverview, OptionChain, Quote
+from ..models import CompanyOverview, OhlcvSeries, OptionChain, Quote
 from ..provider import DataProvider
+from ..rate_limiter import TokenBucket
+
+if TYPE_CHECKING:
+    import httpx
 
 logger = get_logger(__name__)
 
+# Top-level response keys Alpha Vantage uses for errors and rate-limit notices
+API_ERROR_KEYS = frozenset({"Error Message", "Note", "Information"})
+
+# Time series function for each supported history interval
+INTERVAL_FUNCTIONS = {
+    "1d": "TIME_SERIES_DAILY",
+    "1wk": "TIME_SERIES_WEEKLY",
+    "1mo": "TIME_SERIES_MONTHLY",
+}
+
+# Alpha Vantage time series fields, in OHLCV order
+BAR_FIELDS = ("1. open", "2. high", "3. low", "4. close", "5. volume")
+
+
+def _dates_in_range(time_series: dict[str, Any], start: str, end: str) -> list[str]:
+    """Select the ISO date keys within [start, end], in chronological order.
+
+    Alpha Vantage lists bars newest first, so the scan skips dates after
+    `end` and stops at the first date before `start` instead of visiting the
+    whole history. If the keys visited turn out not to be newest first
+    (checked from the second key on, before the scan can stop), the full
+    series is filtered and sorted instead.
+
+    Args:
+        time_series: Time series mapping of ISO date to bar
+        start: First date to include (ISO format)
+        end: Last date to include (ISO format)
+
+    Returns:
+        Dates in range, oldest first
+    """
+    dates: list[str] = []
+    previous: str | None = None
+    for d in time_series:
+        if previous is not None and d >= previous:
+            # Not newest first; ISO date keys sort chronologically as strings
+            return sorted(d for d in time_series if start <= d <= end)
+        first = previous is None
+        previous = d
+        if d > end:
+            continue
+        if d < start:
+            if first:
+                # Only the next key tells whether the series is oldest first
+                continue
+            break
+        dates.append(d)
+    dates.reverse()
+    return dates
+
+
+def _to_int(value: str) -> int | None:
+    """Convert string to int, return None if invalid."""
+    try:
+        return int(float(value)) if value and value != "None" else None
+    except Exception:
+        return None
+
+
+def _to_float(value: str) -> float | None:
+    """Convert string to float, return None if invalid."""
+    try:
+        return float(value) if value and value != "None" else None
+    except Exception:
+        return None
+
+
+# Numeric CompanyOverview fields: (attribute, OVERVIEW response key, converter)
+OVERVIEW_FIELDS: tuple[tuple[str, str, Callable[[str], int | float | None]], ...] = (
+    ("market_cap", "MarketCapitalization", _to_int),
+    ("revenue", "RevenueTTM", _to_int),
+    ("revenue_per_share", "RevenuePerShareTTM", _to_float),
+    ("profit_margin", "ProfitMargin", _to_float),
+    ("operating_margin", "OperatingMarginTTM", _to_float),
+    ("pe_ratio", "PERatio", _to_float),
+    ("peg_ratio", "PEGRatio", _to_float),
+    ("book_value", "BookValue", _to_float),
+    ("dividend_per_share", "DividendPerShare", _to_float),
+    ("dividend_yield", "DividendYield", _to_float),
+    ("eps", "EPS", _to_float),
+    ("revenue_growth_yoy", "QuarterlyRevenueGrowthYOY", _to_float),
+    ("earnings_growth_yoy", "QuarterlyEarningsGrowthYOY", _to_float),
+    ("beta", "Beta", _to_float),
+    ("week_52_high", "52WeekHigh", _to_float),
+    ("week_52_low", "52WeekLow", _to_float),
+    ("moving_average_50", "50DayMovingAverage", _to_float),
+    ("moving_average_200", "200DayMovingAverage", _to_float),
+    ("shares_outstanding", "SharesOutstanding", _to_int),
+)
+
 
 class AlphaVantageProvider(DataProvider):
     """Alpha Vantage data provider.
 
     Provides comprehensive company fundamentals and financial data.
     Requires API key from https://www.alphavantage.co/
+
+    Requests share one pooled HTTP client for the provider's lifetime. By
+    default this is an aiohttp session; with ``config.http2`` enabled an
+    HTTP/2 ``httpx.AsyncClient`` is used instead, multiplexing requests over a
+    single connection.
     """
 
     BASE_URL = "https://www.alphavantage.co/query"
+    REQUEST_TIMEOUT = 30.0
+    KEEPALIVE_TIMEOUT = 75.0
+    DNS_CACHE_TTL = 300
 
     def __init__(self, config: DataProviderConfig) -> None:
         """Initialize Alpha Vantage provider.
@@ -35,16 +138,97 @@ class AlphaVantageProvider(DataProvider):
             raise ValueError("Alpha Vantage API key is required")
 
         self.api_key = config.api_key
-        self.rate_limit_delay = 60.0 / config.rate_limit
-        self._last_request_time = 0.0
+        self.use_http2 = config.http2
+        self.output_size = config.output_size
+        self._rate_limiter = TokenBucket.per_minute(config.rate_limit)
+        self.max_concurrent_requests = config.rate_limit
+        self.max_connections = config.max_connections
+        self.max_connections_per_host = config.max_connections_per_host
+        self._session: aiohttp.ClientSession | None = None
+        self._http2_client: httpx.AsyncClient | None = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use.
+
+        Reusing one session keeps connections alive between requests so
+        each call does not pay a fresh TCP + TLS handshake. Idle connections
+        are kept open long enough to bridge rate-limiter waits, and DNS
+        lookups for the API host are cached. The connector limits bound the
+        number of open sockets, so fanned-out requests wait for a free
+        connection instead of failing and going through the retry ladder.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.REQUEST_TIMEOUT),
+                connector=aiohttp.TCPConnector(
+                    limit=self.max_connections,
+                    limit_per_host=self.max_connections_per_host,
+                    ttl_dns_cache=self.DNS_CACHE_TTL,
+                    keepalive_timeout=self.KEEPALIVE_TIMEOUT,
+                ),
+            )
+        return self._session
+
+    def _get_http2_client(self) -> "httpx.AsyncClient":
+        """Get the shared HTTP/2 client, creating it on first use.
+
+        Raises:
+            RuntimeError: If httpx with HTTP/2 support is not installed
+        """
+        if self._http2_client is None or self._http2_client.is_closed:
+            try:
+                import httpx
+            except ImportError as e:
+                raise RuntimeError(
+                    "HTTP/2 support requires httpx; install with 'poetry install -E http2'"
+                ) from e
+
+            self._http2_client = httpx.AsyncClient(
+                http2=True,
+                timeout=self.REQUEST_TIMEOUT,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections or None,
+                    max_keepalive_connections=self.max_connections or None,
+                ),
+            )
+        return self._http2_client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP session/client."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+        if self._http2_client is not None:
+            await self._http2_client.aclose()
+        self._http2_client = None
+
+    async def _get_json(self, params: dict[str, Any]) -> Any:
+        """Send a GET request to the API and decode the JSON body.
+
+        Args:
+            params: Query parameters
 
-    async def _rate_limit(self) -> None:
-        """Apply rate limiting between requests."""
-        now = asyncio.get_event_loop().time()
-        time_since_last = now - self._last_request_time
-        if time_since_last < self.rate_limit_delay:
-            await asyncio.sleep(self.rate_limit_delay - time_since_last)
-        self._last_request_time = asyncio.get_event_loop().time()
+        Returns:
+            Decoded JSON response
+
+        Raises:
+            RuntimeError: If the API returns a non-200 status
+        """
+        if self.use_http2:
+            client = self._get_http2_client()
+            http2_response = await client.get(self.BASE_URL, params=params)
+            if http2_response.status_code != 200:
+                raise RuntimeError(f"Alpha Vantage API error: HTTP {http2_response.status_code}")
+            return http2_response.json()
+
+        session = await self._get_session()
+        async with session.get(self.BASE_URL, params=params) as response:
+            if response.status != 200:
+                raise RuntimeError(f"Alpha Vantage API error: HTTP {response.status}")
+            # Decode the raw bytes directly; response.json() first builds a str
+            # copy of the whole body
+            return json.loads(await response.read())
 
     async def _make_request(self, function: str, symbol: str, **kwargs: Any) -> dict[str, Any]:
         """Make an API request to Alpha Vantage.
@@ -60,7 +244,7 @@ class AlphaVantageProvider(DataProvider):
         Raises:
             RuntimeError: If API request fails or returns error
         """
-        await self._rate_limit()
+        await self._rate_limiter.acquire()
 
         params = {
             "function": function,
@@ -75,31 +259,39 @@ class AlphaVantageProvider(DataProvider):
             symbol=symbol,
         )
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(self.BASE_URL, params=params) as response:
-                if response.status != 200:
-                    raise RuntimeError(f"Alpha Vantage API error: HTTP {response.status}")
+        data = await self._get_json(params)
 
-                data = await response.json()
+        # Check for API error messages; the common case has none of the keys
+        if not API_ERROR_KEYS.isdisjoint(data):
+            self._raise_api_error(data)
 
-                # Check for API error messages
-                if "Error Message" in data:
-                    raise RuntimeError(f"Alpha Vantage error: {data['Error Message']}")
+        result: dict[str, Any] = data
+        return result
 
-                if "Note" in data:
-                    # API call frequency limit hit
-                    logger.warning(
-                        "alpha_vantage_rate_limit",
-                        message=data["Note"],
-                    )
-                    raise RuntimeError("Alpha Vantage rate limit reached")
+    def _raise_api_error(self, data: dict[str, Any]) -> NoReturn:
+        """Raise for an Alpha Vantage error payload.
 
-                result: dict[str, Any] = data
-                return result
+        Args:
+            data: Response containing at least one of API_ERROR_KEYS
+
+        Raises:
+            RuntimeError: Always, describing the error or rate limit
+        """
+        if "Error Message" in data:
+            raise RuntimeError(f"Alpha Vantage error: {data['Error Message']}")
+
+        # API call frequency limit hit; newer responses use "Information"
+        message = data.get("Note") or data.get("Information")
+        logger.warning(
+            "alpha_vantage_rate_limit",
+            message=message,
+        )
+        raise RuntimeError("Alpha Vantage rate limit reached")
 
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=4, max=10),
+        retry=retry_if_not_exception_type(ValueError),
         reraise=True,
     )
     async def get_quote(self, symbol: str) -> Quote:
@@ -113,15 +305,15 @@ class AlphaVantageProvider(DataProvider):
 
         quote = Quote(
             symbol=symbol,
-            price=Decimal(quote_data["05. price"]),
+            price=float(quote_data["05. price"]),
             volume=int(quote_data["06. volume"]),
             timestamp=datetime.now(),  # Alpha Vantage doesn't provide exact timestamp
-            open=Decimal(quote_data["02. open"]),
-            high=Decimal(quote_data["03. high"]),
-            low=Decimal(quote_data["04. low"]),
-            close=Decimal(quote_data["05. price"]),
-            previous_close=Decimal(quote_data["08. previous close"]),
-            change=Decimal(quote_data["09. change"]),
+            open=float(quote_data["02. open"]),
+            high=float(quote_data["03. high"]),
+            low=float(quote_data["04. low"]),
+            close=float(quote_data["05. price"]),
+            previous_close=float(quote_data["08. previous close"]),
+            change=float(quote_data["09. change"]),
             change_percent=float(quote_data["10. change percent"].rstrip("%")),
         )
 
@@ -136,33 +328,25 @@ class AlphaVantageProvider(DataProvider):
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=4, max=10),
+        retry=retry_if_not_exception_type(ValueError),
         reraise=True,
     )
     async def get_historical_prices(
         self, symbol: str, start: date, end: date, interval: str = "1d"
-    ) -> list[OHLCV]:
+    ) -> OhlcvSeries:
         """Get historical OHLCV data from Alpha Vantage.
 
         Note: Free tier limitations:
-        - Only returns last 100 days of data (compact mode)
-        - Full historical data requires premium subscription
+        - Only returns last 100 days of daily data (compact mode)
+        - Full daily history (output_size "full") requires premium subscription
         - For comprehensive historical data, use YahooFinanceProvider instead
         """
-        # Map interval to Alpha Vantage function
-        # Note: outputsize=full requires premium subscription, use compact for free tier
-        if interval == "1d":
-            function = "TIME_SERIES_DAILY"
-            outputsize = "compact"  # Last 100 days only (free tier limitation)
-        elif interval == "1wk":
-            function = "TIME_SERIES_WEEKLY"
-            outputsize = "compact"
-        elif interval == "1mo":
-            function = "TIME_SERIES_MONTHLY"
-            outputsize = "compact"
-        else:
-            raise ValueError(f"Unsupported interval: {interval}")
-
-        data = await self._make_request(function, symbol, outputsize=outputsize)
+        try:
+            function = INTERVAL_FUNCTIONS[interval]
+        except KeyError:
+            raise ValueError(f"Unsupported interval: {interval}") from None
+
+        data = await self._make_request(function, symbol, outputsize=self.output_size)
 
         # Find the time series key
         time_series_key = next((k for k in data.keys() if "Time Series" in k), None)
@@ -172,24 +356,22 @@ class AlphaVantageProvider(DataProvider):
 
         time_series = data[time_series_key]
 
-        # Filter by date range and convert to OHLCV
-        ohlcv_data = []
-        for date_str, values in time_series.items():
-            date_obj = datetime.strptime(date_str, "%Y-%m-%d").date()
-
-            if start <= date_obj <= end:
-                ohlcv = OHLCV(
-                    timestamp=datetime.combine(date_obj, datetime.min.time()),
-                    open=Decimal(values["1. open"]),
-                    high=Decimal(values["2. high"]),
-                    low=Decimal(values["3. low"]),
-                    close=Decimal(values["4. close"]),
-                    volume=int(values["5. volume"]),
-                )
-                ohlcv_data.append(ohlcv)
-
-        # Sort chronologically
-        ohlcv_data.sort(key=lambda x: x.timestamp)
+        dates = _dates_in_range(time_series, start.isoformat(), end.isoformat())
+
+        # Parse all fields in one pass into an (n, 5) matrix; the string-to-float
+        # conversion happens in numpy rather than per value in Python
+        bars = np.array(
+            [[time_series[d][field] for field in BAR_FIELDS] for d in dates], dtype=np.float64
+        ).reshape(-1, len(BAR_FIELDS))
+
+        ohlcv_data = OhlcvSeries(
+            timestamps=np.array(dates, dtype="datetime64[us]"),
+            open=bars[:, 0].copy(),
+            high=bars[:, 1].copy(),
+            low=bars[:, 2].copy(),
+            close=bars[:, 3].copy(),
+            volume=bars[:, 4].astype(np.int64),
+        )
 
         logger.info(
             "alpha_vantage_historical_fetched",
@@ -222,6 +404,7 @@ class AlphaVantageProvider(DataProvider):
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=4, max=10),
+        retry=retry_if_not_exception_type(ValueError),
         reraise=True,
     )
     async def get_company_overview(self, symbol: str) -> CompanyOverview:
@@ -231,52 +414,16 @@ class AlphaVantageProvider(DataProvider):
         if not data or "Symbol" not in data:
             raise ValueError(f"No company data found for symbol: {symbol}")
 
-        def to_decimal(value: str) -> Decimal | None:
-            """Convert string to Decimal, return None if invalid."""
-            try:
-                return Decimal(value) if value and value != "None" else None
-            except Exception:
-                return None
-
-        def to_int(value: str) -> int | None:
-            """Convert string to int, return None if invalid."""
-            try:
-                return int(float(value)) if value and value != "None" else None
-            except Exception:
-                return None
-
-        def to_float(value: str) -> float | None:
-            """Convert string to float, return None if invalid."""
-            try:
-                return float(value) if value and value != "None" else None
-            except Exception:
-                return None
-
+        numeric: dict[str, Any] = {
+            field: convert(data.get(key, "")) for field, key, convert in OVERVIEW_FIELDS
+        }
         overview = CompanyOverview(
             symbol=symbol,
             name=data.get("Name", symbol),
             exchange=data.get("Exchange", ""),
             sector=data.get("Sector"),
             industry=data.get("Industry"),
-            market_cap=to_int(data.get("MarketCapitalization", "")),
-            revenue=to_int(data.get("RevenueTTM", "")),
-            revenue_per_share=to_decimal(data.get("RevenuePerShareTTM", "")),
-            profit_margin=to_float(data.get("ProfitMargin", "")),
-            operating_margin=to_float(data.get("OperatingMarginTTM", "")),
-            pe_ratio=to_float(data.get("PERatio", "")),
-            peg_ratio=to_float(data.get("PEGRatio", "")),
-            book_value=to_decimal(data.get("BookValue", "")),
-            dividend_per_share=to_decimal(data.get("DividendPerShare", "")),
-            dividend_yield=to_float(data.get("DividendYield", "")),
-            eps=to_decimal(data.get("EPS", "")),
-            revenue_growth_yoy=to_float(data.get("QuarterlyRevenueGrowthYOY", "")),
-            earnings_growth_yoy=to_float(data.get("QuarterlyEarningsGrowthYOY", "")),
-            beta=to_float(data.get("Beta", "")),
-            week_52_high=to_decimal(data.get("52WeekHigh", "")),
-            week_52_low=to_decimal(data.get("52WeekLow", "")),
-            moving_average_50=to_decimal(data.get("50DayMovingAverage", "")),
-            moving_average_200=to_decimal(data.get("200DayMovingAverage", "")),
-            shares_outstanding=to_int(data.get("SharesOutstanding", "")),
+            **numeric,
         )
 
         logger.info(
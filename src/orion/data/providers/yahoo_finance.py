@@ -1,19 +1,27 @@
 """Yahoo Finance data provider implementation."""
 
 import asyncio
-from datetime import date, datetime
-from decimal import Decimal
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from functools import partial
 from typing import Any
 
+import numpy as np
+import pandas as pd
 import yfinance as yf
-from tenacity import retry, stop_after_attempt, wait_exponential
+from cachetools import TTLCache
+from tenacity import retry, retry_if_not_exception_type, stop_after_attempt, wait_exponential
 
 from ...utils.logging import get_logger
-from ..models import OHLCV, CompanyOverview, OptionChain, OptionContract, Quote
+from ..models import CompanyOverview, OhlcvSeries, OptionChain, OptionContract, Quote
 from ..provider import DataProvider
+from ..rate_limiter import IntervalLimiter
 
 logger = get_logger(__name__)
 
+# Numeric option chain columns, in OptionContract field order; 0 when missing or NaN
+OPTION_NUMERIC_COLUMNS = ("bid", "ask", "lastPrice", "volume", "openInterest", "impliedVolatility")
+
 
 class YahooFinanceProvider(DataProvider):
     """Yahoo Finance data provider.
@@ -22,26 +30,65 @@ class YahooFinanceProvider(DataProvider):
     and option chains. No API key required but has rate limits.
     """
 
-    def __init__(self, rate_limit_delay: float = 0.5) -> None:
+    TICKER_CACHE_SIZE = 256
+    TICKER_TTL = 60.0
+
+    def __init__(self, rate_limit_delay: float = 0.5, executor_workers: int = 8) -> None:
         """Initialize Yahoo Finance provider.
 
         Args:
             rate_limit_delay: Delay between requests in seconds (default 0.5)
+            executor_workers: Threads running blocking yfinance calls (default 8)
         """
         self.rate_limit_delay = rate_limit_delay
-        self._last_request_time = 0.0
+        self.executor_workers = executor_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._rate_limiter = IntervalLimiter(rate_limit_delay)
+        self._tickers: TTLCache[str, yf.Ticker] = TTLCache(
+            maxsize=self.TICKER_CACHE_SIZE, ttl=self.TICKER_TTL
+        )
+
+    def _ticker(self, symbol: str) -> yf.Ticker:
+        """Get the yfinance Ticker for a symbol, reusing a recently created one.
+
+        Constructing a Ticker does no network I/O but allocates an HTTP session
+        and several helper objects; requests themselves already go through
+        yfinance's shared session. Tickers memoize some responses (e.g. the
+        option expirations and info), so they are only kept for a short TTL.
+        """
+        ticker = self._tickers.get(symbol)
+        if ticker is None:
+            ticker = yf.Ticker(symbol)
+            self._tickers[symbol] = ticker
+        return ticker
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the thread pool for blocking yfinance calls, creating it if needed.
+
+        yfinance blocks on network I/O, so a dedicated pool sized to the rate
+        limit budget is used instead of the loop's default executor, which is
+        sized from the CPU count and shared with unrelated work.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.executor_workers, thread_name_prefix="yf"
+            )
+        return self._executor
+
+    async def aclose(self) -> None:
+        """Shut down the thread pool without waiting for running calls."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
 
     async def _rate_limit(self) -> None:
         """Apply rate limiting between requests."""
-        now = asyncio.get_event_loop().time()
-        time_since_last = now - self._last_request_time
-        if time_since_last < self.rate_limit_delay:
-            await asyncio.sleep(self.rate_limit_delay - time_since_last)
-        self._last_request_time = asyncio.get_event_loop().time()
+        await self._rate_limiter.acquire()
 
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
+        retry=retry_if_not_exception_type(ValueError),
         reraise=True,
     )
     async def get_quote(self, symbol: str) -> Quote:
@@ -50,31 +97,35 @@ class YahooFinanceProvider(DataProvider):
 
         logger.debug("fetching_quote", symbol=symbol)
 
-        # Run blocking yfinance call in executor
-        loop = asyncio.get_event_loop()
-        ticker = await loop.run_in_executor(None, yf.Ticker, symbol)
-        hist = await loop.run_in_executor(None, lambda: ticker.history(period="5d"))
+        # Run blocking yfinance call in executor. Two daily bars are enough for
+        # the latest price and the previous close; Ticker.fast_info is avoided
+        # since it loads a year of daily bars plus a week of hourly bars.
+        loop = asyncio.get_running_loop()
+        ticker = self._ticker(symbol)
+        hist = await loop.run_in_executor(
+            self._get_executor(), partial(ticker.history, period="2d")
+        )
 
         if hist.empty:
             raise ValueError(f"No data found for symbol: {symbol}")
 
-        latest = hist.iloc[-1]
+        # Read scalars straight from the columns; hist.iloc[-1] would first box
+        # the mixed-dtype row into an object Series
         timestamp = hist.index[-1].to_pydatetime()
+        close = hist["Close"].to_numpy(dtype=np.float64)
 
         # Get previous close from second-to-last day if available
-        previous_close = None
-        if len(hist) > 1:
-            previous_close = Decimal(str(hist.iloc[-2]["Close"]))
+        previous_close = float(close[-2]) if len(close) > 1 else None
 
         quote = Quote(
             symbol=symbol,
-            price=Decimal(str(latest["Close"])),
-            volume=int(latest["Volume"]),
+            price=float(close[-1]),
+            volume=int(hist["Volume"].iat[-1]),
             timestamp=timestamp,
-            open=Decimal(str(latest["Open"])),
-            high=Decimal(str(latest["High"])),
-            low=Decimal(str(latest["Low"])),
-            close=Decimal(str(latest["Close"])),
+            open=float(hist["Open"].iat[-1]),
+            high=float(hist["High"].iat[-1]),
+            low=float(hist["Low"].iat[-1]),
+            close=float(close[-1]),
             previous_close=previous_close,
         )
 
@@ -90,11 +141,12 @@ class YahooFinanceProvider(DataProvider):
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
+        retry=retry_if_not_exception_type(ValueError),
         reraise=True,
     )
     async def get_historical_prices(
         self, symbol: str, start: date, end: date, interval: str = "1d"
-    ) -> list[OHLCV]:
+    ) -> OhlcvSeries:
         """Get historical OHLCV data from Yahoo Finance."""
         await self._rate_limit()
 
@@ -107,29 +159,17 @@ class YahooFinanceProvider(DataProvider):
         )
 
         # Run blocking yfinance call in executor
-        loop = asyncio.get_event_loop()
-        ticker = await loop.run_in_executor(None, yf.Ticker, symbol)
+        loop = asyncio.get_running_loop()
+        ticker = self._ticker(symbol)
         hist = await loop.run_in_executor(
-            None,
-            lambda: ticker.history(start=start, end=end, interval=interval, auto_adjust=False),
+            self._get_executor(),
+            partial(ticker.history, start=start, end=end, interval=interval, auto_adjust=False),
         )
 
         if hist.empty:
             raise ValueError(f"No historical data found for {symbol} from {start} to {end}")
 
-        # Convert DataFrame to OHLCV objects
-        data = []
-        for idx, row in hist.iterrows():
-            ohlcv = OHLCV(
-                timestamp=idx.to_pydatetime(),
-                open=Decimal(str(row["Open"])),
-                high=Decimal(str(row["High"])),
-                low=Decimal(str(row["Low"])),
-                close=Decimal(str(row["Close"])),
-                volume=int(row["Volume"]),
-                adjusted_close=Decimal(str(row["Adj Close"])),
-            )
-            data.append(ohlcv)
+        data = self._frame_to_series(hist)
 
         logger.info(
             "historical_data_fetched",
@@ -141,9 +181,98 @@ class YahooFinanceProvider(DataProvider):
 
         return data
 
+    async def get_batch_historical(
+        self, symbols: list[str], start: date, end: date, interval: str = "1d"
+    ) -> dict[str, OhlcvSeries | Exception]:
+        """Get historical OHLCV data for several symbols with one yf.download call.
+
+        yfinance fetches the symbols on its own worker threads and returns a
+        single frame grouped by ticker, which is split back into one series
+        per symbol. The whole download counts as one request for rate
+        limiting.
+
+        Args:
+            symbols: Stock ticker symbols
+            start: Start date for historical data
+            end: End date for historical data
+            interval: Data interval ('1d', '1wk', '1mo')
+
+        Returns:
+            Dict mapping each symbol to its OhlcvSeries, or to the exception
+            raised for it (ValueError if no data was returned)
+        """
+        if not symbols:
+            return {}
+
+        await self._rate_limit()
+
+        logger.debug(
+            "fetching_batch_historical_data",
+            count=len(symbols),
+            start=start.isoformat(),
+            end=end.isoformat(),
+            interval=interval,
+        )
+
+        loop = asyncio.get_running_loop()
+        try:
+            frame = await loop.run_in_executor(
+                self._get_executor(),
+                partial(
+                    yf.download,
+                    tickers=symbols,
+                    start=start,
+                    end=end,
+                    interval=interval,
+                    group_by="ticker",
+                    auto_adjust=False,
+                    threads=True,
+                    progress=False,
+                ),
+            )
+        except Exception as e:
+            return dict.fromkeys(symbols, e)
+
+        downloaded = set(frame.columns.get_level_values(0)) if not frame.empty else set()
+        results: dict[str, OhlcvSeries | Exception] = {}
+        for symbol in symbols:
+            # Dates are the union over all symbols; drop those this one lacks
+            hist = frame[symbol].dropna(subset=["Close"]) if symbol in downloaded else None
+            if hist is None or hist.empty:
+                results[symbol] = ValueError(
+                    f"No historical data found for {symbol} from {start} to {end}"
+                )
+            else:
+                results[symbol] = self._frame_to_series(hist)
+
+        logger.info(
+            "batch_historical_data_fetched",
+            requested=len(symbols),
+            fetched=sum(not isinstance(result, Exception) for result in results.values()),
+        )
+
+        return results
+
+    @staticmethod
+    def _frame_to_series(hist: Any) -> OhlcvSeries:
+        """Take the columns of a yfinance history frame; timestamps become naive UTC."""
+        index = hist.index
+        if index.tz is not None:
+            index = index.tz_convert("UTC").tz_localize(None)
+        return OhlcvSeries(
+            timestamps=index.to_numpy(dtype="datetime64[us]"),
+            open=hist["Open"].to_numpy(dtype=np.float64),
+            high=hist["High"].to_numpy(dtype=np.float64),
+            low=hist["Low"].to_numpy(dtype=np.float64),
+            close=hist["Close"].to_numpy(dtype=np.float64),
+            volume=hist["Volume"].to_numpy(dtype=np.int64),
+            adjusted_close=hist["Adj Close"].to_numpy(dtype=np.float64),
+        )
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
+        retry=retry_if_not_exception_type(ValueError),
         reraise=True,
     )
     async def get_option_chain(self, symbol: str, expiration: date | None = None) -> OptionChain:
@@ -156,12 +285,12 @@ class YahooFinanceProvider(DataProvider):
             expiration=expiration.isoformat() if expiration else None,
         )
 
-        # Run blocking yfinance call in executor
-        loop = asyncio.get_event_loop()
-        ticker = await loop.run_in_executor(None, yf.Ticker, symbol)
+        # Run blocking yfinance calls in executor
+        loop = asyncio.get_running_loop()
+        ticker = self._ticker(symbol)
 
         # Get available expirations
-        expirations = await loop.run_in_executor(None, lambda: ticker.options)
+        expirations = await loop.run_in_executor(self._get_executor(), getattr, ticker, "options")
 
         if not expirations:
             raise ValueError(f"No options available for symbol: {symbol}")
@@ -175,27 +304,22 @@ class YahooFinanceProvider(DataProvider):
                 raise ValueError(f"Expiration {expiration_str} not available for {symbol}")
 
         # Get option chain for expiration
-        opt = await loop.run_in_executor(None, ticker.option_chain, expiration_str)
-
-        # Get current price
-        info = await loop.run_in_executor(None, lambda: ticker.info)
-        current_price = Decimal(str(info.get("currentPrice", 0)))
+        opt = await loop.run_in_executor(self._get_executor(), ticker.option_chain, expiration_str)
 
-        # Parse calls
-        calls = []
-        if not opt.calls.empty:
-            for _, row in opt.calls.iterrows():
-                calls.append(self._parse_option_contract(row, symbol, "call"))
+        # The chain response carries the underlying's quote; only fall back to
+        # the much heavier ticker.info request when it lacks the price
+        underlying_price = (opt.underlying or {}).get("regularMarketPrice")
+        if underlying_price is None:
+            info = await loop.run_in_executor(self._get_executor(), getattr, ticker, "info")
+            underlying_price = info.get("currentPrice", 0)
+        current_price = float(underlying_price)
 
-        # Parse puts
-        puts = []
-        if not opt.puts.empty:
-            for _, row in opt.puts.iterrows():
-                puts.append(self._parse_option_contract(row, symbol, "put"))
+        calls = self._parse_option_contracts(opt.calls, symbol, "call")
+        puts = self._parse_option_contracts(opt.puts, symbol, "put")
 
         chain = OptionChain(
             symbol=symbol,
-            expiration=datetime.strptime(expiration_str, "%Y-%m-%d").date(),
+            expiration=date.fromisoformat(expiration_str),
             underlying_price=current_price,
             calls=calls,
             puts=puts,
@@ -211,27 +335,74 @@ class YahooFinanceProvider(DataProvider):
 
         return chain
 
-    def _parse_option_contract(
-        self, row: Any, underlying_symbol: str, option_type: str
-    ) -> OptionContract:
-        """Parse option contract from DataFrame row."""
-        return OptionContract(
-            symbol=row["contractSymbol"],
-            underlying_symbol=underlying_symbol,
-            strike=Decimal(str(row["strike"])),
-            expiration=datetime.fromtimestamp(row["lastTradeDate"]).date(),
-            option_type=option_type,  # type: ignore
-            bid=Decimal(str(row.get("bid", 0))),
-            ask=Decimal(str(row.get("ask", 0))),
-            last_price=Decimal(str(row.get("lastPrice", 0))),
-            volume=int(row.get("volume", 0) or 0),
-            open_interest=int(row.get("openInterest", 0) or 0),
-            implied_volatility=float(row.get("impliedVolatility", 0) or 0),
+    def _parse_option_contracts(
+        self, frame: Any, underlying_symbol: str, option_type: str
+    ) -> list[OptionContract]:
+        """Parse an option chain DataFrame into contracts.
+
+        Each column is extracted once as an array, with missing columns and
+        NaNs in the numeric ones replaced by 0, and the contracts are built by
+        zipping the columns, so there is no per-cell pandas lookup. Trade
+        dates are converted for the whole column at once.
+        """
+        if frame is None or len(frame) == 0:
+            return []
+
+        numeric = [
+            (
+                np.nan_to_num(frame[column].to_numpy(dtype=np.float64))
+                if column in frame.columns
+                else np.zeros(len(frame))
+            ).tolist()
+            for column in OPTION_NUMERIC_COLUMNS
+        ]
+        rows = zip(
+            frame["contractSymbol"].tolist(),
+            frame["strike"].to_numpy(dtype=np.float64).tolist(),
+            self._column_dates(frame["lastTradeDate"]),
+            *numeric,
+            strict=True,
         )
+        return [
+            OptionContract(
+                symbol=contract_symbol,
+                underlying_symbol=underlying_symbol,
+                strike=strike,
+                expiration=last_trade_date,
+                option_type=option_type,  # type: ignore
+                bid=bid,
+                ask=ask,
+                last_price=last_price,
+                volume=int(volume),
+                open_interest=int(open_interest),
+                implied_volatility=implied_volatility,
+            )
+            for (
+                contract_symbol,
+                strike,
+                last_trade_date,
+                bid,
+                ask,
+                last_price,
+                volume,
+                open_interest,
+                implied_volatility,
+            ) in rows
+        ]
+
+    @staticmethod
+    def _column_dates(column: pd.Series) -> list[date]:
+        """Convert a column of epoch seconds or timestamps to UTC dates."""
+        if pd.api.types.is_numeric_dtype(column):
+            timestamps = pd.to_datetime(column, unit="s", utc=True)
+        else:
+            timestamps = pd.to_datetime(column, utc=True)
+        return timestamps.dt.date.tolist()
 
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
+        retry=retry_if_not_exception_type(ValueError),
         reraise=True,
     )
     async def get_available_expirations(self, symbol: str) -> list[date]:
@@ -241,15 +412,15 @@ class YahooFinanceProvider(DataProvider):
         logger.debug("fetching_expirations", symbol=symbol)
 
         # Run blocking yfinance call in executor
-        loop = asyncio.get_event_loop()
-        ticker = await loop.run_in_executor(None, yf.Ticker, symbol)
-        expirations = await loop.run_in_executor(None, lambda: ticker.options)
+        loop = asyncio.get_running_loop()
+        ticker = self._ticker(symbol)
+        expirations = await loop.run_in_executor(self._get_executor(), getattr, ticker, "options")
 
         if not expirations:
             raise ValueError(f"No options available for symbol: {symbol}")
 
         # Convert string dates to date objects
-        expiration_dates = [datetime.strptime(exp, "%Y-%m-%d").date() for exp in expirations]
+        expiration_dates = [date.fromisoformat(exp) for exp in expirations]
 
         logger.info(
             "expirations_fetched",
@@ -262,6 +433,7 @@ class YahooFinanceProvider(DataProvider):
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
+        retry=retry_if_not_exception_type(ValueError),
         reraise=True,
     )
     async def get_company_overview(self, symbol: str) -> CompanyOverview:
@@ -275,9 +447,9 @@ class YahooFinanceProvider(DataProvider):
         logger.debug("fetching_company_overview", symbol=symbol)
 
         # Run blocking yfinance call in executor
-        loop = asyncio.get_event_loop()
-        ticker = await loop.run_in_executor(None, yf.Ticker, symbol)
-        info = await loop.run_in_executor(None, lambda: ticker.info)
+        loop = asyncio.get_running_loop()
+        ticker = self._ticker(symbol)
+        info = await loop.run_in_executor(self._get_executor(), getattr, ticker, "info")
 
         if not info:
             raise ValueError(f"No company data found for symbol: {symbol}")
@@ -291,21 +463,15 @@ class YahooFinanceProvider(DataProvider):
             market_cap=info.get("marketCap"),
             revenue=info.get("totalRevenue"),
             pe_ratio=info.get("trailingPE"),
-            eps=Decimal(str(info["trailingEps"])) if "trailingEps" in info else None,
+            eps=float(info["trailingEps"]) if "trailingEps" in info else None,
             beta=info.get("beta"),
             dividend_yield=info.get("dividendYield"),
-            week_52_high=Decimal(str(info["fiftyTwoWeekHigh"]))
-            if "fiftyTwoWeekHigh" in info
-            else None,
-            week_52_low=Decimal(str(info["fiftyTwoWeekLow"]))
-            if "fiftyTwoWeekLow" in info
-            else None,
-            moving_average_50=Decimal(str(info["fiftyDayAverage"]))
-            if "fiftyDayAverage" in info
-            else None,
-            moving_average_200=Decimal(str(info["twoHundredDayAverage"]))
-            if "twoHundredDayAverage" in info
-            else None,
+            week_52_high=float(info["fiftyTwoWeekHigh"]) if "fiftyTwoWeekHigh" in info else None,
+            week_52_low=float(info["fiftyTwoWeekLow"]) if "fiftyTwoWeekLow" in info else None,
+            moving_average_50=float(info["fiftyDayAverage"]) if "fiftyDayAverage" in info else None,
+            moving_average_200=(
+                float(info["twoHundredDayAverage"]) if "twoHundredDayAverage" in info else None
+            ),
             shares_outstanding=info.get("sharesOutstanding"),
         )
 
@@ -0,0 +1,130 @@
+"""Rate limiters for data provider requests."""
+
+import asyncio
+import time
+
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class TokenBucket:
+    """Async token-bucket rate limiter.
+
+    The bucket starts full, so up to `capacity` requests can be made
+    immediately; tokens then refill continuously at `rate` tokens per second.
+    Refill is computed from elapsed monotonic time on every acquire, so long
+    requests or idle periods do not waste capacity the way a fixed delay does.
+
+    Example:
+        >>> bucket = TokenBucket(capacity=5, rate=5 / 60.0)  # 5 requests/minute
+        >>> await bucket.acquire()
+    """
+
+    def __init__(self, capacity: float, rate: float) -> None:
+        """Initialize the token bucket.
+
+        Args:
+            capacity: Maximum number of tokens (burst size)
+            rate: Refill rate in tokens per second
+
+        Raises:
+            ValueError: If capacity or rate is not positive
+        """
+        if capacity <= 0 or rate <= 0:
+            raise ValueError("Token bucket capacity and rate must be positive")
+
+        self.capacity = float(capacity)
+        self.rate = float(rate)
+        self._tokens = float(capacity)
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def per_minute(cls, requests_per_minute: int) -> "TokenBucket":
+        """Create a bucket allowing a burst of, and refilling to, N requests per minute.
+
+        Args:
+            requests_per_minute: Allowed requests per minute
+
+        Returns:
+            TokenBucket with capacity N and rate N/60 tokens per second
+        """
+        return cls(capacity=requests_per_minute, rate=requests_per_minute / 60.0)
+
+    @property
+    def tokens(self) -> float:
+        """Number of tokens currently available (refilled to now)."""
+        self._refill()
+        return self._tokens
+
+    def _refill(self) -> None:
+        """Add tokens for the time elapsed since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+
+    async def acquire(self, n: float = 1) -> None:
+        """Wait until `n` tokens are available and consume them.
+
+        Waiters are served in FIFO order: the lock is held while sleeping,
+        so later callers queue behind the one currently waiting for refill.
+
+        Args:
+            n: Number of tokens to consume
+
+        Raises:
+            ValueError: If n exceeds the bucket capacity
+        """
+        if n > self.capacity:
+            raise ValueError(f"Cannot acquire {n} tokens from bucket of capacity {self.capacity}")
+
+        async with self._lock:
+            self._refill()
+            if self._tokens < n:
+                wait = (n - self._tokens) / self.rate
+                logger.debug("rate_limit_wait", wait_seconds=wait)
+                await asyncio.sleep(wait)
+                self._refill()
+            self._tokens -= n
+
+
+class IntervalLimiter:
+    """Async limiter that spaces requests at least `interval` seconds apart.
+
+    Each caller reserves the next free slot under a lock and then sleeps
+    until it is due outside the lock, so concurrent callers are spread out
+    one interval apart instead of all observing the same last-request time
+    and bursting together.
+
+    Example:
+        >>> limiter = IntervalLimiter(0.5)
+        >>> await limiter.acquire()
+    """
+
+    def __init__(self, interval: float) -> None:
+        """Initialize the limiter.
+
+        Args:
+            interval: Minimum spacing between requests in seconds
+
+        Raises:
+            ValueError: If interval is negative
+        """
+        if interval < 0:
+            raise ValueError("Interval must not be negative")
+
+        self.interval = float(interval)
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait for this caller's request slot."""
+        async with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+
+        if slot > now:
+            logger.debug("rate_limit_wait", wait_seconds=slot - now)
+            await asyncio.sleep(slot - now)
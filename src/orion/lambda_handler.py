@@ -16,29 +16,49 @@ Environment Variables:
     ALPHA_VANTAGE_API_KEY: Required for Alpha Vantage data provider
     DATA_PROVIDER__provider: Data provider (yahoo_finance or alpha_vantage)
     NOTIFICATIONS__*: SMTP configuration for email alerts
+    CACHE__*: Provider cache kept across warm invocations (CACHE__ENABLED=false disables it)
+    DEFAULT_SYMBOLS: Comma-separated symbols for events without "symbols"
     LOG_LEVEL: Logging level (default: INFO)
     MAX_CONCURRENT: Max concurrent screenings (default: 5)
+
+Response bodies are serialized with orjson when it is installed
+(``poetry install -E fastjson``), and with the standard json module otherwise.
 """
 
 import asyncio
 import json
 import os
 import sys
-from datetime import datetime
+import time
+from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional dependency
+    orjson = None  # type: ignore[assignment]
+
+try:
+    from snapshot_restore_py import register_before_snapshot
+except ImportError:  # pragma: no cover - provided by the Lambda runtime
+    register_before_snapshot = None
+
+from pydantic import BaseModel, Field, ValidationError
+
 # Add src directory to path for Lambda imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from orion.config import Config
 from orion.core.screener import ScreeningResult, ScreeningStats, StockScreener
+from orion.data.cache import CacheManager
+from orion.data.cached_provider import CachedDataProvider
+from orion.data.models import Quote, TechnicalIndicators
 from orion.data.provider import DataProvider
-from orion.data.providers.alpha_vantage import AlphaVantageProvider
-from orion.data.providers.yahoo_finance import YahooFinanceProvider
 from orion.notifications.models import NotificationConfig
 from orion.notifications.service import NotificationService
-from orion.strategies.models import Strategy
+from orion.strategies.models import OptionRecommendation, Strategy
 from orion.strategies.parser import StrategyParser
 from orion.utils.logging import get_logger, setup_logging
 
@@ -46,10 +66,27 @@ from orion.utils.logging import get_logger, setup_logging
 DEFAULT_STRATEGY_PATH = "/opt/strategies/ofi.yaml"
 LOCAL_STRATEGY_PATH = "strategies/ofi.yaml"
 
+# Strategy directories, in lookup order: Lambda deployment, then local
+STRATEGY_DIRS = ("/opt/strategies", "strategies")
+
 
 logger = get_logger(__name__, component="LambdaHandler")
 
 
+@lru_cache(maxsize=1)
+def strategy_files() -> frozenset[str]:
+    """List the strategy files in the strategy directories, scanning them once.
+
+    The deployed directories do not change while the container is alive, so
+    one directory listing replaces a stat call per candidate path on every
+    invocation.
+
+    Returns:
+        Paths of the YAML files in STRATEGY_DIRS
+    """
+    return frozenset(str(path) for base in STRATEGY_DIRS for path in Path(base).glob("*.yaml"))
+
+
 def get_strategy_path(event_strategy: str | None) -> str:
     """Resolve strategy path from event or use default.
 
@@ -59,29 +96,49 @@ def get_strategy_path(event_strategy: str | None) -> str:
     Returns:
         Absolute path to strategy YAML file
     """
+    files = strategy_files()
+
     if not event_strategy:
         # Try Lambda deployment path first, then local
-        if Path(DEFAULT_STRATEGY_PATH).exists():
+        if DEFAULT_STRATEGY_PATH in files:
             return DEFAULT_STRATEGY_PATH
         return LOCAL_STRATEGY_PATH
 
-    # If it's a path (contains .yaml), use it directly
+    # If it's a path (contains .yaml), use it directly; only paths outside the
+    # strategy directories need a filesystem check
     if "." in event_strategy:
-        if Path(event_strategy).exists():
+        if event_strategy in files or Path(event_strategy).exists():
             return event_strategy
-        if Path(f"/opt/strategies/{event_strategy}").exists():
+        if f"/opt/strategies/{event_strategy}" in files:
             return f"/opt/strategies/{event_strategy}"
 
     # Try Lambda and local paths
-    for base in ["/opt/strategies", "strategies"]:
+    for base in STRATEGY_DIRS:
         candidate = f"{base}/{event_strategy}.yaml"
-        if Path(candidate).exists():
+        if candidate in files:
             return candidate
 
     # Fall back to default
     return DEFAULT_STRATEGY_PATH
 
 
+@lru_cache(maxsize=16)
+def parse_strategy(path: str, mtime: float) -> Strategy:
+    """Parse a strategy file, reusing the result across warm invocations.
+
+    The modification time is part of the cache key, so an edited file is
+    parsed again.
+
+    Args:
+        path: Path to the strategy YAML file
+        mtime: Modification time of the file
+
+    Returns:
+        Parsed Strategy
+    """
+    return StrategyParser().parse_file(path)
+
+
 def load_config() -> Config:
     """Load configuration from environment variables.
 
@@ -103,9 +160,7 @@ def load_notification_config() -> NotificationConfig | None:
         NotificationConfig if valid, None otherwise
     """
     try:
-        from orion.notifications.models import NotificationConfig as NotifConfig
-
-        config = NotifConfig()
+        config = NotificationConfig()
         # Validate required fields
         if not config.smtp_host or not config.from_address or not config.to_addresses:
             logger.warning("incomplete_notification_config", smtp_host=bool(config.smtp_host))
@@ -119,6 +174,9 @@ def load_notification_config() -> NotificationConfig | None:
 def get_data_provider(config: Config) -> DataProvider:
     """Get data provider instance based on configuration.
 
+    Only the selected provider's module is imported, so the other provider's
+    dependencies (aiohttp or yfinance) are never loaded.
+
     Args:
         config: Application configuration
 
@@ -128,20 +186,202 @@ def get_data_provider(config: Config) -> DataProvider:
     provider_name = config.data_provider.provider.lower()
 
     if provider_name == "alpha_vantage":
+        from orion.data.providers.alpha_vantage import AlphaVantageProvider
+
         return AlphaVantageProvider(config.data_provider)
     else:
-        return YahooFinanceProvider(rate_limit_delay=60.0 / config.data_provider.rate_limit)
+        from orion.data.providers.yahoo_finance import YahooFinanceProvider
+
+        return YahooFinanceProvider(
+            rate_limit_delay=60.0 / config.data_provider.rate_limit,
+            executor_workers=config.data_provider.executor_workers,
+        )
+
+
+def build_shared_provider(config: Config) -> DataProvider:
+    """Build the data provider shared across warm invocations.
+
+    With caching enabled the provider is wrapped in a CachedDataProvider, so
+    invocations of the same container within the configured TTLs reuse quotes,
+    history and option chains instead of fetching them again.
+
+    Args:
+        config: Application configuration
+
+    Returns:
+        DataProvider instance, cached when ``config.cache.enabled``
+    """
+    provider = get_data_provider(config)
+    if config.cache.enabled:
+        return CachedDataProvider(provider, CacheManager(config.cache))
+    return provider
+
+
+# On Lambda, resolve settings during INIT, which runs before the first billed
+# invocation with boosted CPU; warm invocations of the container reuse them.
+# Logging is configured once here rather than per invocation. Invalid settings
+# are left unresolved so the handler reports the error.
+_CONFIG: Config | None = None
+_NOTIFICATION_CONFIG: NotificationConfig | None = None
+if os.environ.get("AWS_LAMBDA_FUNCTION_NAME"):
+    setup_logging(level=os.environ.get("LOG_LEVEL", "INFO"), format_type="json")
+    try:
+        _CONFIG = load_config()
+    except Exception:
+        _CONFIG = None
+    _NOTIFICATION_CONFIG = load_notification_config()
+    _default_strategy_path = get_strategy_path(None)
+    try:
+        parse_strategy(_default_strategy_path, os.stat(_default_strategy_path).st_mtime)
+    except Exception:
+        pass  # the handler reports a missing or invalid strategy
+
+# One event loop for the lifetime of the container, so warm invocations skip loop
+# setup and the shared provider's HTTP sessions stay bound to a live loop
+_LOOP = asyncio.new_event_loop()
+
+# Data provider reused across warm invocations; see get_shared_provider. With
+# settings resolved at INIT, the selected provider is imported and built there too
+_PROVIDER: DataProvider | None = None if _CONFIG is None else build_shared_provider(_CONFIG)
+
+
+def get_shared_provider(config: Config) -> DataProvider:
+    """Get the data provider shared across invocations, creating it on first use.
+
+    Reusing the provider keeps its pooled HTTP connections, thread pool and
+    cache alive between warm invocations of the container.
+
+    Args:
+        config: Application configuration
+
+    Returns:
+        DataProvider instance
+    """
+    global _PROVIDER
+    if _PROVIDER is None:
+        _PROVIDER = build_shared_provider(config)
+    return _PROVIDER
+
+
+# Notification service reused across warm invocations, keeping its SMTP session
+_NOTIFICATION_SERVICE: NotificationService | None = None
+
+
+def get_notification_service() -> NotificationService | None:
+    """Get the notification service shared across invocations, creating it on first use.
+
+    Returns:
+        NotificationService, or None if the notification config is invalid
+    """
+    global _NOTIFICATION_SERVICE
+    if _NOTIFICATION_SERVICE is None:
+        notification_config = _NOTIFICATION_CONFIG or load_notification_config()
+        if notification_config:
+            _NOTIFICATION_SERVICE = NotificationService(notification_config)
+    return _NOTIFICATION_SERVICE
+
+
+def before_snapshot() -> None:
+    """Close the shared provider's and notifier's connections before a SnapStart snapshot.
+
+    Sockets captured in a snapshot would be dead after restore. The provider
+    and notification service reopen their connections on first use, so
+    nothing needs to run after restore; the event loop, settings and parsed
+    strategies are restored as they were at INIT.
+    """
+    if _PROVIDER is not None:
+        _LOOP.run_until_complete(_PROVIDER.aclose())
+    if _NOTIFICATION_SERVICE is not None:
+        _NOTIFICATION_SERVICE.close()
+
+
+if register_before_snapshot is not None:
+    register_before_snapshot(before_snapshot)
+
+
+def dumps(payload: Any) -> str:
+    """Serialize a response body to JSON, using orjson when it is installed."""
+    if orjson is not None:
+        body: str = orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+        return body
+    return json.dumps(payload)
+
+
+class ScreeningEvent(BaseModel):
+    """Screening parameters from a Lambda event; unknown keys are ignored."""
+
+    strategy: str | None = None
+    symbols: list[str] = Field(default_factory=list)
+    notify: bool = True
+    dry_run: bool = False
+
+
+NO_SYMBOLS_BODY = '{"error": "No symbols to screen"}'
+WARM_RESPONSE = {"statusCode": 200, "body": '{"status": "warm"}'}
+
+
+def error_body(message: str) -> str:
+    """Build an error response body, JSON-encoding only the message string."""
+    return '{"error": ' + json.dumps(message) + "}"
+
+
+def _optional_float(value: Any) -> float | None:
+    """Convert a numeric value to float, keeping None (but not 0) as None."""
+    return None if value is None else float(value)
+
+
+def _quote_dict(quote: Quote) -> dict[str, Any]:
+    """Convert a Quote to a JSON-serializable dict."""
+    return {
+        "symbol": quote.symbol,
+        "price": float(quote.price),
+        "change": _optional_float(quote.change),
+        "change_percent": _optional_float(quote.change_percent),
+        "volume": int(quote.volume),
+    }
+
+
+def _indicators_dict(indicators: TechnicalIndicators) -> dict[str, Any]:
+    """Convert the reported TechnicalIndicators fields to a JSON-serializable dict."""
+    return {
+        "sma_20": _optional_float(indicators.sma_20),
+        "sma_60": _optional_float(indicators.sma_60),
+        "rsi_14": _optional_float(indicators.rsi_14),
+    }
+
+
+def _option_dict(option: OptionRecommendation) -> dict[str, Any]:
+    """Convert an OptionRecommendation to a JSON-serializable dict."""
+    expiration = option.expiration
+    return {
+        "symbol": option.symbol,
+        "underlying_symbol": option.underlying_symbol,
+        "strike": option.strike,
+        "expiration": (expiration.isoformat() if isinstance(expiration, date) else str(expiration)),
+        "option_type": option.option_type,
+        "bid": option.bid,
+        "ask": option.ask,
+        "mid_price": option.mid_price,
+        "premium_yield": option.premium_yield,
+        "volume": option.volume,
+        "open_interest": option.open_interest,
+    }
 
 
 def serialize_screening_result(result: ScreeningResult) -> dict[str, Any]:
     """Convert ScreeningResult to JSON-serializable dict.
 
+    Only the reported fields are included; evaluation details are left out.
+
     Args:
         result: ScreeningResult to serialize
 
     Returns:
         JSON-serializable dictionary
     """
+    quote = result.quote
+    indicators = result.indicators
+    option = result.option_recommendation
     return {
         "symbol": result.symbol,
         "timestamp": result.timestamp.isoformat(),
@@ -149,61 +389,9 @@ def serialize_screening_result(result: ScreeningResult) -> dict[str, Any]:
         "signal_strength": result.signal_strength,
         "conditions_met": result.conditions_met,
         "conditions_missed": result.conditions_missed,
-        "quote": (
-            {
-                "symbol": result.quote.symbol,
-                "price": float(result.quote.price) if result.quote.price else None,
-                "change": float(result.quote.change) if result.quote.change else None,
-                "change_percent": (
-                    float(result.quote.change_percent) if result.quote.change_percent else None
-                ),
-                "volume": int(result.quote.volume) if result.quote.volume else None,
-            }
-            if result.quote
-            else None
-        ),
-        "indicators": (
-            {
-                "sma_20": (
-                    float(result.indicators.sma_20)
-                    if result.indicators and result.indicators.sma_20
-                    else None
-                ),
-                "sma_60": (
-                    float(result.indicators.sma_60)
-                    if result.indicators and result.indicators.sma_60
-                    else None
-                ),
-                "rsi_14": (
-                    float(result.indicators.rsi_14)
-                    if result.indicators and result.indicators.rsi_14
-                    else None
-                ),
-            }
-            if result.indicators
-            else None
-        ),
-        "option_recommendation": (
-            {
-                "symbol": result.option_recommendation.symbol,
-                "underlying_symbol": result.option_recommendation.underlying_symbol,
-                "strike": result.option_recommendation.strike,
-                "expiration": (
-                    result.option_recommendation.expiration.isoformat()
-                    if hasattr(result.option_recommendation.expiration, "isoformat")
-                    else str(result.option_recommendation.expiration)
-                ),
-                "option_type": result.option_recommendation.option_type,
-                "bid": result.option_recommendation.bid,
-                "ask": result.option_recommendation.ask,
-                "mid_price": result.option_recommendation.mid_price,
-                "premium_yield": result.option_recommendation.premium_yield,
-                "volume": result.option_recommendation.volume,
-                "open_interest": result.option_recommendation.open_interest,
-            }
-            if result.option_recommendation
-            else None
-        ),
+        "quote": None if quote is None else _quote_dict(quote),
+        "indicators": None if indicators is None else _indicators_dict(indicators),
+        "option_recommendation": None if option is None else _option_dict(option),
         "error": result.error,
     }
 
@@ -229,53 +417,65 @@ def serialize_stats(stats: ScreeningStats) -> dict[str, Any]:
     }
 
 
+async def _screen(
+    provider: DataProvider, symbols: list[str], strategy: Strategy, config: Config
+) -> tuple[list[ScreeningResult], ScreeningStats]:
+    """Screen symbols with the given provider and return matches and stats."""
+    screener = StockScreener(
+        provider=provider,
+        strategy=strategy,
+        max_concurrent=config.screening.max_concurrent_requests,
+    )
+    return await screener.screen_and_filter(symbols)
+
+
 async def run_screening(
     symbols: list[str],
     strategy: Strategy,
     config: Config,
     notify: bool = False,
+    provider: DataProvider | None = None,
+    dry_run: bool = False,
 ) -> dict[str, Any]:
     """Run the screening pipeline.
 
+    Matches are alerted once, after screening has finished, and the send
+    completes before this returns.
+
     Args:
         symbols: List of symbols to screen
         strategy: Trading strategy to evaluate
         config: Application configuration
         notify: Whether to send notifications for matches
+        provider: Data provider to use and leave open; by default one is
+            created from the config and closed afterwards
+        dry_run: Skip serializing the matches; only the stats are returned
 
     Returns:
         Screening results dictionary
     """
-    start_time = datetime.now()
+    started = time.monotonic()
     logger.info("screening_start", symbols_count=len(symbols), strategy=strategy.name)
 
-    # Initialize data provider
-    provider = get_data_provider(config)
-
-    # Initialize screener
-    max_concurrent = config.screening.max_concurrent_requests
-    screener = StockScreener(
-        provider=provider,
-        strategy=strategy,
-        max_concurrent=max_concurrent,
-    )
-
-    # Run screening
-    matches, stats = await screener.screen_and_filter(symbols)
+    if provider is None:
+        # Closing the provider releases any pooled HTTP connections
+        async with get_data_provider(config) as owned_provider:
+            matches, stats = await _screen(owned_provider, symbols, strategy, config)
+    else:
+        matches, stats = await _screen(provider, symbols, strategy, config)
 
-    # Serialize results
+    # Serialize results; dry runs do not return the matches
     results = {
-        "matches": [serialize_screening_result(m) for m in matches],
+        "matches": [] if dry_run else [serialize_screening_result(m) for m in matches],
         "stats": serialize_stats(stats),
         "strategy": strategy.name,
     }
 
     # Send notifications if enabled and matches found
     if notify and matches:
-        notification_config = load_notification_config()
-        if notification_config:
+        notification_service = get_notification_service()
+        if notification_service:
             try:
-                notification_service = NotificationService(notification_config)
                 await notification_service.send_batch_alerts(matches)
                 logger.info("notifications_sent", count=len(matches))
                 results["notifications_sent"] = str(len(matches))
@@ -286,12 +486,12 @@ async def run_screening(
             logger.warning("notifications_skipped", reason="invalid_config")
             results["notifications_skipped"] = "Invalid notification configuration"
 
-    duration = (datetime.now() - start_time).total_seconds()
+    duration = time.monotonic() - started
     logger.info(
         "screening_complete",
         matches_count=len(matches),
         duration_seconds=duration,
-        stats=serialize_stats(stats),
+        stats=results["stats"],
     )
 
     return results
@@ -302,6 +502,8 @@ def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
 
     This handler processes screening events from EventBridge or direct invocation.
     It parses the event, loads the strategy, runs screening, and returns results.
+    Keep-warm pings (``{"warmer": true}``) return immediately without screening;
+    the cold start they trigger still runs the module-level INIT.
 
     Args:
         event: Lambda event with screening parameters
@@ -318,9 +520,8 @@ def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
             "dry_run": false
         }
     """
-    # Configure logging from environment
-    log_level = os.environ.get("LOG_LEVEL", "INFO")
-    setup_logging(level=log_level, format_type="json")
+    if event.get("warmer"):
+        return WARM_RESPONSE
 
     request_id = getattr(context, "request_id", "unknown")
     logger = get_logger(__name__, component="LambdaHandler", request_id=request_id)
@@ -328,87 +529,80 @@ def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
     logger.info("lambda_invocation_start", event_keys=list(event.keys()))
 
     # Parse event
-    strategy_name = event.get("strategy")
-    symbols = event.get("symbols", [])
-    notify = event.get("notify", True)
-    dry_run = event.get("dry_run", False)
-
-    # Validate input
-    if not symbols:
-        logger.warning("no_symbols_provided")
+    try:
+        params = ScreeningEvent.model_validate(event)
+    except ValidationError as e:
+        logger.warning("invalid_event", error_count=e.error_count())
         return {
             "statusCode": 400,
-            "body": json.dumps({"error": "No symbols provided in event"}),
+            "body": error_body(f"Invalid event: {e}"),
         }
+    strategy_name = params.strategy
+    notify = params.notify
+    dry_run = params.dry_run
 
-    # Use default symbols if not provided (for scheduled runs)
-    if not symbols or (isinstance(symbols, list) and len(symbols) == 0):
-        symbols_str = os.environ.get("DEFAULT_SYMBOLS", "")
-        symbols = symbols_str.split(",") if symbols_str else []
-
+    # Use default symbols if none are in the event (for scheduled runs)
+    symbols = params.symbols or list(
+        filter(None, map(str.strip, os.environ.get("DEFAULT_SYMBOLS", "").split(",")))
+    )
     if not symbols:
         logger.warning("no_symbols_configured")
         return {
             "statusCode": 400,
-            "body": json.dumps({"error": "No symbols to screen"}),
+            "body": NO_SYMBOLS_BODY,
         }
 
     # Load configuration
     try:
-        config = load_config()
+        config = _CONFIG or load_config()
     except Exception as e:
         logger.error("config_load_failed", error=str(e))
         return {
             "statusCode": 500,
-            "body": json.dumps({"error": f"Configuration error: {str(e)}"}),
+            "body": error_body(f"Configuration error: {e}"),
         }
 
     # Load strategy
     try:
         strategy_path = get_strategy_path(strategy_name)
-        parser = StrategyParser()
-        strategy = parser.parse_file(strategy_path)
+        strategy = parse_strategy(strategy_path, os.stat(strategy_path).st_mtime)
         logger.info("strategy_loaded", name=strategy.name, path=strategy_path)
     except FileNotFoundError as e:
         logger.error("strategy_file_not_found", path=strategy_path, error=str(e))
         return {
             "statusCode": 404,
-            "body": json.dumps({"error": f"Strategy file not found: {strategy_path}"}),
+            "body": error_body(f"Strategy file not found: {strategy_path}"),
         }
     except Exception as e:
         logger.error("strategy_load_failed", error=str(e), error_type=type(e).__name__)
         return {
             "statusCode": 500,
-            "body": json.dumps({"error": f"Strategy load failed: {str(e)}"}),
+            "body": error_body(f"Strategy load failed: {e}"),
         }
 
-    # Run screening (async in sync context)
-    try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
+    # Run screening (async in sync context) on the container's persistent loop
     try:
-        results = loop.run_until_complete(
+        results = _LOOP.run_until_complete(
             run_screening(
                 symbols=symbols,
                 strategy=strategy,
                 config=config,
                 notify=notify and not dry_run,
+                provider=get_shared_provider(config),
+                dry_run=dry_run,
             )
         )
     except Exception as e:
         logger.error("screening_failed", error=str(e), error_type=type(e).__name__)
         return {
             "statusCode": 500,
-            "body": json.dumps({"error": f"Screening failed: {str(e)}"}),
+            "body": error_body(f"Screening failed: {e}"),
         }
 
     # Build response
     response = {
         "statusCode": 200,
-        "body": json.dumps(
+        "body": dumps(
             {
                 "request_id": request_id,
                 "timestamp": datetime.now().isoformat(),
@@ -416,7 +610,7 @@ def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
                 "symbols_processed": len(symbols),
                 "matches_found": results["stats"]["matches"],
                 "duration_seconds": results["stats"]["duration_seconds"],
-                "matches": results["matches"] if not dry_run else [],
+                "matches": results["matches"],
                 "stats": results["stats"],
             }
         ),
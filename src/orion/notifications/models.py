@@ -1,6 +1,8 @@
 """Notification configuration models."""
 
-from dataclasses import dataclass
+import os
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -16,6 +18,7 @@ class NotificationConfig:
         smtp_use_tls: Whether to use STARTTLS
         from_address: Sender email address
         to_addresses: List of recipient email addresses
+        smtp_idle_timeout: Seconds an idle SMTP connection is kept for reuse
     """
 
     enabled: bool = False
@@ -25,37 +28,26 @@ class NotificationConfig:
     smtp_password: str = ""
     smtp_use_tls: bool = True
     from_address: str = "orion@example.com"
-    to_addresses: list[str] = frozenset()  # type: ignore[assignment]
+    to_addresses: list[str] = field(default_factory=list)
     subject_prefix: str = "🎯 OFI Signal"
-
-    def __post_init__(self) -> None:
-        """Convert to_addresses to list if needed."""
-        if isinstance(self.to_addresses, frozenset):
-            object.__setattr__(self, "to_addresses", list(self.to_addresses))
+    smtp_idle_timeout: float = 240.0
 
     @classmethod
-    def from_env(cls, env: dict[str, str] | None = None) -> "NotificationConfig":
+    def from_env(cls, env: Mapping[str, str] | None = None) -> "NotificationConfig":
         """Create NotificationConfig from environment variables.
 
         Args:
-            env: Dictionary of environment variables (defaults to os.environ)
+            env: Mapping of environment variables (defaults to os.environ)
 
         Returns:
             NotificationConfig with values from environment
         """
-        import os
-
         if env is None:
-            env = dict(os.environ)
+            env = os.environ
 
         enabled = env.get("NOTIFICATIONS_ENABLED", "false").lower() == "true"
 
-        to_addresses_str = env.get("NOTIFICATION_TO", "")
-        to_addresses = (
-            [a.strip() for a in to_addresses_str.split(",") if a.strip()]
-            if to_addresses_str
-            else []
-        )
+        to_addresses = list(filter(None, map(str.strip, env.get("NOTIFICATION_TO", "").split(","))))
 
         return cls(
             enabled=enabled,
@@ -67,6 +59,7 @@ class NotificationConfig:
             from_address=env.get("NOTIFICATION_FROM", "orion@example.com"),
             to_addresses=to_addresses,
             subject_prefix=env.get("NOTIFICATION_SUBJECT_PREFIX", "🎯 OFI Signal"),
+            smtp_idle_timeout=float(env.get("SMTP_IDLE_TIMEOUT", "240")),
         )
 
     def is_valid(self) -> bool:
@@ -5,8 +5,10 @@ when screening finds matching trading opportunities.
 """
 
 import asyncio
+import threading
+import time
 from email.message import EmailMessage
-from smtplib import SMTP, SMTPException
+from smtplib import SMTP, SMTPException, SMTPServerDisconnected
 
 from orion.core.screener import ScreeningResult
 from orion.notifications.models import NotificationConfig
@@ -22,6 +24,18 @@ class NotificationService:
     screening criteria, including all relevant details about the signal
     and recommended option contracts.
 
+    The SMTP connection is kept open between sends, so repeated alerts skip
+    the connect, STARTTLS and login round trips. It is checked with NOOP
+    before reuse and reopened if the server has dropped it. Connections idle
+    for longer than ``smtp_idle_timeout`` are reopened without the check,
+    since NAT gateways silently drop idle TCP flows and a NOOP on such a
+    socket only fails after the full socket timeout. Call close() to end the
+    session.
+
+    Blocking smtplib calls run in the default executor. Sends on the shared
+    session are serialized by a lock, so each batch occupies one worker
+    thread at a time.
+
     Example:
         >>> config = NotificationConfig.from_env()
         >>> service = NotificationService(config)
@@ -36,6 +50,10 @@ class NotificationService:
         """
         self.config = config
         self._logger = logger
+        self._to_header = ", ".join(config.to_addresses)
+        self._smtp: SMTP | None = None
+        self._smtp_last_used = 0.0
+        self._smtp_lock = threading.Lock()
 
     def is_enabled(self) -> bool:
         """Check if notifications are enabled and configured.
@@ -73,7 +91,7 @@ class NotificationService:
             message = self._build_email_message(result)
 
             # Send email in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             success = await loop.run_in_executor(None, self._send_email_sync, message)
 
             if success:
@@ -102,6 +120,10 @@ class NotificationService:
     async def send_batch_alerts(self, results: list[ScreeningResult]) -> int:
         """Send alerts for multiple screening results.
 
+        Several matches are combined into one summary email, so a batch costs
+        a single SMTP send however many symbols matched; a single match gets
+        its individual alert instead.
+
         Args:
             results: List of screening results
 
@@ -111,6 +133,13 @@ class NotificationService:
         if not results:
             return 0
 
+        if not self.is_enabled():
+            self._logger.debug(
+                "notifications_disabled",
+                reason="Configuration not valid or notifications disabled",
+            )
+            return 0
+
         # Filter to matches only
         matches = [r for r in results if r.matches]
 
@@ -126,7 +155,7 @@ class NotificationService:
         try:
             message = self._build_summary_email(matches)
 
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             success = await loop.run_in_executor(None, self._send_email_sync, message)
 
             if success:
@@ -156,10 +185,7 @@ class NotificationService:
         Returns:
             Formatted EmailMessage
         """
-        message = EmailMessage()
-        message["From"] = self.config.from_address
-        message["To"] = ", ".join(self.config.to_addresses)
-        message["Subject"] = f"{self.config.subject_prefix}: {result.symbol}"
+        message = self._new_message(f"{self.config.subject_prefix}: {result.symbol}")
 
         message.set_content(self._build_plain_text_body(result), subtype="plain")
         message.add_alternative(self._build_html_body(result), subtype="html")
@@ -175,16 +201,28 @@ class NotificationService:
         Returns:
             Formatted EmailMessage
         """
-        message = EmailMessage()
-        message["From"] = self.config.from_address
-        message["To"] = ", ".join(self.config.to_addresses)
-        message["Subject"] = f"{self.config.subject_prefix}: {len(results)} New Matches"
+        message = self._new_message(f"{self.config.subject_prefix}: {len(results)} New Matches")
 
         message.set_content(self._build_summary_plain_text(results), subtype="plain")
         message.add_alternative(self._build_summary_html(results), subtype="html")
 
         return message
 
+    def _new_message(self, subject: str) -> EmailMessage:
+        """Create an email message with the configured sender and recipients.
+
+        Args:
+            subject: Subject line
+
+        Returns:
+            EmailMessage with From, To and Subject set
+        """
+        message = EmailMessage()
+        message["From"] = self.config.from_address
+        message["To"] = self._to_header
+        message["Subject"] = subject
+        return message
+
     def _build_html_body(self, result: ScreeningResult) -> str:
         """Build HTML email body for a single result.
 
@@ -197,12 +235,14 @@ class NotificationService:
         signal_strength_pct = result.signal_strength * 100
 
         # Build conditions list HTML
-        conditions_html = "<ul>"
-        for condition in result.conditions_met:
-            conditions_html += f'<li style="color: #10b981;">✓ {condition}</li>'
-        for condition in result.conditions_missed:
-            conditions_html += f'<li style="color: #ef4444;">✗ {condition}</li>'
-        conditions_html += "</ul>"
+        conditions_html = "".join(
+            [
+                "<ul>",
+                *(f'<li style="color: #10b981;">✓ {c}</li>' for c in result.conditions_met),
+                *(f'<li style="color: #ef4444;">✗ {c}</li>' for c in result.conditions_missed),
+                "</ul>",
+            ]
+        )
 
         # Build option recommendation HTML if available
         option_html = "<p>No option recommendation available.</p>"
@@ -229,8 +269,8 @@ class NotificationService:
         if result.quote:
             q = result.quote
             change_val = float(q.change) if q.change else 0.0
-            change_color = "#10b981" if q.change and q.change > 0 else "#ef4444"
-            change_symbol = "+" if q.change and q.change > 0 else ""
+            change_color = "#10b981" if change_val > 0 else "#ef4444"
+            change_symbol = "+" if change_val > 0 else ""
             change_pct = q.change_percent if q.change_percent is not None else 0.0
             quote_html = f"""
             <div style="margin-bottom: 15px;">
@@ -292,19 +332,7 @@ class NotificationService:
         Returns:
             HTML formatted email body
         """
-        rows_html = ""
-        for result in results:
-            strength_pct = result.signal_strength * 100
-            price = f"${float(result.quote.price):.2f}" if result.quote else "N/A"
-            rows_html += f"""
-            <tr style="border-bottom: 1px solid #e5e7eb;">
-                <td style="padding: 12px;"><strong>{result.symbol}</strong></td>
-                <td style="padding: 12px;">{price}</td>
-                <td style="padding: 12px;"><span style="color: #{self._strength_color(result.signal_strength)}; font-weight: bold;">{strength_pct:.0f}%</span></td>
-                <td style="padding: 12px;">{", ".join(result.conditions_met)}</td>
-                <td style="padding: 12px;">{f"{result.option_recommendation.premium_yield:.1%}" if result.option_recommendation else "N/A"}</td>
-            </tr>
-            """
+        rows_html = "".join(map(self._build_summary_row, results))
 
         html = f"""
         <!DOCTYPE html>
@@ -349,6 +377,27 @@ class NotificationService:
 
         return html
 
+    def _build_summary_row(self, result: ScreeningResult) -> str:
+        """Build one HTML table row of the summary email.
+
+        Args:
+            result: Screening result
+
+        Returns:
+            HTML table row
+        """
+        strength_pct = result.signal_strength * 100
+        price = f"${float(result.quote.price):.2f}" if result.quote else "N/A"
+        return f"""
+            <tr style="border-bottom: 1px solid #e5e7eb;">
+                <td style="padding: 12px;"><strong>{result.symbol}</strong></td>
+                <td style="padding: 12px;">{price}</td>
+                <td style="padding: 12px;"><span style="color: #{self._strength_color(result.signal_strength)}; font-weight: bold;">{strength_pct:.0f}%</span></td>
+                <td style="padding: 12px;">{", ".join(result.conditions_met)}</td>
+                <td style="padding: 12px;">{f"{result.option_recommendation.premium_yield:.1%}" if result.option_recommendation else "N/A"}</td>
+            </tr>
+            """
+
     def _build_plain_text_body(self, result: ScreeningResult) -> str:
         """Build plain text email body.
 
@@ -449,6 +498,57 @@ class NotificationService:
         else:
             return "ef4444"  # Red
 
+    def close(self) -> None:
+        """Close the SMTP connection, if one is open."""
+        with self._smtp_lock:
+            self._close_smtp()
+
+    def _close_smtp(self) -> None:
+        """Quit and drop the SMTP connection; the caller holds the lock."""
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except (SMTPException, OSError):
+                self._smtp.close()
+            self._smtp = None
+
+    def _discard_smtp(self) -> None:
+        """Close a connection the server dropped, without QUIT; the caller holds the lock."""
+        if self._smtp is not None:
+            self._smtp.close()
+            self._smtp = None
+
+    def _get_smtp(self) -> SMTP:
+        """Get a live SMTP connection, reusing the open one if it answers NOOP.
+
+        The caller holds the lock.
+        """
+        if self._smtp is not None:
+            if time.monotonic() - self._smtp_last_used > self.config.smtp_idle_timeout:
+                # Likely dropped silently; QUIT could block for the socket timeout
+                self._discard_smtp()
+            else:
+                try:
+                    if self._smtp.noop()[0] == 250:
+                        return self._smtp
+                except (SMTPException, OSError):
+                    pass
+                self._close_smtp()
+
+        server = SMTP(self.config.smtp_host, self.config.smtp_port, timeout=30)
+        try:
+            if self.config.smtp_use_tls:
+                server.starttls()
+
+            if self.config.smtp_user and self.config.smtp_password:
+                server.login(self.config.smtp_user, self.config.smtp_password)
+        except BaseException:
+            server.close()
+            raise
+
+        self._smtp = server
+        return server
+
     def _send_email_sync(self, message: EmailMessage) -> bool:
         """Send email message synchronously.
 
@@ -459,14 +559,14 @@ class NotificationService:
             True if sent successfully
         """
         try:
-            with SMTP(self.config.smtp_host, self.config.smtp_port, timeout=30) as server:
-                if self.config.smtp_use_tls:
-                    server.starttls()
-
-                if self.config.smtp_user and self.config.smtp_password:
-                    server.login(self.config.smtp_user, self.config.smtp_password)
-
-                server.send_message(message)
+            with self._smtp_lock:
+                try:
+                    self._get_smtp().send_message(message)
+                except SMTPServerDisconnected:
+                    # Dropped between the NOOP check and the send; retry once
+                    self._discard_smtp()
+                    self._get_smtp().send_message(message)
+                self._smtp_last_used = time.monotonic()
 
             return True
 
@@ -4,18 +4,23 @@ This module provides the RuleEvaluator class for determining whether a stock
 matches all entry conditions defined in a trading strategy.
 """
 
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
 from orion.analysis.indicators import IndicatorCalculator
 from orion.analysis.patterns import PatternDetector
-from orion.data.models import OHLCV, Quote, TechnicalIndicators
+from orion.data.models import OHLCV, OhlcvSeries, Quote, TechnicalIndicators
 from orion.strategies.models import Condition, EvaluationResult, Strategy
 from orion.utils.logging import get_logger
 
 logger = get_logger(__name__, component="RuleEvaluator")
 
+ConditionCheck = Callable[
+    [Quote, "list[OHLCV] | OhlcvSeries", TechnicalIndicators], "ConditionResult"
+]
+
 
 class RuleEvaluator:
     """Evaluate stocks against trading strategy entry conditions.
@@ -40,12 +45,14 @@ class RuleEvaluator:
         self.indicator_calc = IndicatorCalculator()
         self.pattern_detector = PatternDetector()
         self._logger = logger
+        self._checks = self.compile_conditions()
+        self._total_weight = sum(condition.weight for condition in strategy.entry_conditions)
 
     async def evaluate(
         self,
         symbol: str,
         quote: Quote,
-        historical: list[OHLCV],
+        historical: list[OHLCV] | OhlcvSeries,
         indicators: TechnicalIndicators,
     ) -> EvaluationResult:
         """Evaluate if a symbol matches all strategy entry conditions.
@@ -63,22 +70,17 @@ class RuleEvaluator:
 
         conditions_met: list[str] = []
         conditions_missed: list[str] = []
-        total_weight = 0.0
+        total_weight = self._total_weight
         score = 0.0
         details: dict[str, Any] = {}
 
-        for condition in self.strategy.entry_conditions:
-            weight = condition.weight
-            total_weight += weight
-
+        for condition, check in self._checks:
             try:
-                condition_result = self._evaluate_condition(
-                    condition, symbol, quote, historical, indicators
-                )
+                condition_result = check(quote, historical, indicators)
 
                 if condition_result.matches:
                     conditions_met.append(condition.type)
-                    score += weight
+                    score += condition.weight
                     details[condition.type] = {
                         "status": "met",
                         "value": condition_result.value,
@@ -106,7 +108,7 @@ class RuleEvaluator:
                 }
 
         # All conditions must be met for a match
-        matches = len(conditions_met) == len(self.strategy.entry_conditions)
+        matches = len(conditions_met) == len(self._checks)
 
         # Calculate signal strength
         signal_strength = score / total_weight if total_weight > 0 else 0.0
@@ -117,7 +119,7 @@ class RuleEvaluator:
             strategy=self.strategy.name,
             matches=matches,
             conditions_met=len(conditions_met),
-            total_conditions=len(self.strategy.entry_conditions),
+            total_conditions=len(self._checks),
             signal_strength=signal_strength,
         )
 
@@ -132,54 +134,53 @@ class RuleEvaluator:
             details=details,
         )
 
-    def _evaluate_condition(
-        self,
-        condition: Condition,
-        symbol: str,
-        quote: Quote,
-        historical: list[OHLCV],
-        indicators: TechnicalIndicators,
-    ) -> "ConditionResult":
-        """Evaluate a single condition.
+    def compile_conditions(self) -> tuple[tuple[Condition, ConditionCheck], ...]:
+        """Resolve every entry condition of the strategy to its checker.
+
+        The condition list is the same for every symbol, so the dispatch on
+        condition type is done once here instead of on each evaluation.
+
+        Returns:
+            Tuple of (condition, check) pairs in strategy order; each check takes
+            (quote, historical, indicators) and returns a ConditionResult
+        """
+        return tuple(
+            (condition, self._compile_condition(condition))
+            for condition in self.strategy.entry_conditions
+        )
+
+    def _compile_condition(self, condition: Condition) -> ConditionCheck:
+        """Bind a condition to the checker for its type.
 
         Args:
-            condition: The condition to evaluate
-            symbol: Stock symbol
-            quote: Current quote data
-            historical: Historical OHLCV data
-            indicators: Technical indicators
+            condition: The condition to compile
 
         Returns:
-            ConditionResult with match status, value, and optional reason
+            Callable taking (quote, historical, indicators)
         """
-        # Trend condition: SMA_20 > SMA_60 (bullish trend)
         if condition.type == "trend":
-            return self._check_trend(condition, indicators)
-
-        # Oversold condition: RSI < 30 (or within lookback period)
+            return lambda quote, historical, indicators: self._check_trend(condition, indicators)
         elif condition.type == "oversold":
-            return self._check_oversold(condition, indicators, historical)
-
-        # Bounce condition: Higher high + higher low pattern
+            return lambda quote, historical, indicators: self._check_oversold(
+                condition, indicators, historical
+            )
         elif condition.type == "bounce":
-            return self._check_bounce(condition, historical)
-
-        # Price condition: Price-based checks
+            return lambda quote, historical, indicators: self._check_bounce(condition, historical)
         elif condition.type == "price":
-            return self._check_price(condition, quote)
-
-        # Volume condition: Volume-based checks
+            return lambda quote, historical, indicators: self._check_price(condition, quote)
         elif condition.type == "volume":
-            return self._check_volume(condition, quote, historical)
-
-        else:
-            self._logger.warning("unknown_condition_type", condition_type=condition.type)
-            return ConditionResult(
-                matches=False,
-                value=None,
-                reason=f"Unknown condition type: {condition.type}",
+            return lambda quote, historical, indicators: self._check_volume(
+                condition, quote, historical
             )
 
+        self._logger.warning("unknown_condition_type", condition_type=condition.type)
+        unknown = ConditionResult(
+            matches=False,
+            value=None,
+            reason=f"Unknown condition type: {condition.type}",
+        )
+        return lambda quote, historical, indicators: unknown
+
     def _check_trend(
         self, condition: Condition, indicators: TechnicalIndicators
     ) -> "ConditionResult":
@@ -224,7 +225,7 @@ class RuleEvaluator:
         self,
         condition: Condition,
         indicators: TechnicalIndicators,
-        historical: list[OHLCV],
+        historical: list[OHLCV] | OhlcvSeries,
     ) -> "ConditionResult":
         """Check oversold condition (RSI < 30).
 
@@ -261,10 +262,10 @@ class RuleEvaluator:
 
         # Check if RSI was below threshold within lookback period
         elif condition.rule == "rsi_was_below":
-            if not historical or len(historical) < 15:
+            if len(historical) < 15:
                 return ConditionResult(
                     matches=False,
-                    value={"data_points": len(historical) if historical else 0},
+                    value={"data_points": len(historical)},
                     reason="Insufficient historical data for RSI lookback",
                 )
 
@@ -274,21 +275,15 @@ class RuleEvaluator:
                 else len(historical) - 15
             )
 
+            # RSI as of every bar in one pass; rsi[i] is the RSI of the first i + 1 bars
+            rsi = self.indicator_calc.rsi_series(historical)
+
             for i in range(len(historical) - 15, max(len(historical) - 15 - lookback - 1, 0), -1):
-                try:
-                    subset = historical[: i + 1]
-                    if len(subset) >= 15:
-                        temp_indicators = self.indicator_calc.calculate(subset, "lookback")
-                        if (
-                            temp_indicators.rsi_14 is not None
-                            and temp_indicators.rsi_14 < threshold
-                        ):
-                            return ConditionResult(
-                                matches=True,
-                                value={"rsi_found": temp_indicators.rsi_14, "threshold": threshold},
-                            )
-                except Exception:
-                    continue
+                if rsi[i] < threshold:
+                    return ConditionResult(
+                        matches=True,
+                        value={"rsi_found": float(rsi[i]), "threshold": threshold},
+                    )
 
             return ConditionResult(
                 matches=False,
@@ -313,7 +308,9 @@ class RuleEvaluator:
             reason=f"Unknown oversold rule: {condition.rule}",
         )
 
-    def _check_bounce(self, condition: Condition, historical: list[OHLCV]) -> "ConditionResult":
+    def _check_bounce(
+        self, condition: Condition, historical: list[OHLCV] | OhlcvSeries
+    ) -> "ConditionResult":
         """Check bounce pattern condition (higher high + higher low).
 
         Args:
@@ -323,10 +320,10 @@ class RuleEvaluator:
         Returns:
             ConditionResult with match status
         """
-        if not historical or len(historical) < 2:
+        if len(historical) < 2:
             return ConditionResult(
                 matches=False,
-                value={"data_points": len(historical) if historical else 0},
+                value={"data_points": len(historical)},
                 reason="Insufficient data for bounce detection",
             )
 
@@ -399,7 +396,7 @@ class RuleEvaluator:
         self,
         condition: Condition,
         quote: Quote,
-        historical: list[OHLCV],
+        historical: list[OHLCV] | OhlcvSeries,
     ) -> "ConditionResult":
         """Check volume-based condition.
 
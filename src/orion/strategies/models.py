@@ -144,7 +144,7 @@ class EvaluationResult:
     details: dict[str, Any] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OptionRecommendation:
     """A recommended option contract for trading.
 
@@ -88,12 +88,10 @@ def get_logger(name: str | None = None, **initial_values: Any) -> Any:  # type:
         >>> logger = get_logger(__name__, component="screener")
         >>> logger.info("screening_started", symbols_count=500)
     """
-    logger = structlog.get_logger(name)
-
-    if initial_values:
-        logger = logger.bind(**initial_values)
-
-    return logger
+    # Pass initial values through the lazy proxy rather than calling bind() here:
+    # binding eagerly would freeze the configuration in effect at import time, so
+    # module-level loggers would ignore the level later set by setup_logging().
+    return structlog.get_logger(name, **initial_values)
 
 
 # Create a default logger for the package
@@ -67,7 +67,7 @@ async def test_get_historical_prices_real_data(
     end = date.today()
     start = end - timedelta(days=30)
 
-    data = await provider.get_historical_prices("IBM", start, end, interval="1d")
+    data = (await provider.get_historical_prices("IBM", start, end, interval="1d")).to_ohlcv_list()
 
     assert len(data) > 0
     assert len(data) <= 30  # Should have at most 30 days of data
@@ -212,7 +212,7 @@ async def test_historical_weekly_data(provider: AlphaVantageProvider) -> None:
     end = date.today()
     start = end - timedelta(weeks=12)  # 12 weeks
 
-    data = await provider.get_historical_prices("IBM", start, end, interval="1wk")
+    data = (await provider.get_historical_prices("IBM", start, end, interval="1wk")).to_ohlcv_list()
 
     assert len(data) > 0
     # Should have roughly 12 weeks of data
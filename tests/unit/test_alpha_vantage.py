@@ -0,0 +1,358 @@
+"""Unit tests for the Alpha Vantage provider (no network access)."""
+
+from collections.abc import Iterator
+from datetime import date
+from types import SimpleNamespace
+from typing import Any
+
+import numpy as np
+import pytest
+from orion.config import DataProviderConfig
+from orion.data.providers.alpha_vantage import AlphaVantageProvider, _dates_in_range
+
+
+@pytest.fixture
+def provider() -> AlphaVantageProvider:
+    """Create Alpha Vantage provider with a dummy API key."""
+    return AlphaVantageProvider(DataProviderConfig(api_key="test_key", rate_limit=5))
+
+
+class TestSessionLifecycle:
+    """Tests for the shared HTTP session."""
+
+    async def test_session_is_reused(self, provider: AlphaVantageProvider) -> None:
+        """The same session is returned for subsequent requests."""
+        session = await provider._get_session()
+
+        assert await provider._get_session() is session
+
+        await provider.aclose()
+
+    async def test_aclose_closes_session(self, provider: AlphaVantageProvider) -> None:
+        """aclose closes the session and a new one is created afterwards."""
+        session = await provider._get_session()
+
+        await provider.aclose()
+
+        assert session.closed
+        new_session = await provider._get_session()
+        assert new_session is not session
+        await provider.aclose()
+
+    async def test_context_manager_closes_session(self) -> None:
+        """Exiting the async context closes the session."""
+        config = DataProviderConfig(api_key="test_key", rate_limit=5)
+        async with AlphaVantageProvider(config) as provider:
+            session = await provider._get_session()
+
+        assert session.closed
+
+    async def test_session_connector_keeps_connections_alive(
+        self, provider: AlphaVantageProvider
+    ) -> None:
+        """The shared session pools keep-alive connections and caches DNS."""
+        session = await provider._get_session()
+        connector = session.connector
+        assert connector is not None
+
+        assert connector.limit == 10
+        assert connector.limit_per_host == 5
+        assert connector._keepalive_timeout == AlphaVantageProvider.KEEPALIVE_TIMEOUT
+        assert connector.use_dns_cache
+
+        await provider.aclose()
+
+    async def test_connector_limits_come_from_config(self) -> None:
+        """Connection limits are taken from the provider config."""
+        config = DataProviderConfig(
+            api_key="test_key", rate_limit=5, max_connections=3, max_connections_per_host=2
+        )
+        async with AlphaVantageProvider(config) as provider:
+            connector = (await provider._get_session()).connector
+            assert connector is not None
+
+            assert connector.limit == 3
+            assert connector.limit_per_host == 2
+
+
+class FakeResponse:
+    """Minimal aiohttp response returning a fixed body."""
+
+    def __init__(self, status: int, body: bytes) -> None:
+        """Store the status and body."""
+        self.status = status
+        self.body = body
+
+    async def __aenter__(self) -> "FakeResponse":
+        """Enter the response context."""
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Exit the response context."""
+
+    async def read(self) -> bytes:
+        """Return the raw body."""
+        return self.body
+
+
+class TestAiohttpRequests:
+    """Tests for requests through the aiohttp session."""
+
+    async def test_json_body_decoded_from_bytes(self, provider: AlphaVantageProvider) -> None:
+        """The raw response bytes are decoded as JSON."""
+        session = SimpleNamespace(
+            get=lambda url, params: FakeResponse(200, b'{"Symbol": "IBM", "Name": "\\u00c9"}')
+        )
+
+        async def fake_get_session() -> SimpleNamespace:
+            return session
+
+        provider._get_session = fake_get_session  # type: ignore[method-assign]
+
+        data = await provider._make_request("OVERVIEW", "IBM")
+
+        assert data == {"Symbol": "IBM", "Name": "\u00c9"}
+
+    async def test_error_status_raises(self, provider: AlphaVantageProvider) -> None:
+        """Non-200 responses raise RuntimeError."""
+        session = SimpleNamespace(get=lambda url, params: FakeResponse(500, b""))
+
+        async def fake_get_session() -> SimpleNamespace:
+            return session
+
+        provider._get_session = fake_get_session  # type: ignore[method-assign]
+
+        with pytest.raises(RuntimeError, match="HTTP 500"):
+            await provider._make_request("OVERVIEW", "IBM")
+
+
+class TestHttp2Client:
+    """Tests for the optional HTTP/2 httpx client."""
+
+    async def test_requests_use_http2_client(self) -> None:
+        """With http2 enabled, requests go through the shared httpx client."""
+        httpx = pytest.importorskip("httpx")
+
+        seen_params: list[dict[str, str]] = []
+
+        def handler(request: "httpx.Request") -> "httpx.Response":
+            seen_params.append(dict(request.url.params))
+            return httpx.Response(200, json={"Symbol": "IBM", "Name": "IBM"})
+
+        config = DataProviderConfig(api_key="test_key", rate_limit=5, http2=True)
+        async with AlphaVantageProvider(config) as provider:
+            provider._http2_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+            data = await provider._make_request("OVERVIEW", "IBM")
+
+            assert data["Symbol"] == "IBM"
+            assert provider._session is None
+            client = provider._http2_client
+
+        assert seen_params == [{"function": "OVERVIEW", "symbol": "IBM", "apikey": "test_key"}]
+        assert client.is_closed
+
+    async def test_http2_error_status_raises(self) -> None:
+        """Non-200 responses from the httpx client raise RuntimeError."""
+        httpx = pytest.importorskip("httpx")
+
+        config = DataProviderConfig(api_key="test_key", rate_limit=5, http2=True)
+        async with AlphaVantageProvider(config) as provider:
+            provider._http2_client = httpx.AsyncClient(
+                transport=httpx.MockTransport(lambda request: httpx.Response(503))
+            )
+
+            with pytest.raises(RuntimeError, match="HTTP 503"):
+                await provider._make_request("OVERVIEW", "IBM")
+
+
+class TestHistoricalPrices:
+    """Tests for parsing the time series response."""
+
+    async def test_parses_filters_and_sorts_bars(self, provider: AlphaVantageProvider) -> None:
+        """Bars in the date range are parsed into sorted columns."""
+
+        def bar(price: str, volume: str) -> dict[str, str]:
+            return {
+                "1. open": price,
+                "2. high": price,
+                "3. low": price,
+                "4. close": price,
+                "5. volume": volume,
+            }
+
+        async def fake_request(function: str, symbol: str, **params: str) -> dict:
+            return {
+                "Meta Data": {},
+                "Time Series (Daily)": {
+                    "2024-01-04": bar("103.5", "300"),
+                    "2024-01-02": bar("101.25", "100"),
+                    "2024-01-03": bar("102.0", "200"),
+                    "2023-12-29": bar("99.0", "50"),
+                },
+            }
+
+        provider._make_request = fake_request  # type: ignore[method-assign]
+
+        series = await provider.get_historical_prices("IBM", date(2024, 1, 1), date(2024, 1, 31))
+
+        assert [str(ts)[:10] for ts in series.timestamps] == [
+            "2024-01-02",
+            "2024-01-03",
+            "2024-01-04",
+        ]
+        assert series.close.tolist() == [101.25, 102.0, 103.5]
+        assert series.volume.dtype == np.int64
+        assert series.volume.tolist() == [100, 200, 300]
+
+    @pytest.mark.parametrize(
+        ("interval", "function"),
+        [
+            ("1d", "TIME_SERIES_DAILY"),
+            ("1wk", "TIME_SERIES_WEEKLY"),
+            ("1mo", "TIME_SERIES_MONTHLY"),
+        ],
+    )
+    async def test_interval_selects_function(self, interval: str, function: str) -> None:
+        """Each interval maps to its time series function with the configured output size."""
+        config = DataProviderConfig(api_key="test_key", rate_limit=5, output_size="full")
+        provider = AlphaVantageProvider(config)
+        requests: list[tuple[str, dict[str, str]]] = []
+
+        async def fake_request(function: str, symbol: str, **params: str) -> dict:
+            requests.append((function, params))
+            return {"Time Series": {}}
+
+        provider._make_request = fake_request  # type: ignore[method-assign]
+
+        await provider.get_historical_prices("IBM", date(2024, 1, 1), date(2024, 1, 31), interval)
+
+        assert requests == [(function, {"outputsize": "full"})]
+
+    async def test_unsupported_interval_raises(self, provider: AlphaVantageProvider) -> None:
+        """Intervals without a time series function raise ValueError."""
+        with pytest.raises(ValueError, match="Unsupported interval"):
+            await provider.get_historical_prices("IBM", date(2024, 1, 1), date(2024, 1, 31), "1h")
+
+    async def test_empty_range_returns_empty_series(self, provider: AlphaVantageProvider) -> None:
+        """A range with no bars yields an empty series."""
+
+        async def fake_request(function: str, symbol: str, **params: str) -> dict:
+            return {"Time Series (Daily)": {}}
+
+        provider._make_request = fake_request  # type: ignore[method-assign]
+
+        series = await provider.get_historical_prices("IBM", date(2024, 1, 1), date(2024, 1, 31))
+
+        assert len(series) == 0
+
+
+class TestCompanyOverview:
+    """Tests for parsing the OVERVIEW response."""
+
+    async def test_maps_and_converts_fields(self, provider: AlphaVantageProvider) -> None:
+        """Numeric fields are converted and missing or 'None' values become None."""
+
+        async def fake_request(function: str, symbol: str, **params: str) -> dict:
+            return {
+                "Symbol": "IBM",
+                "Name": "International Business Machines",
+                "Exchange": "NYSE",
+                "Sector": "TECHNOLOGY",
+                "MarketCapitalization": "150000000000",
+                "RevenueTTM": "61860000000.0",
+                "PERatio": "22.5",
+                "PEGRatio": "None",
+                "Beta": "not a number",
+            }
+
+        provider._make_request = fake_request  # type: ignore[method-assign]
+
+        overview = await provider.get_company_overview("IBM")
+
+        assert overview.name == "International Business Machines"
+        assert overview.market_cap == 150_000_000_000
+        assert overview.revenue == 61_860_000_000
+        assert overview.pe_ratio == 22.5
+        assert overview.peg_ratio is None
+        assert overview.beta is None
+        assert overview.eps is None
+        assert overview.industry is None
+
+
+class TestApiErrors:
+    """Tests for detecting Alpha Vantage error payloads."""
+
+    @pytest.mark.parametrize(
+        ("payload", "match"),
+        [
+            ({"Error Message": "Invalid API call"}, "Invalid API call"),
+            ({"Note": "Thank you for using Alpha Vantage!"}, "rate limit"),
+            ({"Information": "Our standard API rate limit is 25 requests per day."}, "rate limit"),
+        ],
+    )
+    async def test_error_payloads_raise(
+        self, provider: AlphaVantageProvider, payload: dict[str, str], match: str
+    ) -> None:
+        """Error, Note and Information payloads raise RuntimeError."""
+
+        async def fake_get_json(params: dict[str, str]) -> dict[str, str]:
+            return payload
+
+        provider._get_json = fake_get_json  # type: ignore[method-assign]
+
+        with pytest.raises(RuntimeError, match=match):
+            await provider._make_request("OVERVIEW", "IBM")
+
+
+class TestDatesInRange:
+    """Tests for selecting time series dates within a range."""
+
+    def test_newest_first_stops_before_start(self) -> None:
+        """Dates after the end are skipped and the scan stops before the start."""
+
+        class RecordingDict(dict[str, Any]):
+            """Dict recording how many keys were iterated."""
+
+            visited = 0
+
+            def __iter__(self) -> Iterator[str]:
+                for key in super().__iter__():
+                    RecordingDict.visited += 1
+                    yield key
+
+        series = RecordingDict.fromkeys(
+            ["2024-02-01", "2024-01-04", "2024-01-03", "2024-01-02", "2023-12-29", "2023-12-28"]
+        )
+
+        dates = _dates_in_range(series, "2024-01-01", "2024-01-31")
+
+        assert dates == ["2024-01-02", "2024-01-03", "2024-01-04"]
+        assert RecordingDict.visited == 5
+
+    def test_unordered_series_falls_back_to_sorting(self) -> None:
+        """Dates that are not newest first are filtered and sorted."""
+        series = dict.fromkeys(["2024-01-02", "2024-01-04", "2024-01-03"])
+
+        assert _dates_in_range(series, "2024-01-01", "2024-01-31") == [
+            "2024-01-02",
+            "2024-01-03",
+            "2024-01-04",
+        ]
+
+    def test_oldest_first_series_starting_before_range_is_sorted(self) -> None:
+        """An ascending series whose first date precedes the start is not cut short."""
+        series = dict.fromkeys(f"2024-01-0{day}" for day in range(1, 10))
+
+        assert _dates_in_range(series, "2024-01-03", "2024-01-06") == [
+            "2024-01-03",
+            "2024-01-04",
+            "2024-01-05",
+            "2024-01-06",
+        ]
+
+    def test_newest_first_series_entirely_before_range(self) -> None:
+        """A newest-first series that ends before the start yields no dates."""
+        series = dict.fromkeys(["2023-12-29", "2023-12-28", "2023-12-27"])
+
+        assert _dates_in_range(series, "2024-01-01", "2024-01-31") == []
@@ -1,9 +1,10 @@
 """Tests for cache manager."""
 
+import asyncio
 
 import pytest
 from orion.config import CacheConfig
-from orion.data.cache import CacheManager
+from orion.data.cache import CacheManager, _FastTTL
 
 
 class TestCacheManager:
@@ -25,20 +26,20 @@ class TestCacheManager:
         """Create cache manager instance."""
         return CacheManager(cache_config)
 
-    async def test_cache_set_and_get(self, cache_manager: CacheManager) -> None:
+    def test_cache_set_and_get(self, cache_manager: CacheManager) -> None:
         """Cache stores and retrieves values."""
-        await cache_manager.set("quote", "AAPL", {"price": 150.0})
-        value = await cache_manager.get("quote", "AAPL")
+        cache_manager.set("quote", "AAPL", {"price": 150.0})
+        value = cache_manager.get("quote", "AAPL")
 
         assert value is not None
         assert value["price"] == 150.0
 
-    async def test_cache_miss(self, cache_manager: CacheManager) -> None:
+    def test_cache_miss(self, cache_manager: CacheManager) -> None:
         """Cache returns None on miss."""
-        value = await cache_manager.get("quote", "NONEXISTENT")
+        value = cache_manager.get("quote", "NONEXISTENT")
         assert value is None
 
-    async def test_cache_disabled(self) -> None:
+    def test_cache_disabled(self) -> None:
         """Cache returns None when disabled."""
         config = CacheConfig(
             enabled=False,
@@ -49,15 +50,15 @@ class TestCacheManager:
         )
         cache_manager = CacheManager(config)
 
-        await cache_manager.set("quote", "AAPL", {"price": 150.0})
-        value = await cache_manager.get("quote", "AAPL")
+        cache_manager.set("quote", "AAPL", {"price": 150.0})
+        value = cache_manager.get("quote", "AAPL")
 
         assert value is None
 
     async def test_get_or_fetch_cache_hit(self, cache_manager: CacheManager) -> None:
         """get_or_fetch returns cached value."""
         # Pre-populate cache
-        await cache_manager.set("quote", "AAPL", {"price": 150.0})
+        cache_manager.set("quote", "AAPL", {"price": 150.0})
 
         # Should return cached value without calling fetch
         fetch_called = False
@@ -92,41 +93,41 @@ class TestCacheManager:
         assert value2["price"] == 150.0
         assert not fetch_called
 
-    async def test_cache_invalidation(self, cache_manager: CacheManager) -> None:
+    def test_cache_invalidation(self, cache_manager: CacheManager) -> None:
         """Cache invalidation works correctly."""
-        await cache_manager.set("quote", "AAPL", {"price": 150.0})
-        await cache_manager.set("quote", "MSFT", {"price": 300.0})
+        cache_manager.set("quote", "AAPL", {"price": 150.0})
+        cache_manager.set("quote", "MSFT", {"price": 300.0})
 
         # Invalidate specific key
         cache_manager.invalidate("quote", "AAPL")
 
-        apple = await cache_manager.get("quote", "AAPL")
-        msft = await cache_manager.get("quote", "MSFT")
+        apple = cache_manager.get("quote", "AAPL")
+        msft = cache_manager.get("quote", "MSFT")
 
         assert apple is None
         assert msft is not None
 
-    async def test_clear_all(self, cache_manager: CacheManager) -> None:
+    def test_clear_all(self, cache_manager: CacheManager) -> None:
         """clear_all removes all cache entries."""
-        await cache_manager.set("quote", "AAPL", {"price": 150.0})
-        await cache_manager.set("historical", "MSFT", {"data": []})
+        cache_manager.set("quote", "AAPL", {"price": 150.0})
+        cache_manager.set("historical", "MSFT", {"data": []})
 
         cache_manager.clear_all()
 
-        apple = await cache_manager.get("quote", "AAPL")
-        msft = await cache_manager.get("historical", "MSFT")
+        apple = cache_manager.get("quote", "AAPL")
+        msft = cache_manager.get("historical", "MSFT")
 
         assert apple is None
         assert msft is None
 
-    async def test_cache_stats(self, cache_manager: CacheManager) -> None:
+    def test_cache_stats(self, cache_manager: CacheManager) -> None:
         """Cache statistics are tracked correctly."""
         # Generate some hits and misses
-        await cache_manager.set("quote", "AAPL", {"price": 150.0})
+        cache_manager.set("quote", "AAPL", {"price": 150.0})
 
-        await cache_manager.get("quote", "AAPL")  # Hit
-        await cache_manager.get("quote", "MSFT")  # Miss
-        await cache_manager.get("quote", "AAPL")  # Hit
+        cache_manager.get("quote", "AAPL")  # Hit
+        cache_manager.get("quote", "MSFT")  # Miss
+        cache_manager.get("quote", "AAPL")  # Hit
 
         stats = cache_manager.get_stats()
 
@@ -135,26 +136,121 @@ class TestCacheManager:
         assert stats["total_requests"] == 3
         assert abs(stats["hit_rate"] - 0.667) < 0.01
 
-    async def test_different_cache_types(self, cache_manager: CacheManager) -> None:
+    def test_different_cache_types(self, cache_manager: CacheManager) -> None:
         """Different cache types are isolated."""
-        await cache_manager.set("quote", "AAPL", {"type": "quote"})
-        await cache_manager.set("historical", "AAPL", {"type": "historical"})
+        cache_manager.set("quote", "AAPL", {"type": "quote"})
+        cache_manager.set("historical", "AAPL", {"type": "historical"})
 
-        quote = await cache_manager.get("quote", "AAPL")
-        historical = await cache_manager.get("historical", "AAPL")
+        quote = cache_manager.get("quote", "AAPL")
+        historical = cache_manager.get("historical", "AAPL")
 
         assert quote["type"] == "quote"
         assert historical["type"] == "historical"
 
-    async def test_clear_specific_cache_type(self, cache_manager: CacheManager) -> None:
+    def test_clear_specific_cache_type(self, cache_manager: CacheManager) -> None:
         """Clearing specific cache type leaves others intact."""
-        await cache_manager.set("quote", "AAPL", {"price": 150.0})
-        await cache_manager.set("historical", "AAPL", {"data": []})
+        cache_manager.set("quote", "AAPL", {"price": 150.0})
+        cache_manager.set("historical", "AAPL", {"data": []})
 
         cache_manager.invalidate("quote")  # Clear all quote cache
 
-        quote = await cache_manager.get("quote", "AAPL")
-        historical = await cache_manager.get("historical", "AAPL")
+        quote = cache_manager.get("quote", "AAPL")
+        historical = cache_manager.get("historical", "AAPL")
 
         assert quote is None
         assert historical is not None
+
+    async def test_get_or_fetch_coalesces_concurrent_misses(
+        self, cache_manager: CacheManager
+    ) -> None:
+        """Concurrent misses for one key share a single fetch."""
+        calls = 0
+
+        async def fetch_fn() -> dict[str, float]:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"price": 150.0}
+
+        values = await asyncio.gather(
+            *(cache_manager.get_or_fetch("quote", "AAPL", fetch_fn) for _ in range(5))
+        )
+
+        assert calls == 1
+        assert values == [{"price": 150.0}] * 5
+        assert not cache_manager._inflight
+
+    async def test_get_or_fetch_shares_fetch_errors(self, cache_manager: CacheManager) -> None:
+        """Callers waiting on a failed fetch get its exception and nothing is cached."""
+
+        async def fetch_fn() -> dict[str, float]:
+            await asyncio.sleep(0.01)
+            raise RuntimeError("upstream down")
+
+        results = await asyncio.gather(
+            *(cache_manager.get_or_fetch("quote", "AAPL", fetch_fn) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert cache_manager.get("quote", "AAPL") is None
+        assert not cache_manager._inflight
+
+
+    async def test_get_or_fetch_survives_cancelled_leader(
+        self, cache_manager: CacheManager
+    ) -> None:
+        """Callers waiting on a cancelled fetch fetch again instead of being cancelled."""
+        calls = 0
+        release = asyncio.Event()
+
+        async def fetch_fn() -> dict[str, float]:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                await release.wait()
+            return {"price": 150.0}
+
+        leader = asyncio.create_task(cache_manager.get_or_fetch("quote", "AAPL", fetch_fn))
+        await asyncio.sleep(0)
+        followers = [
+            asyncio.create_task(cache_manager.get_or_fetch("quote", "AAPL", fetch_fn))
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        values = await asyncio.gather(*followers)
+
+        assert leader.cancelled()
+        assert values == [{"price": 150.0}] * 2
+        assert calls == 2
+        assert not cache_manager._inflight
+
+
+class TestFastTTL:
+    """Tests for the dict-based TTL cache used for quotes and history."""
+
+    def test_expired_entries_are_dropped(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Entries past their TTL read as missing and are removed."""
+        now = 1000.0
+        monkeypatch.setattr("orion.data.cache.time.monotonic", lambda: now)
+        cache = _FastTTL(maxsize=10, ttl=5)
+        cache["AAPL"] = 150.0
+
+        assert cache.get("AAPL") == 150.0
+        now = 1005.0
+        assert cache.get("AAPL") is None
+        assert len(cache) == 0
+
+    def test_evicts_oldest_when_full(self) -> None:
+        """Inserting past maxsize evicts the oldest inserted key."""
+        cache = _FastTTL(maxsize=2, ttl=60)
+        cache["A"] = 1
+        cache["B"] = 2
+        cache["A"] = 3  # overwrite moves A to the back
+        cache["C"] = 4
+
+        assert cache.get("B") is None
+        assert cache.get("A") == 3
+        assert cache.get("C") == 4
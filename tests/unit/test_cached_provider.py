@@ -0,0 +1,113 @@
+"""Tests for the caching data provider wrapper."""
+
+import asyncio
+from collections import Counter
+from datetime import date
+
+import pytest
+from orion.config import CacheConfig
+from orion.data.cache import CacheManager
+from orion.data.cached_provider import CachedDataProvider
+from orion.data.models import CompanyOverview, OhlcvSeries, Quote
+from orion.data.provider import MockDataProvider
+
+
+class CountingProvider(MockDataProvider):
+    """Mock provider that counts upstream calls per method."""
+
+    def __init__(self) -> None:
+        """Initialize the call counter."""
+        super().__init__()
+        self.calls: Counter[str] = Counter()
+
+    async def get_quote(self, symbol: str) -> Quote:
+        """Count and return a mock quote; symbols starting with X fail."""
+        self.calls["quote"] += 1
+        await asyncio.sleep(0)
+        if symbol.startswith("X"):
+            raise ValueError(f"Unknown symbol {symbol}")
+        return await super().get_quote(symbol)
+
+    async def get_historical_prices(
+        self, symbol: str, start: date, end: date, interval: str = "1d"
+    ) -> OhlcvSeries:
+        """Count and return mock history."""
+        self.calls["historical"] += 1
+        return await super().get_historical_prices(symbol, start, end, interval)
+
+    async def get_company_overview(self, symbol: str) -> CompanyOverview:
+        """Count and return a mock overview."""
+        self.calls["overview"] += 1
+        return await super().get_company_overview(symbol)
+
+
+class TestCachedDataProvider:
+    """Tests for CachedDataProvider."""
+
+    @pytest.fixture
+    def upstream(self) -> CountingProvider:
+        """Create the wrapped provider."""
+        return CountingProvider()
+
+    @pytest.fixture
+    def provider(self, upstream: CountingProvider) -> CachedDataProvider:
+        """Create the cached provider."""
+        return CachedDataProvider(upstream, CacheManager(CacheConfig(max_size=100)))
+
+    async def test_repeated_quote_is_served_from_cache(
+        self, provider: CachedDataProvider, upstream: CountingProvider
+    ) -> None:
+        """A second quote request for the same symbol does not hit the upstream."""
+        first = await provider.get_quote("AAPL")
+        second = await provider.get_quote("AAPL")
+
+        assert second is first
+        assert upstream.calls["quote"] == 1
+
+    async def test_concurrent_requests_are_coalesced(
+        self, provider: CachedDataProvider, upstream: CountingProvider
+    ) -> None:
+        """Concurrent misses for one symbol make a single upstream request."""
+        overviews = await asyncio.gather(*(provider.get_company_overview("MSFT") for _ in range(5)))
+
+        assert all(overview.symbol == "MSFT" for overview in overviews)
+        assert upstream.calls["overview"] == 1
+
+    async def test_historical_is_keyed_by_range(
+        self, provider: CachedDataProvider, upstream: CountingProvider
+    ) -> None:
+        """Different date ranges are cached separately."""
+        await provider.get_historical_prices("AAPL", date(2024, 1, 1), date(2024, 6, 30))
+        await provider.get_historical_prices("AAPL", date(2024, 1, 1), date(2024, 6, 30))
+        await provider.get_historical_prices("AAPL", date(2024, 2, 1), date(2024, 6, 30))
+
+        assert upstream.calls["historical"] == 2
+
+    async def test_get_quotes_fetches_only_missing(
+        self, provider: CachedDataProvider, upstream: CountingProvider
+    ) -> None:
+        """Batch quotes reuse cached symbols and do not cache failures."""
+        await provider.get_quote("AAPL")
+
+        quotes = await provider.get_quotes(["AAPL", "MSFT", "XBAD"])
+
+        assert isinstance(quotes["AAPL"], Quote)
+        assert isinstance(quotes["MSFT"], Quote)
+        assert isinstance(quotes["XBAD"], ValueError)
+        assert upstream.calls["quote"] == 3
+
+        await provider.get_quotes(["AAPL", "MSFT", "XBAD"])
+
+        assert upstream.calls["quote"] == 4
+
+    async def test_batch_historical_shares_single_symbol_entries(
+        self, provider: CachedDataProvider, upstream: CountingProvider
+    ) -> None:
+        """Batch history is served from entries cached by single-symbol requests."""
+        start, end = date(2024, 1, 1), date(2024, 6, 30)
+        await provider.get_historical_prices("AAPL", start, end)
+
+        histories = await provider.get_batch_historical(["AAPL", "MSFT"], start, end)
+
+        assert set(histories) == {"AAPL", "MSFT"}
+        assert upstream.calls["historical"] == 2
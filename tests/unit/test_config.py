@@ -30,6 +30,10 @@ class TestDataProviderConfig:
         assert config.provider == "alpha_vantage"
         assert config.api_key == "test_key"
         assert config.rate_limit == 5
+        assert config.max_connections == 10
+        assert config.max_connections_per_host == 5
+        assert config.executor_workers == 8
+        assert config.output_size == "compact"
 
     def test_from_env(self, monkeypatch):
         """Test loading from environment variables."""
@@ -1,10 +1,13 @@
 """Tests for the core screening module."""
 
-from datetime import date, datetime
+import asyncio
+from datetime import date, datetime, timedelta
 from decimal import Decimal
 
 import pytest
+from orion.config import CacheConfig
 from orion.core.screener import ScreeningResult, ScreeningStats, StockScreener
+from orion.data.cache import CacheManager
 from orion.data.models import (
     OHLCV,
     OptionChain,
@@ -335,3 +338,171 @@ class TestStockScreener:
         results = await screener.screen_batch_iter(["AAPL", "MSFT", "GOOGL", "TSLA", "NVDA"])
 
         assert len(results) == 5
+
+    @pytest.mark.asyncio
+    async def test_screen_batch_uses_batch_fetches(self, ofi_strategy):
+        """Test that screen_batch fetches quotes and history once per chunk."""
+
+        class CountingProvider(MockDataProvider):
+            def __init__(self) -> None:
+                super().__init__()
+                self.batch_calls: list[tuple[str, list[str]]] = []
+
+            async def get_quotes(self, symbols):
+                self.batch_calls.append(("quotes", symbols))
+                return await super().get_quotes(symbols)
+
+            async def get_batch_historical(self, symbols, start, end, interval="1d"):
+                self.batch_calls.append(("historical", symbols))
+                return await super().get_batch_historical(symbols, start, end, interval)
+
+        provider = CountingProvider()
+        screener = StockScreener(provider=provider, strategy=ofi_strategy, batch_size=2)
+
+        results = await screener.screen_batch_iter(["AAPL", "MSFT", "GOOGL"])
+
+        assert {r.symbol for r in results} == {"AAPL", "MSFT", "GOOGL"}
+        assert all(r.indicators is not None for r in results)
+        assert provider.batch_calls == [
+            ("quotes", ["AAPL", "MSFT"]),
+            ("historical", ["AAPL", "MSFT"]),
+            ("quotes", ["GOOGL"]),
+            ("historical", ["GOOGL"]),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_screen_batch_skips_history_without_quote(self, ofi_strategy):
+        """Test that symbols with no quote are reported without fetching history."""
+
+        class PartialQuoteProvider(MockDataProvider):
+            def __init__(self) -> None:
+                super().__init__()
+                self.historical_calls: list[list[str]] = []
+
+            async def get_quote(self, symbol):
+                return None if symbol == "DEAD" else await super().get_quote(symbol)
+
+            async def get_batch_historical(self, symbols, start, end, interval="1d"):
+                self.historical_calls.append(symbols)
+                return await super().get_batch_historical(symbols, start, end, interval)
+
+        provider = PartialQuoteProvider()
+        screener = StockScreener(provider=provider, strategy=ofi_strategy)
+
+        results = {r.symbol: r for r in await screener.screen_batch_iter(["AAPL", "DEAD"])}
+
+        assert provider.historical_calls == [["AAPL"]]
+        assert results["DEAD"].error == "Failed to fetch quote"
+        assert results["AAPL"].indicators is not None
+
+    @pytest.mark.asyncio
+    async def test_screen_batch_reuses_cached_history(self, ofi_strategy):
+        """Test that a second batch on the same window only fetches uncached history."""
+
+        class CountingProvider(MockDataProvider):
+            def __init__(self) -> None:
+                super().__init__()
+                self.historical_calls: list[list[str]] = []
+
+            async def get_batch_historical(self, symbols, start, end, interval="1d"):
+                self.historical_calls.append(symbols)
+                return await super().get_batch_historical(symbols, start, end, interval)
+
+        provider = CountingProvider()
+        cache = CacheManager(CacheConfig())
+        screener = StockScreener(provider=provider, strategy=ofi_strategy, cache=cache)
+
+        await screener.screen_batch_iter(["AAPL", "MSFT"])
+        results = await screener.screen_batch_iter(["AAPL", "MSFT", "GOOGL"])
+
+        assert provider.historical_calls == [["AAPL", "MSFT"], ["GOOGL"]]
+        assert all(r.indicators is not None for r in results)
+        start_date, end_date = screener._history_range(date.today())
+        assert cache.get("historical", f"AAPL:{start_date}:{end_date}") is not None
+
+    @pytest.mark.asyncio
+    async def test_screen_batch_yields_in_completion_order(self, ofi_strategy):
+        """Test that screen_batch streams results before slower symbols finish."""
+        screener = StockScreener(provider=MockDataProvider(), strategy=ofi_strategy)
+        delays = {"SLOW": 0.05, "FAST": 0.0}
+
+        async def fake_prefetched(symbol, quote, historical, today=None, indicators=None):
+            await asyncio.sleep(delays[symbol])
+            return ScreeningResult(
+                symbol=symbol,
+                timestamp=datetime.now(),
+                matches=False,
+                signal_strength=0.0,
+                conditions_met=[],
+                conditions_missed=[],
+                quote=None,
+                indicators=None,
+                option_recommendation=None,
+            )
+
+        screener.screen_symbol_prefetched = fake_prefetched  # type: ignore[method-assign]
+
+        stream = screener.screen_batch(["SLOW", "FAST"])
+        first = await anext(stream)
+
+        assert first.symbol == "FAST"
+        assert [r.symbol async for r in stream] == ["SLOW"]
+
+    @pytest.mark.asyncio
+    async def test_screen_batch_reports_prefetch_errors(self, ofi_strategy):
+        """Test that a failed batch quote fetch becomes a per-symbol error result."""
+        screener = StockScreener(provider=MockDataProvider(raise_on="quote"), strategy=ofi_strategy)
+
+        results = await screener.screen_batch_iter(["AAPL", "MSFT"])
+
+        assert len(results) == 2
+        assert all(r.error is not None and "Screening error" in r.error for r in results)
+
+    @pytest.mark.asyncio
+    async def test_option_chains_fetched_concurrently(self, ofi_strategy):
+        """Test that option chains for target expirations are fetched together."""
+        today = date.today()
+        expirations = [today + timedelta(days=d) for d in (14, 21, 28)]
+
+        class SlowChainProvider(MockDataProvider):
+            def __init__(self) -> None:
+                super().__init__()
+                self.in_flight = 0
+                self.peak = 0
+
+            async def get_available_expirations(self, symbol):
+                return expirations
+
+            async def get_option_chain(self, symbol, expiration):
+                self.in_flight += 1
+                self.peak = max(self.peak, self.in_flight)
+                await asyncio.sleep(0.01)
+                self.in_flight -= 1
+                if expiration == expirations[1]:
+                    raise RuntimeError("chain unavailable")
+                return await super().get_option_chain(symbol, expiration)
+
+        provider = SlowChainProvider()
+        screener = StockScreener(provider=provider, strategy=ofi_strategy)
+        analyzed: list[list[OptionChain]] = []
+        screener.option_analyzer.analyze_all_expirations = (  # type: ignore[method-assign]
+            lambda chains, screening, today: analyzed.append(chains)
+        )
+
+        await screener._find_option_recommendation("AAPL", today)
+
+        assert provider.peak == 3
+        assert [c.expiration for c in analyzed[0]] == [expirations[0], expirations[2]]
+
+    def test_target_expirations_memoized(self, ofi_strategy):
+        """Test that the DTE filter is cached per (today, expirations)."""
+        screener = StockScreener(provider=MockDataProvider(), strategy=ofi_strategy)
+        today = date(2024, 1, 1)
+        expirations = [today + timedelta(days=d) for d in (3, 14, 28, 90)]
+
+        first = screener._target_expirations(expirations, today)
+
+        assert first == [today + timedelta(days=14), today + timedelta(days=28)]
+        assert screener._target_expirations(list(expirations), today) is first
+        later = screener._target_expirations(expirations, today + timedelta(days=10))
+        assert later == [today + timedelta(days=28)]
@@ -1,11 +1,14 @@
 """Tests for data models."""
 
-from datetime import date, datetime
-from decimal import Decimal
+from datetime import date, datetime, timedelta, timezone
 
+import numpy as np
+import pytest
 from orion.data.models import (
     OHLCV,
     CompanyOverview,
+    IndicatorPanel,
+    OhlcvSeries,
     OptionChain,
     OptionContract,
     Quote,
@@ -20,36 +23,36 @@ class TestQuote:
         """Quote creates successfully with all fields."""
         quote = Quote(
             symbol="AAPL",
-            price=Decimal("150.00"),
+            price=150.0,
             volume=1000000,
             timestamp=datetime(2024, 1, 1, 10, 0),
-            open=Decimal("148.00"),
-            high=Decimal("151.00"),
-            low=Decimal("147.50"),
-            close=Decimal("150.00"),
-            previous_close=Decimal("149.00"),
+            open=148.0,
+            high=151.0,
+            low=147.5,
+            close=150.0,
+            previous_close=149.0,
         )
 
         assert quote.symbol == "AAPL"
-        assert quote.price == Decimal("150.00")
+        assert quote.price == 150.0
         assert quote.volume == 1000000
-        assert quote.previous_close == Decimal("149.00")
+        assert quote.previous_close == 149.0
 
     def test_quote_calculates_change(self) -> None:
         """Quote calculates change from previous close."""
         quote = Quote(
             symbol="AAPL",
-            price=Decimal("150.00"),
+            price=150.0,
             volume=1000000,
             timestamp=datetime.now(),
-            open=Decimal("148.00"),
-            high=Decimal("151.00"),
-            low=Decimal("147.50"),
-            close=Decimal("150.00"),
-            previous_close=Decimal("149.00"),
+            open=148.0,
+            high=151.0,
+            low=147.5,
+            close=150.0,
+            previous_close=149.0,
         )
 
-        assert quote.change == Decimal("1.00")
+        assert quote.change == 1.0
         assert quote.change_percent is not None
         assert abs(quote.change_percent - 0.671) < 0.01
 
@@ -57,13 +60,13 @@ class TestQuote:
         """Quote works without previous close."""
         quote = Quote(
             symbol="AAPL",
-            price=Decimal("150.00"),
+            price=150.0,
             volume=1000000,
             timestamp=datetime.now(),
-            open=Decimal("148.00"),
-            high=Decimal("151.00"),
-            low=Decimal("147.50"),
-            close=Decimal("150.00"),
+            open=148.0,
+            high=151.0,
+            low=147.5,
+            close=150.0,
         )
 
         assert quote.change is None
@@ -78,18 +81,18 @@ class TestOptionContract:
         contract = OptionContract(
             symbol="AAPL240119P00150000",
             underlying_symbol="AAPL",
-            strike=Decimal("150.00"),
+            strike=150.0,
             expiration=date(2024, 1, 19),
             option_type="put",
-            bid=Decimal("2.50"),
-            ask=Decimal("2.55"),
-            last_price=Decimal("2.52"),
+            bid=2.5,
+            ask=2.55,
+            last_price=2.52,
             volume=100,
             open_interest=500,
         )
 
         assert contract.symbol == "AAPL240119P00150000"
-        assert contract.strike == Decimal("150.00")
+        assert contract.strike == 150.0
         assert contract.option_type == "put"
 
     def test_mid_price_calculation(self) -> None:
@@ -97,34 +100,34 @@ class TestOptionContract:
         contract = OptionContract(
             symbol="AAPL240119P00150000",
             underlying_symbol="AAPL",
-            strike=Decimal("150.00"),
+            strike=150.0,
             expiration=date(2024, 1, 19),
             option_type="put",
-            bid=Decimal("2.50"),
-            ask=Decimal("2.60"),
-            last_price=Decimal("2.55"),
+            bid=2.5,
+            ask=2.6,
+            last_price=2.55,
             volume=100,
             open_interest=500,
         )
 
-        assert contract.mid_price == Decimal("2.55")
+        assert contract.mid_price == pytest.approx(2.55)
 
     def test_spread_calculation(self) -> None:
         """Bid-ask spread calculates correctly."""
         contract = OptionContract(
             symbol="AAPL240119P00150000",
             underlying_symbol="AAPL",
-            strike=Decimal("150.00"),
+            strike=150.0,
             expiration=date(2024, 1, 19),
             option_type="put",
-            bid=Decimal("2.50"),
-            ask=Decimal("2.60"),
-            last_price=Decimal("2.55"),
+            bid=2.5,
+            ask=2.6,
+            last_price=2.55,
             volume=100,
             open_interest=500,
         )
 
-        assert contract.spread == Decimal("0.10")
+        assert contract.spread == pytest.approx(0.1)
 
     def test_is_liquid_check(self) -> None:
         """Liquidity check works correctly."""
@@ -132,12 +135,12 @@ class TestOptionContract:
         liquid = OptionContract(
             symbol="AAPL240119P00150000",
             underlying_symbol="AAPL",
-            strike=Decimal("150.00"),
+            strike=150.0,
             expiration=date(2024, 1, 19),
             option_type="put",
-            bid=Decimal("2.50"),
-            ask=Decimal("2.55"),
-            last_price=Decimal("2.52"),
+            bid=2.5,
+            ask=2.55,
+            last_price=2.52,
             volume=100,
             open_interest=500,
         )
@@ -147,12 +150,12 @@ class TestOptionContract:
         illiquid = OptionContract(
             symbol="AAPL240119P00150000",
             underlying_symbol="AAPL",
-            strike=Decimal("150.00"),
+            strike=150.0,
             expiration=date(2024, 1, 19),
             option_type="put",
-            bid=Decimal("2.50"),
-            ask=Decimal("2.55"),
-            last_price=Decimal("2.52"),
+            bid=2.5,
+            ask=2.55,
+            last_price=2.52,
             volume=5,
             open_interest=500,
         )
@@ -167,12 +170,12 @@ class TestOptionChain:
         chain = OptionChain(
             symbol="AAPL",
             expiration=date(2024, 1, 19),
-            underlying_price=Decimal("150.00"),
+            underlying_price=150.0,
         )
 
         assert chain.symbol == "AAPL"
         assert chain.expiration == date(2024, 1, 19)
-        assert chain.underlying_price == Decimal("150.00")
+        assert chain.underlying_price == 150.0
         assert len(chain.calls) == 0
         assert len(chain.puts) == 0
 
@@ -181,12 +184,12 @@ class TestOptionChain:
         put_145 = OptionContract(
             symbol="AAPL240119P00145000",
             underlying_symbol="AAPL",
-            strike=Decimal("145.00"),
+            strike=145.0,
             expiration=date(2024, 1, 19),
             option_type="put",
-            bid=Decimal("1.50"),
-            ask=Decimal("1.55"),
-            last_price=Decimal("1.52"),
+            bid=1.5,
+            ask=1.55,
+            last_price=1.52,
             volume=100,
             open_interest=500,
         )
@@ -194,12 +197,12 @@ class TestOptionChain:
         put_150 = OptionContract(
             symbol="AAPL240119P00150000",
             underlying_symbol="AAPL",
-            strike=Decimal("150.00"),
+            strike=150.0,
             expiration=date(2024, 1, 19),
             option_type="put",
-            bid=Decimal("2.50"),
-            ask=Decimal("2.55"),
-            last_price=Decimal("2.52"),
+            bid=2.5,
+            ask=2.55,
+            last_price=2.52,
             volume=100,
             open_interest=500,
         )
@@ -207,24 +210,34 @@ class TestOptionChain:
         chain = OptionChain(
             symbol="AAPL",
             expiration=date(2024, 1, 19),
-            underlying_price=Decimal("149.00"),
+            underlying_price=149.0,
             puts=[put_145, put_150],
         )
 
         # Should return 150 as it's closest to 149
-        assert chain.get_atm_strike() == Decimal("150.00")
+        assert chain.get_atm_strike() == 150.0
+
+        # Equidistant strikes resolve to the lower one
+        chain.underlying_price = 147.5
+        assert chain.get_atm_strike() == 145.0
+
+    def test_get_atm_strike_empty_chain(self) -> None:
+        """An empty chain falls back to the underlying price."""
+        chain = OptionChain(symbol="AAPL", expiration=date(2024, 1, 19), underlying_price=149.0)
+
+        assert chain.get_atm_strike() == 149.0
 
     def test_get_atm_put(self) -> None:
         """Get ATM put returns correct option."""
         put_150 = OptionContract(
             symbol="AAPL240119P00150000",
             underlying_symbol="AAPL",
-            strike=Decimal("150.00"),
+            strike=150.0,
             expiration=date(2024, 1, 19),
             option_type="put",
-            bid=Decimal("2.50"),
-            ask=Decimal("2.55"),
-            last_price=Decimal("2.52"),
+            bid=2.5,
+            ask=2.55,
+            last_price=2.52,
             volume=100,
             open_interest=500,
         )
@@ -232,13 +245,13 @@ class TestOptionChain:
         chain = OptionChain(
             symbol="AAPL",
             expiration=date(2024, 1, 19),
-            underlying_price=Decimal("150.00"),
+            underlying_price=150.0,
             puts=[put_150],
         )
 
         atm_put = chain.get_atm_put()
         assert atm_put is not None
-        assert atm_put.strike == Decimal("150.00")
+        assert atm_put.strike == 150.0
 
 
 class TestOHLCV:
@@ -248,54 +261,142 @@ class TestOHLCV:
         """OHLCV creates successfully."""
         ohlcv = OHLCV(
             timestamp=datetime(2024, 1, 1),
-            open=Decimal("100.00"),
-            high=Decimal("105.00"),
-            low=Decimal("99.00"),
-            close=Decimal("103.00"),
+            open=100.0,
+            high=105.0,
+            low=99.0,
+            close=103.0,
+            volume=1000000,
+        )
+
+        assert ohlcv.open == 100.0
+        assert ohlcv.high == 105.0
+        assert ohlcv.low == 99.0
+        assert ohlcv.close == 103.0
+
+    def test_ohlcv_is_slotted(self) -> None:
+        """OHLCV instances carry no per-instance __dict__."""
+        ohlcv = OHLCV(
+            timestamp=datetime(2024, 1, 1),
+            open=100.0,
+            high=105.0,
+            low=99.0,
+            close=103.0,
             volume=1000000,
         )
 
-        assert ohlcv.open == Decimal("100.00")
-        assert ohlcv.high == Decimal("105.00")
-        assert ohlcv.low == Decimal("99.00")
-        assert ohlcv.close == Decimal("103.00")
+        assert not hasattr(ohlcv, "__dict__")
 
     def test_price_range_calculation(self) -> None:
         """Price range calculates correctly."""
         ohlcv = OHLCV(
             timestamp=datetime(2024, 1, 1),
-            open=Decimal("100.00"),
-            high=Decimal("105.00"),
-            low=Decimal("99.00"),
-            close=Decimal("103.00"),
+            open=100.0,
+            high=105.0,
+            low=99.0,
+            close=103.0,
             volume=1000000,
         )
 
-        assert ohlcv.price_range == Decimal("6.00")
+        assert ohlcv.price_range == 6.0
 
     def test_body_size_calculation(self) -> None:
         """Candle body size calculates correctly."""
         # Bullish candle
         bullish = OHLCV(
             timestamp=datetime(2024, 1, 1),
-            open=Decimal("100.00"),
-            high=Decimal("105.00"),
-            low=Decimal("99.00"),
-            close=Decimal("103.00"),
+            open=100.0,
+            high=105.0,
+            low=99.0,
+            close=103.0,
             volume=1000000,
         )
-        assert bullish.body_size == Decimal("3.00")
+        assert bullish.body_size == 3.0
 
         # Bearish candle
         bearish = OHLCV(
             timestamp=datetime(2024, 1, 1),
-            open=Decimal("103.00"),
-            high=Decimal("105.00"),
-            low=Decimal("99.00"),
-            close=Decimal("100.00"),
+            open=103.0,
+            high=105.0,
+            low=99.0,
+            close=100.0,
             volume=1000000,
         )
-        assert bearish.body_size == Decimal("3.00")
+        assert bearish.body_size == 3.0
+
+
+class TestOhlcvSeries:
+    """Tests for the columnar OhlcvSeries model."""
+
+    def _bars(self, count: int = 3) -> list[OHLCV]:
+        return [
+            OHLCV(
+                timestamp=datetime(2024, 1, 1) + timedelta(days=i),
+                open=100.0 + i,
+                high=105.0 + i,
+                low=99.0 + i,
+                close=103.5 + i,
+                volume=1000000 + i,
+            )
+            for i in range(count)
+        ]
+
+    def test_from_bars_converts_columns(self) -> None:
+        """from_bars builds typed NumPy columns in bar order."""
+        series = OhlcvSeries.from_bars(self._bars())
+
+        assert len(series) == 3
+        assert series.close.dtype == np.float64
+        assert series.volume.dtype == np.int64
+        assert series.timestamps.dtype == np.dtype("datetime64[us]")
+        assert series.close.tolist() == [103.5, 104.5, 105.5]
+        assert series.volume.tolist() == [1000000, 1000001, 1000002]
+        assert series.last_timestamp == datetime(2024, 1, 3)
+
+    def test_slice_returns_series(self) -> None:
+        """Slicing returns an OhlcvSeries over the selected bars."""
+        series = OhlcvSeries.from_bars(self._bars(5))
+
+        head = series[:2]
+
+        assert isinstance(head, OhlcvSeries)
+        assert len(head) == 2
+        assert head.high.tolist() == [105.0, 106.0]
+        assert head.last_timestamp == datetime(2024, 1, 2)
+
+    def test_integer_index_and_iteration_rejected(self) -> None:
+        """Integer indexing, and so iteration, raise instead of yielding one-bar series."""
+        series = OhlcvSeries.from_bars(self._bars(3))
+
+        with pytest.raises(TypeError, match="slices"):
+            series[0]  # type: ignore[index]
+        with pytest.raises(TypeError):
+            list(series)  # type: ignore[call-overload]
+
+    def test_aware_timestamps_normalized_to_utc(self) -> None:
+        """Timezone-aware timestamps are stored as naive UTC."""
+        bar = self._bars(1)[0]
+        bar.timestamp = datetime(2024, 1, 1, 9, 30, tzinfo=timezone(timedelta(hours=-5)))
+
+        series = OhlcvSeries.from_bars([bar])
+
+        assert series.last_timestamp == datetime(2024, 1, 1, 14, 30)
+
+    def test_from_empty_bars(self) -> None:
+        """An empty bar list gives an empty series."""
+        assert len(OhlcvSeries.from_bars([])) == 0
+
+    def test_to_ohlcv_list_round_trips(self) -> None:
+        """to_ohlcv_list rebuilds the original bars, including adjusted closes."""
+        bars = self._bars(3)
+        bars[1].adjusted_close = 104.0
+
+        series = OhlcvSeries.from_bars(bars)
+
+        assert series.adjusted_close is not None
+        assert np.isnan(series.adjusted_close[0])
+        assert series.to_ohlcv_list() == bars
+        assert series[1:].to_ohlcv_list() == bars[1:]
+        assert OhlcvSeries.from_bars(self._bars(2)).adjusted_close is None
 
 
 class TestCompanyOverview:
@@ -413,3 +514,37 @@ class TestTechnicalIndicators:
             sma_60=145.0,
         )
         assert bearish.is_bullish_trend() is False
+
+
+class TestIndicatorPanel:
+    """Tests for IndicatorPanel."""
+
+    @pytest.fixture
+    def panel(self) -> IndicatorPanel:
+        """Create a panel of three symbols, the last with missing values."""
+        return IndicatorPanel(
+            symbols=["AAPL", "MSFT", "NEW"],
+            timestamps=[datetime(2024, 1, 1)] * 3,
+            sma_20=np.array([150.0, 140.0, np.nan]),
+            sma_60=np.array([145.0, 145.0, np.nan]),
+            rsi_14=np.array([25.0, 75.0, np.nan]),
+            volume_avg_20=np.array([1e6, 2e6, np.nan]),
+        )
+
+    def test_masks_match_per_symbol_checks(self, panel: IndicatorPanel) -> None:
+        """Test that masks agree with the TechnicalIndicators helper methods."""
+        rows = [panel.row(i) for i in range(len(panel))]
+
+        assert panel.oversold_mask().tolist() == [r.is_oversold() for r in rows]
+        assert panel.overbought_mask().tolist() == [r.is_overbought() for r in rows]
+        assert panel.bullish_trend_mask().tolist() == [r.is_bullish_trend() for r in rows]
+        assert panel.bullish_trend_mask().tolist() == [True, False, False]
+
+    def test_row_converts_nan_to_none(self, panel: IndicatorPanel) -> None:
+        """Test that missing values become None in the per-symbol view."""
+        row = panel.row(2)
+
+        assert row.symbol == "NEW"
+        assert row.sma_20 is None
+        assert row.rsi_14 is None
+        assert panel.row(0).rsi_14 == 25.0
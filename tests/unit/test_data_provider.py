@@ -1,8 +1,11 @@
 """Tests for data providers."""
 
+import asyncio
 from datetime import date
 
+import numpy as np
 import pytest
+from orion.data.models import CompanyOverview, OhlcvSeries, Quote
 from orion.data.provider import MockDataProvider
 
 
@@ -32,17 +35,29 @@ class TestMockDataProvider:
 
         data = await provider.get_historical_prices("AAPL", start, end)
 
+        assert isinstance(data, OhlcvSeries)
         assert len(data) > 0
         # Check data is chronologically ordered
-        for i in range(len(data) - 1):
-            assert data[i].timestamp <= data[i + 1].timestamp
+        assert (np.diff(data.timestamps) >= np.timedelta64(0)).all()
 
         # Check OHLCV data validity
-        for ohlcv in data:
-            assert ohlcv.high >= ohlcv.low
-            assert ohlcv.high >= ohlcv.open
-            assert ohlcv.high >= ohlcv.close
-            assert ohlcv.volume >= 0
+        assert (data.high >= data.low).all()
+        assert (data.high >= data.open).all()
+        assert (data.high >= data.close).all()
+        assert (data.volume >= 0).all()
+
+    async def test_historical_prices_are_independent_copies(
+        self, provider: MockDataProvider
+    ) -> None:
+        """Mutating one returned series does not change later ones."""
+        first = await provider.get_historical_prices("AAPL", date(2024, 1, 1), date(2024, 1, 31))
+        first.close[:] = 0.0
+        first.volume[:] = 0
+
+        second = await provider.get_historical_prices("AAPL", date(2024, 1, 1), date(2024, 1, 31))
+
+        assert (second.close >= 150.0).all()
+        assert (second.volume >= 1_000_000).all()
 
     async def test_get_option_chain(self, provider: MockDataProvider) -> None:
         """Mock provider returns valid option chain."""
@@ -88,3 +103,61 @@ class TestMockDataProvider:
 
         assert quote1.symbol == "AAPL"
         assert quote2.symbol == "MSFT"
+
+    async def test_get_many_overviews_preserves_order(self, provider: MockDataProvider) -> None:
+        """Batch overview fetch returns one overview per symbol, in order."""
+        overviews = await provider.get_many_overviews(["AAPL", "MSFT", "GOOGL"])
+
+        assert [o.symbol for o in overviews] == ["AAPL", "MSFT", "GOOGL"]
+        assert await provider.get_many_overviews([]) == []
+
+    async def test_get_many_overviews_caps_concurrency(
+        self, provider: MockDataProvider, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """No more than max_concurrent_requests overview calls run at once."""
+        original = provider.get_company_overview
+        in_flight = 0
+        peak = 0
+
+        async def tracked(symbol: str) -> CompanyOverview:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return await original(symbol)
+
+        monkeypatch.setattr(provider, "get_company_overview", tracked)
+        provider.max_concurrent_requests = 2
+
+        overviews = await provider.get_many_overviews(["A", "B", "C", "D", "E"])
+
+        assert len(overviews) == 5
+        assert peak == 2
+
+    async def test_get_quotes_maps_symbols_and_errors(
+        self, provider: MockDataProvider, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Batch quote fetch maps each symbol to its quote or its exception."""
+        original = provider.get_quote
+
+        async def flaky(symbol: str) -> Quote:
+            if symbol == "BAD":
+                raise ValueError("unknown symbol")
+            return await original(symbol)
+
+        monkeypatch.setattr(provider, "get_quote", flaky)
+
+        quotes = await provider.get_quotes(["AAPL", "BAD"])
+
+        assert isinstance(quotes["AAPL"], Quote)
+        assert isinstance(quotes["BAD"], ValueError)
+
+    async def test_get_batch_historical(self, provider: MockDataProvider) -> None:
+        """Batch historical fetch returns one series per symbol."""
+        histories = await provider.get_batch_historical(
+            ["AAPL", "MSFT"], date(2024, 1, 1), date(2024, 1, 31)
+        )
+
+        assert set(histories) == {"AAPL", "MSFT"}
+        assert all(isinstance(bars, OhlcvSeries) and len(bars) for bars in histories.values())
@@ -4,11 +4,13 @@ Unit tests for the IndicatorCalculator class.
 Tests technical indicator calculations including SMA, RSI, and volume averages.
 """
 
+from dataclasses import replace
 from datetime import datetime, timedelta
 
+import numpy as np
 import pytest
 from orion.analysis.indicators import IndicatorCalculator
-from orion.data.models import OHLCV
+from orion.data.models import OHLCV, OhlcvSeries
 
 
 class TestIndicatorCalculator:
@@ -233,3 +235,223 @@ class TestIndicatorCalculator:
         # In downtrend, RSI might be lower (oversold territory possible)
         if indicators.rsi_14 is not None:
             assert 0 <= indicators.rsi_14 <= 100
+
+    def test_ohlcv_to_dataframe_column_types(
+        self, calculator: IndicatorCalculator, sample_ohlcv: list[OHLCV]
+    ) -> None:
+        """Test that the DataFrame is built with numeric columns and a datetime index."""
+        df = calculator._ohlcv_to_dataframe(sample_ohlcv)
+
+        assert len(df) == len(sample_ohlcv)
+        assert list(df.columns) == ["open", "high", "low", "close", "volume"]
+        assert str(df["close"].dtype) == "float64"
+        assert str(df["volume"].dtype) == "int64"
+        assert df.index[-1] == sample_ohlcv[-1].timestamp
+        assert df["close"].iloc[-1] == float(sample_ohlcv[-1].close)
+
+    def test_matches_pandas_ta_reference(
+        self, calculator: IndicatorCalculator, sample_ohlcv: list[OHLCV]
+    ) -> None:
+        """Test that the NumPy kernels match pandas-ta's SMA and RSI values."""
+        ta = pytest.importorskip("pandas_ta")
+
+        indicators = calculator.calculate(sample_ohlcv, "AAPL")
+        df = calculator._ohlcv_to_dataframe(sample_ohlcv)
+
+        assert indicators.sma_20 == pytest.approx(ta.sma(df["close"], length=20).iloc[-1])
+        assert indicators.sma_60 == pytest.approx(ta.sma(df["close"], length=60).iloc[-1])
+        assert indicators.rsi_14 == pytest.approx(ta.rsi(df["close"], length=14).iloc[-1])
+        assert indicators.volume_avg_20 == pytest.approx(ta.sma(df["volume"], length=20).iloc[-1])
+
+    def test_rsi_flat_prices_is_none(self, calculator: IndicatorCalculator) -> None:
+        """Test that RSI is undefined when prices never change."""
+        base_time = datetime(2024, 1, 1)
+        flat = [
+            OHLCV(
+                timestamp=base_time + timedelta(days=i),
+                open=100.0,
+                high=100.0,
+                low=100.0,
+                close=100.0,
+                volume=1000000,
+            )
+            for i in range(30)
+        ]
+
+        indicators = calculator.calculate(flat, "FLAT")
+
+        assert indicators.rsi_14 is None
+        assert indicators.sma_20 == pytest.approx(100.0)
+
+    def test_rsi_numpy_fallback_matches_loop_kernel(
+        self,
+        calculator: IndicatorCalculator,
+        sample_ohlcv: list[OHLCV],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that the NumPy RSI path used without numba matches the loop kernel."""
+        from orion.analysis import indicators as indicators_module
+
+        close, _ = calculator._close_volume_arrays(sample_ohlcv)
+        expected = float(indicators_module._rsi_last(close, 14))
+
+        monkeypatch.setattr(indicators_module, "njit", None)
+
+        assert indicators_module._rsi_tail(close, 14) == pytest.approx(expected)
+
+    @pytest.mark.parametrize("count", [10, 30, 100])
+    def test_fused_kernel_matches_numpy_path(
+        self,
+        calculator: IndicatorCalculator,
+        sample_ohlcv: list[OHLCV],
+        monkeypatch: pytest.MonkeyPatch,
+        count: int,
+    ) -> None:
+        """Test that the fused tail kernel agrees with the per-indicator NumPy path."""
+        from orion.analysis import indicators as indicators_module
+
+        close, volume = calculator._close_volume_arrays(sample_ohlcv[-count:])
+        fused = indicators_module._compute_tail_indicators(close, volume)
+
+        monkeypatch.setattr(indicators_module, "njit", None)
+        expected = indicators_module._compute_tail_indicators(close, volume)
+
+        assert fused == pytest.approx(expected)
+
+    def test_calculate_batch_matches_per_symbol(
+        self,
+        calculator: IndicatorCalculator,
+        sample_ohlcv: list[OHLCV],
+        minimal_ohlcv: list[OHLCV],
+    ) -> None:
+        """Test that batch calculation agrees with per-symbol calculation."""
+        series = [sample_ohlcv, minimal_ohlcv]
+        arrays = [calculator._close_volume_arrays(bars) for bars in series]
+        closes = calculator.stack_series([close for close, _ in arrays])
+        volumes = calculator.stack_series([volume for _, volume in arrays])
+
+        batch = calculator.calculate_batch(closes, volumes)
+
+        assert closes.shape == (2, 100)
+        for i, bars in enumerate(series):
+            single = calculator.calculate(bars, "SYM")
+            for name in ("sma_20", "sma_60", "rsi_14", "volume_avg_20"):
+                expected = getattr(single, name)
+                if expected is None:
+                    assert np.isnan(batch[name][i])
+                else:
+                    assert batch[name][i] == pytest.approx(expected)
+
+    def test_calculate_panel_matches_per_symbol(
+        self,
+        calculator: IndicatorCalculator,
+        sample_ohlcv: list[OHLCV],
+        minimal_ohlcv: list[OHLCV],
+    ) -> None:
+        """Test that panel rows agree with per-symbol calculation."""
+        histories = [sample_ohlcv, OhlcvSeries.from_bars(minimal_ohlcv)]
+
+        panel = calculator.calculate_panel(histories, ["LONG", "SHORT"])
+
+        assert panel.symbols == ["LONG", "SHORT"]
+        for i, bars in enumerate(histories):
+            row = panel.row(i)
+            single = calculator.calculate(bars, panel.symbols[i])
+            assert row.timestamp == single.timestamp
+            for name in ("sma_20", "sma_60", "rsi_14", "volume_avg_20"):
+                expected = getattr(single, name)
+                if expected is None:
+                    assert getattr(row, name) is None
+                else:
+                    assert getattr(row, name) == pytest.approx(expected)
+
+    def test_calculate_panel_rejects_misaligned_symbols(
+        self, calculator: IndicatorCalculator, sample_ohlcv: list[OHLCV]
+    ) -> None:
+        """Test that histories and symbols must have the same length."""
+        with pytest.raises(ValueError, match="lengths must match"):
+            calculator.calculate_panel([sample_ohlcv], ["A", "B"])
+
+    def test_rsi_series_matches_prefix_calculation(
+        self, calculator: IndicatorCalculator, sample_ohlcv: list[OHLCV]
+    ) -> None:
+        """Test that each RSI series element equals the RSI of that prefix."""
+        rsi = calculator.rsi_series(OhlcvSeries.from_bars(sample_ohlcv))
+
+        assert rsi.shape == (len(sample_ohlcv),)
+        assert np.isnan(rsi[:14]).all()
+        for i in (14, 30, len(sample_ohlcv) - 1):
+            expected = calculator.calculate(sample_ohlcv[: i + 1], "SYM").rsi_14
+            assert rsi[i] == pytest.approx(expected)
+        assert np.array_equal(calculator.rsi_series(sample_ohlcv), rsi, equal_nan=True)
+
+    def test_calculate_accepts_ohlcv_series(
+        self, calculator: IndicatorCalculator, sample_ohlcv: list[OHLCV]
+    ) -> None:
+        """Test that a columnar series gives the same indicators as the bar list."""
+        expected = calculator.calculate(sample_ohlcv, "SYM")
+
+        result = calculator.calculate(OhlcvSeries.from_bars(sample_ohlcv), "SYM")
+
+        assert result == expected
+
+    def test_cached_calculator_reuses_result(self, sample_ohlcv: list[OHLCV]) -> None:
+        """Test that a caching calculator returns the memoized result for the same bars."""
+        from orion.analysis import indicators as indicators_module
+
+        indicators_module._result_cache.clear()
+        calculator = IndicatorCalculator(cache_results=True)
+
+        first = calculator.calculate(sample_ohlcv, "CACHED")
+        again = calculator.calculate(sample_ohlcv, "CACHED")
+        with_new_bar = calculator.calculate([*sample_ohlcv, sample_ohlcv[-1]], "CACHED")
+
+        assert again is first
+        assert with_new_bar is not first
+        indicators_module._result_cache.clear()
+
+    def test_cached_calculator_sees_revised_last_bar(self, sample_ohlcv: list[OHLCV]) -> None:
+        """Test that an intraday change to the latest bar is not served from the cache."""
+        from orion.analysis import indicators as indicators_module
+
+        indicators_module._result_cache.clear()
+        calculator = IndicatorCalculator(cache_results=True)
+        revised = [*sample_ohlcv[:-1], replace(sample_ohlcv[-1], close=sample_ohlcv[-1].close / 2)]
+
+        first = calculator.calculate(sample_ohlcv, "CACHED")
+        result = calculator.calculate(revised, "CACHED")
+
+        assert result is not first
+        assert result == IndicatorCalculator().calculate(revised, "CACHED")
+        indicators_module._result_cache.clear()
+
+    def test_cached_panel_reuses_memoized_rows(self, sample_ohlcv: list[OHLCV]) -> None:
+        """Test that a caching calculator's panel only computes symbols not yet memoized."""
+        from orion.analysis import indicators as indicators_module
+
+        indicators_module._result_cache.clear()
+        calculator = IndicatorCalculator(cache_results=True)
+        memoized = calculator.calculate(sample_ohlcv, "CACHED")
+
+        panel = calculator.calculate_panel([sample_ohlcv, sample_ohlcv[:40]], ["CACHED", "SHORT"])
+
+        assert panel.row(0) == memoized
+        assert panel.row(1) == IndicatorCalculator().calculate(sample_ohlcv[:40], "SHORT")
+        assert calculator.calculate(sample_ohlcv[:40], "SHORT") == panel.row(1)
+        assert len(indicators_module._result_cache) == 2
+        indicators_module._result_cache.clear()
+
+    def test_uncached_calculator_recomputes(
+        self, calculator: IndicatorCalculator, sample_ohlcv: list[OHLCV]
+    ) -> None:
+        """Test that the default calculator does not memoize results."""
+        first = calculator.calculate(sample_ohlcv, "SYM")
+
+        assert calculator.calculate(sample_ohlcv, "SYM") is not first
+
+    def test_calculate_batch_rejects_mismatched_shapes(
+        self, calculator: IndicatorCalculator
+    ) -> None:
+        """Test that batch calculation validates input shapes."""
+        with pytest.raises(ValueError, match="same shape"):
+            calculator.calculate_batch(np.zeros((2, 30)), np.zeros((3, 30)))
@@ -1,36 +1,79 @@
 """Tests for the AWS Lambda handler module."""
 
+import asyncio
 import json
+import subprocess
+import sys
 from datetime import datetime
 from decimal import Decimal
-from unittest.mock import MagicMock, patch
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from orion.config import CacheConfig
 from orion.core.screener import ScreeningResult, ScreeningStats
+from orion.data.cached_provider import CachedDataProvider
 from orion.data.models import Quote, TechnicalIndicators
 from orion.lambda_handler import (
+    before_snapshot,
+    build_shared_provider,
+    NO_SYMBOLS_BODY,
+    dumps,
+    error_body,
     get_data_provider,
+    get_notification_service,
+    get_shared_provider,
     get_strategy_path,
     handler,
+    parse_strategy,
     load_config,
     load_notification_config,
     serialize_screening_result,
     serialize_stats,
+    strategy_files,
 )
 
 
 class TestGetStrategyPath:
     """Tests for get_strategy_path function."""
 
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Rescan the strategy directories in each test."""
+        strategy_files.cache_clear()
+        yield
+        strategy_files.cache_clear()
+
     def test_returns_default_when_no_event_strategy(self):
         """Test that default path is returned when no event strategy provided."""
-        with patch("orion.lambda_handler.Path") as mock_path:
-            mock_path.DEFAULT_STRATEGY_PATH = "/opt/strategies/ofi.yaml"
-            mock_path.return_value.exists.return_value = True
+        with patch("orion.lambda_handler.strategy_files") as mock_files:
+            mock_files.return_value = frozenset({"/opt/strategies/ofi.yaml"})
 
             result = get_strategy_path(None)
             assert result == "/opt/strategies/ofi.yaml"
 
+    def test_resolves_names_from_one_directory_scan(self):
+        """Test that strategy names resolve from the index without stat calls."""
+        files = frozenset(
+            {"/opt/strategies/ofi.yaml", "strategies/ofi.yaml", "strategies/wheel.yaml"}
+        )
+        with (
+            patch("orion.lambda_handler.strategy_files", return_value=files),
+            patch("orion.lambda_handler.Path") as mock_path,
+        ):
+            mock_path.return_value.exists.return_value = False
+
+            assert get_strategy_path("ofi") == "/opt/strategies/ofi.yaml"
+            assert get_strategy_path("wheel") == "strategies/wheel.yaml"
+            assert get_strategy_path("ofi.yaml") == "/opt/strategies/ofi.yaml"
+            assert get_strategy_path("missing") == "/opt/strategies/ofi.yaml"
+
+        mock_path.return_value.exists.assert_called_once()
+
+    def test_scans_local_strategy_directory(self):
+        """Test that the local strategies directory is indexed."""
+        assert "strategies/ofi.yaml" in strategy_files()
+
     def test_returns_event_strategy_if_valid_path(self):
         """Test that event strategy path is used if it exists."""
         with patch("orion.lambda_handler.Path") as mock_path:
@@ -43,6 +86,27 @@ class TestGetStrategyPath:
             assert "strategy.yaml" in result
 
 
+class TestParseStrategy:
+    """Tests for parse_strategy function."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Start each test with an empty strategy cache."""
+        parse_strategy.cache_clear()
+        yield
+        parse_strategy.cache_clear()
+
+    def test_reuses_parsed_strategy_until_file_changes(self):
+        """Test that a strategy is parsed once per path and modification time."""
+        with patch("orion.lambda_handler.StrategyParser") as mock_parser:
+            first = parse_strategy("strategies/ofi.yaml", 1.0)
+            second = parse_strategy("strategies/ofi.yaml", 1.0)
+            parse_strategy("strategies/ofi.yaml", 2.0)
+
+        assert first is second
+        assert mock_parser.return_value.parse_file.call_count == 2
+
+
 class TestLoadConfig:
     """Tests for load_config function."""
 
@@ -78,7 +142,7 @@ class TestLoadNotificationConfig:
         monkeypatch.setenv("NOTIFICATIONS__from_address", "from@example.com")
         monkeypatch.setenv("NOTIFICATIONS__to_addresses", '["to@example.com"]')
 
-        with patch("orion.notifications.models.NotificationConfig") as mock_config:
+        with patch("orion.lambda_handler.NotificationConfig") as mock_config:
             mock_instance = MagicMock()
             mock_instance.smtp_host = "smtp.example.com"
             mock_instance.from_address = "from@example.com"
@@ -153,6 +217,40 @@ class TestSerializeScreeningResult:
         assert serialized["indicators"]["rsi_14"] == 45.0
         assert serialized["option_recommendation"] is None
 
+    def test_keeps_zero_values(self):
+        """Test that zero change and indicator values are not turned into None."""
+        result = ScreeningResult(
+            symbol="AAPL",
+            timestamp=datetime(2024, 1, 15, 12, 0, 0),
+            matches=False,
+            signal_strength=0.0,
+            conditions_met=[],
+            conditions_missed=[],
+            quote=Quote(
+                symbol="AAPL",
+                price=150.0,
+                volume=0,
+                timestamp=datetime(2024, 1, 15, 12, 0, 0),
+                open=150.0,
+                high=150.0,
+                low=150.0,
+                close=150.0,
+                change=0.0,
+                change_percent=0.0,
+            ),
+            indicators=TechnicalIndicators(
+                symbol="AAPL", timestamp=datetime(2024, 1, 15, 12, 0, 0), rsi_14=0.0
+            ),
+            option_recommendation=None,
+        )
+
+        serialized = serialize_screening_result(result)
+
+        assert serialized["quote"]["change"] == 0.0
+        assert serialized["quote"]["volume"] == 0
+        assert serialized["indicators"]["rsi_14"] == 0.0
+        assert serialized["indicators"]["sma_20"] is None
+
     def test_serializes_result_with_error(self):
         """Test serialization of a result with error."""
         result = ScreeningResult(
@@ -177,6 +275,37 @@ class TestSerializeScreeningResult:
         assert serialized["indicators"] is None
 
 
+class TestDumps:
+    """Tests for the response body serializer."""
+
+    def test_falls_back_to_stdlib_json(self, monkeypatch):
+        """Test that bodies serialize with the json module when orjson is missing."""
+        monkeypatch.setattr("orion.lambda_handler.orjson", None)
+
+        assert json.loads(dumps({"matches": [], "price": 1.5})) == {"matches": [], "price": 1.5}
+
+    def test_uses_orjson_when_installed(self):
+        """Test that orjson output round-trips, including numpy scalars."""
+        pytest.importorskip("orjson")
+        np = pytest.importorskip("numpy")
+
+        assert json.loads(dumps({"price": np.float64(1.5)})) == {"price": 1.5}
+
+
+class TestErrorBodies:
+    """Tests for the prebuilt error response bodies."""
+
+    def test_no_symbols_body_is_valid_json(self):
+        """Test that the static error body parses as JSON."""
+        assert json.loads(NO_SYMBOLS_BODY) == {"error": "No symbols to screen"}
+
+    def test_error_body_escapes_message(self):
+        """Test that quotes and newlines in the message are escaped."""
+        message = 'bad "value"\nat line 2'
+
+        assert json.loads(error_body(message)) == {"error": message}
+
+
 class TestSerializeStats:
     """Tests for serialize_stats function."""
 
@@ -228,7 +357,7 @@ class TestGetDataProvider:
         mock_config.data_provider.rate_limit = 5
         mock_config.cache.enabled = False
 
-        with patch("orion.lambda_handler.YahooFinanceProvider"):
+        with patch("orion.data.providers.yahoo_finance.YahooFinanceProvider"):
             result = get_data_provider(mock_config)
             assert result is not None
 
@@ -240,16 +369,138 @@ class TestGetDataProvider:
         mock_config.data_provider.rate_limit = 5
         mock_config.cache.enabled = False
 
-        with patch("orion.lambda_handler.AlphaVantageProvider"):
+        with patch("orion.data.providers.alpha_vantage.AlphaVantageProvider"):
             result = get_data_provider(mock_config)
             assert result is not None
 
+    def test_module_import_skips_provider_dependencies(self):
+        """Test that importing the handler loads neither provider module."""
+        import orion
+
+        code = (
+            "import sys, orion.lambda_handler; "
+            "print(sorted(m for m in ('yfinance', 'aiohttp') if m in sys.modules))"
+        )
+        src_dir = str(Path(orion.__file__).parent.parent)
+        output = subprocess.run(
+            [sys.executable, "-c", f"import sys; sys.path.insert(0, {src_dir!r}); {code}"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+
+        assert output.strip() == "[]"
+
+    def test_shared_provider_is_created_once(self):
+        """Test that the shared provider is reused across calls."""
+        with (
+            patch("orion.lambda_handler._PROVIDER", None),
+            patch("orion.lambda_handler.build_shared_provider") as mock_build,
+        ):
+            first = get_shared_provider(MagicMock())
+            second = get_shared_provider(MagicMock())
+
+        assert first is second
+        mock_build.assert_called_once()
+
+    def test_shared_provider_is_cached_when_enabled(self):
+        """Test that the shared provider is wrapped in a cache unless caching is disabled."""
+        config = MagicMock(cache=CacheConfig())
+        upstream = MagicMock()
+
+        with patch("orion.lambda_handler.get_data_provider", return_value=upstream):
+            cached = build_shared_provider(config)
+            config.cache.enabled = False
+            uncached = build_shared_provider(config)
+
+        assert isinstance(cached, CachedDataProvider)
+        assert cached.provider is upstream
+        assert uncached is upstream
+
+
+class TestGetNotificationService:
+    """Tests for get_notification_service function."""
+
+    def test_service_is_created_once(self):
+        """Test that one notification service is shared across calls."""
+        with (
+            patch("orion.lambda_handler._NOTIFICATION_SERVICE", None),
+            patch("orion.lambda_handler.load_notification_config") as mock_load,
+        ):
+            first = get_notification_service()
+            second = get_notification_service()
+
+        assert first is second
+        mock_load.assert_called_once()
+
+    def test_returns_none_without_valid_config(self):
+        """Test that no service is created when the config is invalid."""
+        with (
+            patch("orion.lambda_handler._NOTIFICATION_SERVICE", None),
+            patch("orion.lambda_handler.load_notification_config", return_value=None),
+        ):
+            assert get_notification_service() is None
+
+
+class TestBeforeSnapshot:
+    """Tests for the SnapStart before-snapshot hook."""
+
+    def test_closes_shared_provider(self):
+        """Test that the shared provider's connections are closed before a snapshot."""
+        provider = MagicMock()
+        provider.aclose = AsyncMock()
+
+        service = MagicMock()
+
+        with (
+            patch("orion.lambda_handler._PROVIDER", provider),
+            patch("orion.lambda_handler._NOTIFICATION_SERVICE", service),
+        ):
+            before_snapshot()
+
+        provider.aclose.assert_awaited_once()
+        service.close.assert_called_once()
+
+    def test_without_provider_does_nothing(self):
+        """Test that the hook is a no-op before any provider exists."""
+        with (
+            patch("orion.lambda_handler._PROVIDER", None),
+            patch("orion.lambda_handler._NOTIFICATION_SERVICE", None),
+        ):
+            before_snapshot()
+
 
 class TestHandler:
     """Tests for the Lambda handler function."""
 
-    def test_returns_400_when_no_symbols_provided(self):
+    @pytest.fixture(autouse=True)
+    def shared_provider(self):
+        """Stub the data provider shared across invocations."""
+        parse_strategy.cache_clear()
+        with patch("orion.lambda_handler.get_shared_provider") as mock_provider:
+            yield mock_provider
+        parse_strategy.cache_clear()
+
+    def test_warmer_event_skips_screening(self, shared_provider):
+        """Test that keep-warm pings return without loading config or screening."""
+        with patch("orion.lambda_handler.run_screening") as mock_screening:
+            result = handler({"warmer": True}, None)
+
+        assert result["statusCode"] == 200
+        assert json.loads(result["body"]) == {"status": "warm"}
+        mock_screening.assert_not_called()
+        shared_provider.assert_not_called()
+
+    def test_returns_400_for_invalid_event(self):
+        """Test that events failing schema validation are rejected with 400."""
+        result = handler({"symbols": "AAPL", "notify": "maybe"}, None)
+
+        assert result["statusCode"] == 400
+        assert json.loads(result["body"])["error"].startswith("Invalid event")
+
+    def test_returns_400_when_no_symbols_provided(self, monkeypatch):
         """Test that handler returns 400 when no symbols in event."""
+        monkeypatch.delenv("DEFAULT_SYMBOLS", raising=False)
         event = {"strategy": "ofi", "symbols": []}
 
         class MockContext:
@@ -261,6 +512,31 @@ class TestHandler:
         body = json.loads(result["body"])
         assert "error" in body
 
+    @patch("orion.lambda_handler.run_screening")
+    @patch("orion.lambda_handler.load_config")
+    @patch("orion.lambda_handler.get_strategy_path")
+    def test_uses_default_symbols_when_event_has_none(
+        self, mock_strategy_path, mock_load_config, mock_run_screening, monkeypatch
+    ):
+        """Test that DEFAULT_SYMBOLS is screened when the event lists no symbols."""
+        monkeypatch.setenv("DEFAULT_SYMBOLS", "AAPL, MSFT,,")
+        mock_strategy_path.return_value = "strategies/ofi.yaml"
+        mock_run_screening.return_value = {
+            "matches": [],
+            "stats": {"matches": 0, "duration_seconds": 1.0},
+        }
+
+        class MockContext:
+            request_id = "test-request"
+
+        with patch("orion.lambda_handler.StrategyParser") as mock_parser:
+            mock_parser.return_value.parse_file.return_value.name = "Test Strategy"
+
+            result = handler({"strategy": "ofi"}, MockContext())
+
+        assert result["statusCode"] == 200
+        assert mock_run_screening.call_args.kwargs["symbols"] == ["AAPL", "MSFT"]
+
     def test_returns_404_when_strategy_file_not_found(self):
         """Test that handler returns 404 when strategy file missing."""
         event = {"strategy": "nonexistent", "symbols": ["AAPL"]}
@@ -350,6 +626,81 @@ class TestHandler:
             assert body["symbols_processed"] == 2
             assert body["matches_found"] == 0
 
+    @patch("orion.lambda_handler.run_screening")
+    @patch("orion.lambda_handler.load_config")
+    @patch("orion.lambda_handler.get_strategy_path")
+    @patch("orion.lambda_handler.setup_logging")
+    def test_invocations_share_loop_and_provider(
+        self,
+        mock_logging,
+        mock_strategy_path,
+        mock_load_config,
+        mock_run_screening,
+        shared_provider,
+    ):
+        """Test that warm invocations reuse one event loop and the shared provider."""
+        event = {"symbols": ["AAPL"]}
+
+        class MockContext:
+            request_id = "test-request"
+
+        mock_strategy_path.return_value = "strategies/ofi.yaml"
+        loops = []
+
+        async def fake_run_screening(**kwargs):
+            loops.append(asyncio.get_running_loop())
+            assert kwargs["provider"] is shared_provider.return_value
+            return {"matches": [], "stats": {"matches": 0, "duration_seconds": 1.0}}
+
+        mock_run_screening.side_effect = fake_run_screening
+
+        with patch("orion.lambda_handler.StrategyParser") as mock_parser:
+            mock_parser.return_value.parse_file.return_value.name = "Test Strategy"
+
+            first = handler(event, MockContext())
+            second = handler(event, MockContext())
+
+        assert first["statusCode"] == second["statusCode"] == 200
+        assert loops[0] is loops[1]
+        assert not loops[0].is_closed()
+        mock_logging.assert_not_called()
+
+    @patch("orion.lambda_handler.run_screening")
+    @patch("orion.lambda_handler.load_config")
+    @patch("orion.lambda_handler.get_strategy_path")
+    @patch("orion.lambda_handler.setup_logging")
+    def test_reuses_config_loaded_at_init(
+        self,
+        mock_logging,
+        mock_strategy_path,
+        mock_load_config,
+        mock_run_screening,
+    ):
+        """Test that the config resolved during Lambda INIT is reused."""
+        event = {"symbols": ["AAPL"]}
+
+        class MockContext:
+            request_id = "test-request"
+
+        mock_strategy_path.return_value = "strategies/ofi.yaml"
+        init_config = MagicMock()
+        mock_run_screening.return_value = {
+            "matches": [],
+            "stats": {"matches": 0, "duration_seconds": 1.0},
+        }
+
+        with (
+            patch("orion.lambda_handler._CONFIG", init_config),
+            patch("orion.lambda_handler.StrategyParser") as mock_parser,
+        ):
+            mock_parser.return_value.parse_file.return_value.name = "Test Strategy"
+
+            result = handler(event, MockContext())
+
+        assert result["statusCode"] == 200
+        mock_load_config.assert_not_called()
+        assert mock_run_screening.call_args.kwargs["config"] is init_config
+
     @patch("orion.lambda_handler.run_screening")
     @patch("orion.lambda_handler.load_config")
     @patch("orion.lambda_handler.get_strategy_path")
@@ -475,3 +826,40 @@ class TestRunScreening:
                     assert result["stats"]["matches"] == 1
                     assert len(result["matches"]) == 1
                     assert result["matches"][0]["symbol"] == "AAPL"
+
+    async def test_dry_run_skips_match_serialization(self):
+        """Test that dry runs return stats without serializing the matches."""
+        from orion.lambda_handler import run_screening
+
+        mock_strategy = MagicMock()
+        mock_strategy.name = "Test Strategy"
+        stats = ScreeningStats(
+            total_symbols=1,
+            successful=1,
+            failed=0,
+            matches=1,
+            start_time=datetime.now(),
+            end_time=datetime.now(),
+            duration_seconds=1.0,
+        )
+
+        async def mock_screen_and_filter(syms):
+            return [MagicMock()], stats
+
+        with (
+            patch("orion.lambda_handler.StockScreener") as mock_screener_class,
+            patch("orion.lambda_handler.serialize_screening_result") as mock_serialize,
+        ):
+            mock_screener_class.return_value.screen_and_filter = mock_screen_and_filter
+
+            result = await run_screening(
+                symbols=["AAPL"],
+                strategy=mock_strategy,
+                config=MagicMock(),
+                provider=MagicMock(),
+                dry_run=True,
+            )
+
+        assert result["matches"] == []
+        assert result["stats"]["matches"] == 1
+        mock_serialize.assert_not_called()
@@ -3,6 +3,7 @@ Tests for logging infrastructure.
 """
 
 import json
+import logging
 
 import structlog
 from orion.utils.logging import get_logger, setup_logging
@@ -135,6 +136,19 @@ class TestGetLogger:
             log_data = json.loads(line)
             assert log_data["component"] == "test"
 
+    def test_logger_created_before_setup_respects_level(self, capsys):
+        """Test that a logger created before setup_logging uses the configured level."""
+        logger = get_logger("early_module", component="early")
+        setup_logging(level="INFO", format_type="json")
+
+        logger.debug("early_debug")
+        logger.info("early_info")
+
+        captured = capsys.readouterr()
+        assert "early_debug" not in captured.out
+        assert "early_info" in captured.out
+        assert logger.is_enabled_for(logging.DEBUG) is False
+
     def test_logger_bind_adds_context(self, capsys):
         """Test that bind() adds persistent context."""
         setup_logging(level="INFO", format_type="json")
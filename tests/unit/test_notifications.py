@@ -1,7 +1,9 @@
 """Tests for the notifications module."""
 
+from dataclasses import replace
 from datetime import datetime
 from decimal import Decimal
+from smtplib import SMTPServerDisconnected
 
 import pytest
 from orion.core.screener import ScreeningResult
@@ -96,6 +98,15 @@ class TestNotificationConfig:
         assert config.smtp_port == 587
         assert len(config.to_addresses) == 1
 
+    def test_default_to_addresses_not_shared(self):
+        """Test that each config gets its own empty recipient list."""
+        first = NotificationConfig()
+        second = NotificationConfig()
+
+        first.to_addresses.append("user@example.com")
+
+        assert second.to_addresses == []
+
     def test_config_from_env(self, monkeypatch):
         """Test creating config from environment variables."""
         monkeypatch.setenv("NOTIFICATIONS_ENABLED", "true")
@@ -106,6 +117,7 @@ class TestNotificationConfig:
         monkeypatch.setenv("NOTIFICATION_FROM", "orion@example.com")
         monkeypatch.setenv("NOTIFICATION_TO", "recipient1@example.com,recipient2@example.com")
         monkeypatch.setenv("NOTIFICATION_SUBJECT_PREFIX", "🎯 Signal")
+        monkeypatch.setenv("SMTP_IDLE_TIMEOUT", "60")
 
         config = NotificationConfig.from_env()
 
@@ -117,6 +129,13 @@ class TestNotificationConfig:
         assert config.from_address == "orion@example.com"
         assert config.to_addresses == ["recipient1@example.com", "recipient2@example.com"]
         assert config.subject_prefix == "🎯 Signal"
+        assert config.smtp_idle_timeout == 60.0
+
+    def test_config_from_env_mapping_skips_blank_addresses(self):
+        """Test that blank entries in NOTIFICATION_TO are dropped."""
+        config = NotificationConfig.from_env({"NOTIFICATION_TO": " a@example.com, ,b@example.com,"})
+
+        assert config.to_addresses == ["a@example.com", "b@example.com"]
 
     def test_config_from_env_defaults(self, monkeypatch):
         """Test creating config from environment with defaults."""
@@ -130,6 +149,7 @@ class TestNotificationConfig:
             "NOTIFICATION_FROM",
             "NOTIFICATION_TO",
             "NOTIFICATION_SUBJECT_PREFIX",
+            "SMTP_IDLE_TIMEOUT",
         ]:
             monkeypatch.delenv(key, raising=False)
 
@@ -284,6 +304,20 @@ class TestNotificationService:
 
         assert count == 0
 
+    @pytest.mark.asyncio
+    async def test_send_batch_alerts_disabled(
+        self, notification_config, screening_result_with_match, monkeypatch
+    ):
+        """Test that a disabled service sends no batch alerts."""
+        service = NotificationService(notification_config)
+        monkeypatch.setattr(service, "_send_email_sync", lambda message: pytest.fail("email sent"))
+
+        count = await service.send_batch_alerts(
+            [screening_result_with_match, replace(screening_result_with_match, symbol="MSFT")]
+        )
+
+        assert count == 0
+
     def test_build_html_body(self, notification_config, screening_result_with_match):
         """Test HTML email body generation."""
         service = NotificationService(notification_config)
@@ -363,3 +397,118 @@ class TestNotificationService:
         assert message["From"] == "orion@example.com"
         assert message["To"] == "recipient@example.com"
         assert "1 New Matches" in message["Subject"]
+
+
+class FakeSMTP:
+    """Stand-in for smtplib.SMTP recording sessions and sent messages."""
+
+    instances: list["FakeSMTP"] = []
+
+    def __init__(self, host: str, port: int, timeout: float) -> None:
+        """Record the new connection."""
+        self.sent: list[object] = []
+        self.errors: list[Exception] = []
+        self.alive = True
+        self.closed = False
+        self.logins = 0
+        FakeSMTP.instances.append(self)
+
+    def starttls(self) -> None:
+        """Accept STARTTLS."""
+
+    def login(self, user: str, password: str) -> None:
+        """Count logins."""
+        self.logins += 1
+
+    def noop(self) -> tuple[int, bytes]:
+        """Report whether the connection is still alive."""
+        if not self.alive:
+            raise SMTPServerDisconnected("gone")
+        return 250, b"OK"
+
+    def send_message(self, message: object) -> None:
+        """Record the message, or raise the next queued error."""
+        if self.errors:
+            error = self.errors.pop(0)
+            if isinstance(error, SMTPServerDisconnected):
+                self.alive = False
+            raise error
+        self.sent.append(message)
+
+    def quit(self) -> None:
+        """End the session."""
+        self.alive = False
+
+    def close(self) -> None:
+        """Drop the socket."""
+        self.alive = False
+        self.closed = True
+
+
+class TestSmtpConnectionReuse:
+    """Tests for the persistent SMTP connection."""
+
+    @pytest.fixture
+    def service(self, notification_config, monkeypatch):
+        """Create a service whose SMTP connections are fakes."""
+        FakeSMTP.instances = []
+        monkeypatch.setattr("orion.notifications.service.SMTP", FakeSMTP)
+        return NotificationService(notification_config)
+
+    def test_connection_reused_between_sends(self, service, screening_result_with_match):
+        """Consecutive sends share one connection and one login."""
+        message = service._build_email_message(screening_result_with_match)
+
+        assert service._send_email_sync(message)
+        assert service._send_email_sync(message)
+
+        assert len(FakeSMTP.instances) == 1
+        assert FakeSMTP.instances[0].logins == 1
+        assert len(FakeSMTP.instances[0].sent) == 2
+
+    def test_reconnects_after_server_drop(self, service, screening_result_with_match):
+        """A connection that fails NOOP is replaced by a new one."""
+        message = service._build_email_message(screening_result_with_match)
+        service._send_email_sync(message)
+        FakeSMTP.instances[0].alive = False
+
+        assert service._send_email_sync(message)
+
+        assert len(FakeSMTP.instances) == 2
+        assert len(FakeSMTP.instances[1].sent) == 1
+
+    def test_send_time_drop_closes_old_connection(self, service, screening_result_with_match):
+        """A connection dropped during the send is closed before reconnecting."""
+        message = service._build_email_message(screening_result_with_match)
+        service._send_email_sync(message)
+        FakeSMTP.instances[0].errors = [SMTPServerDisconnected("gone")]
+
+        assert service._send_email_sync(message)
+
+        assert FakeSMTP.instances[0].closed
+        assert len(FakeSMTP.instances[1].sent) == 1
+
+    def test_idle_connection_reopened_without_noop(
+        self, service, screening_result_with_match, monkeypatch
+    ):
+        """A connection idle past smtp_idle_timeout is replaced without NOOP or QUIT."""
+        message = service._build_email_message(screening_result_with_match)
+        service._send_email_sync(message)
+        stale = FakeSMTP.instances[0]
+        monkeypatch.setattr(stale, "noop", lambda: pytest.fail("idle connection probed"))
+        monkeypatch.setattr(stale, "quit", lambda: pytest.fail("QUIT sent on idle connection"))
+        service._smtp_last_used -= service.config.smtp_idle_timeout + 1
+
+        assert service._send_email_sync(message)
+
+        assert len(FakeSMTP.instances) == 2
+        assert stale.closed
+
+    def test_close_ends_session(self, service, screening_result_with_match):
+        """close() quits the open connection."""
+        service._send_email_sync(service._build_email_message(screening_result_with_match))
+
+        service.close()
+
+        assert not FakeSMTP.instances[0].alive
+        assert service._smtp is None
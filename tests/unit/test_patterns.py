@@ -6,9 +6,10 @@ Tests chart pattern detection including bounce patterns and volume confirmation.
 
 from datetime import datetime, timedelta
 
+import numpy as np
 import pytest
 from orion.analysis.patterns import BouncePatternResult, PatternDetector
-from orion.data.models import OHLCV
+from orion.data.models import OHLCV, OhlcvSeries
 
 
 class TestPatternDetector:
@@ -310,6 +311,13 @@ class TestPatternDetector:
         with pytest.raises(ValueError, match="empty|Cannot confirm"):
             detector.confirm_volume([])
 
+    def test_confirm_volume_with_single_bar_raises_error(
+        self, detector: PatternDetector, volume_spike_ohlcv: list[OHLCV]
+    ) -> None:
+        """Test that a single bar has no average to compare against."""
+        with pytest.raises(ValueError, match="at least 2"):
+            detector.confirm_volume(volume_spike_ohlcv[-1:])
+
     def test_detect_bounce_with_volume(
         self, detector: PatternDetector, bounce_pattern_ohlcv: list[OHLCV]
     ) -> None:
@@ -352,6 +360,21 @@ class TestPatternDetector:
         result = detector.detect_bounce_with_volume(data, volume_threshold=1.2)
         assert result is True
 
+    def test_detect_bounce_with_volume_skips_volume_without_bounce(
+        self,
+        detector: PatternDetector,
+        no_bounce_pattern_ohlcv: list[OHLCV],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that volume is not checked when there is no bounce."""
+
+        def fail_confirm_volume(*args: object, **kwargs: object) -> bool:
+            raise AssertionError("confirm_volume should not be called")
+
+        monkeypatch.setattr(detector, "confirm_volume", fail_confirm_volume)
+
+        assert detector.detect_bounce_with_volume(no_bounce_pattern_ohlcv) is False
+
     def test_default_values(self, detector: PatternDetector) -> None:
         """Test that default values are set correctly."""
         assert detector._default_lookback == 5
@@ -434,3 +457,33 @@ class TestPatternDetector:
 
         result = detector.detect_bounce(data)
         assert result is False
+
+    def test_detect_bounce_arrays_matches_list_api(
+        self, detector: PatternDetector, bounce_pattern_ohlcv: list[OHLCV]
+    ) -> None:
+        """Test that the array-based detector agrees with the OHLCV list API."""
+        highs = np.array([float(bar.high) for bar in bounce_pattern_ohlcv])
+        lows = np.array([float(bar.low) for bar in bounce_pattern_ohlcv])
+
+        result = detector.detect_bounce_arrays(highs, lows, lookback=5)
+        expected = detector.detect_bounce_detailed(bounce_pattern_ohlcv, lookback=5)
+
+        assert result == expected
+        assert result.is_bounce is True
+        assert result.previous_high == pytest.approx(102.0)
+        assert result.previous_low == pytest.approx(97.6)
+
+    def test_ohlcv_series_matches_list_api(
+        self, detector: PatternDetector, bounce_pattern_ohlcv: list[OHLCV]
+    ) -> None:
+        """Test that columnar series input agrees with the OHLCV list API."""
+        series = OhlcvSeries.from_bars(bounce_pattern_ohlcv)
+
+        assert detector.detect_bounce_detailed(series) == detector.detect_bounce_detailed(
+            bounce_pattern_ohlcv
+        )
+        assert detector.detect_bounce(series) is True
+        assert detector.confirm_volume(series, threshold=1.0) == detector.confirm_volume(
+            bounce_pattern_ohlcv, threshold=1.0
+        )
+        assert detector.detect_bounce_with_volume(series, volume_threshold=1.0) is True
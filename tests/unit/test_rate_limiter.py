@@ -0,0 +1,86 @@
+"""Tests for the data provider rate limiters."""
+
+import asyncio
+import time
+
+import numpy as np
+import pytest
+from orion.data.rate_limiter import IntervalLimiter, TokenBucket
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_invalid_parameters_raise(self) -> None:
+        """Capacity and rate must be positive."""
+        with pytest.raises(ValueError):
+            TokenBucket(capacity=0, rate=1.0)
+        with pytest.raises(ValueError):
+            TokenBucket(capacity=5, rate=0)
+
+    def test_per_minute(self) -> None:
+        """per_minute builds a bucket with burst N and rate N/60."""
+        bucket = TokenBucket.per_minute(5)
+
+        assert bucket.capacity == 5
+        assert bucket.rate == pytest.approx(5 / 60.0)
+
+    async def test_burst_up_to_capacity_is_immediate(self) -> None:
+        """A full bucket serves `capacity` requests without waiting."""
+        bucket = TokenBucket(capacity=5, rate=5 / 60.0)
+
+        start = time.monotonic()
+        await asyncio.gather(*(bucket.acquire() for _ in range(5)))
+
+        assert time.monotonic() - start < 0.1
+        assert bucket.tokens < 1
+
+    async def test_waits_for_refill_when_empty(self) -> None:
+        """An empty bucket waits for the refill time of the missing tokens."""
+        bucket = TokenBucket(capacity=1, rate=20.0)  # one token every 50ms
+        await bucket.acquire()
+
+        start = time.monotonic()
+        await bucket.acquire()
+
+        assert time.monotonic() - start >= 0.04
+
+    async def test_acquire_more_than_capacity_raises(self) -> None:
+        """Requests larger than the bucket can never be satisfied."""
+        bucket = TokenBucket(capacity=2, rate=1.0)
+
+        with pytest.raises(ValueError, match="capacity"):
+            await bucket.acquire(3)
+
+
+class TestIntervalLimiter:
+    """Tests for IntervalLimiter."""
+
+    def test_negative_interval_raises(self) -> None:
+        """The interval cannot be negative."""
+        with pytest.raises(ValueError):
+            IntervalLimiter(-1.0)
+
+    async def test_first_request_is_immediate(self) -> None:
+        """The first caller does not wait."""
+        limiter = IntervalLimiter(1.0)
+
+        start = time.monotonic()
+        await limiter.acquire()
+
+        assert time.monotonic() - start < 0.05
+
+    async def test_concurrent_callers_are_spaced_out(self) -> None:
+        """Concurrent callers are released one interval apart, not together."""
+        limiter = IntervalLimiter(0.05)
+        released: list[float] = []
+
+        async def request() -> None:
+            await limiter.acquire()
+            released.append(time.monotonic())
+
+        await asyncio.gather(*(request() for _ in range(4)))
+
+        released.sort()
+        gaps = np.diff(released)
+        assert all(gap >= 0.04 for gap in gaps)
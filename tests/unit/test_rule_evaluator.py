@@ -7,8 +7,8 @@ Tests for evaluating stocks against strategy entry conditions.
 from datetime import datetime, timedelta
 
 import pytest
-from orion.data.models import OHLCV, Quote, TechnicalIndicators
-from orion.strategies.evaluator import RuleEvaluator
+from orion.data.models import OHLCV, OhlcvSeries, Quote, TechnicalIndicators
+from orion.strategies.evaluator import ConditionResult, RuleEvaluator
 from orion.strategies.models import Condition, OptionScreening, StockCriteria, Strategy
 
 
@@ -283,6 +283,38 @@ class TestRuleEvaluator:
         assert result.matches is False
         assert "Insufficient data" in result.reason
 
+    def test_check_oversold_rsi_was_below_list_and_series(
+        self, evaluator: RuleEvaluator, bull_trend_indicators: TechnicalIndicators
+    ) -> None:
+        """Test that the RSI lookback finds the oversold window for list and series input."""
+        base_time = datetime(2024, 1, 1)
+        # 40 falling bars followed by a 5-bar recovery
+        closes = [200.0 - i * 2 for i in range(40)] + [122.0 + i * 3 for i in range(5)]
+        historical = [
+            OHLCV(
+                timestamp=base_time + timedelta(days=i),
+                open=close,
+                high=close + 1,
+                low=close - 1,
+                close=close,
+                volume=1_000_000,
+            )
+            for i, close in enumerate(closes)
+        ]
+        condition = Condition(
+            type="oversold",
+            rule="rsi_was_below",
+            parameters={"threshold": 30.0, "lookback_days": 10},
+        )
+
+        from_list = evaluator._check_oversold(condition, bull_trend_indicators, historical)
+        from_series = evaluator._check_oversold(
+            condition, bull_trend_indicators, OhlcvSeries.from_bars(historical)
+        )
+
+        assert from_list.matches is True
+        assert from_series == from_list
+
     @pytest.mark.asyncio
     async def test_signal_strength_calculation(
         self,
@@ -359,6 +391,55 @@ class TestRuleEvaluator:
         # Unknown condition should be marked as missed
         assert "unknown_type" in result.conditions_missed
 
+    def test_compile_conditions_binds_checkers(
+        self,
+        evaluator: RuleEvaluator,
+        sample_quote: Quote,
+        bull_trend_historical: list[OHLCV],
+        bull_trend_indicators: TechnicalIndicators,
+    ) -> None:
+        """Compiled checks follow strategy order and call the checker for each type."""
+        expected = {
+            "trend": lambda c: evaluator._check_trend(c, bull_trend_indicators),
+            "oversold": lambda c: evaluator._check_oversold(
+                c, bull_trend_indicators, bull_trend_historical
+            ),
+            "bounce": lambda c: evaluator._check_bounce(c, bull_trend_historical),
+            "price": lambda c: evaluator._check_price(c, sample_quote),
+            "volume": lambda c: evaluator._check_volume(c, sample_quote, bull_trend_historical),
+        }
+
+        checks = evaluator.compile_conditions()
+
+        assert [condition for condition, _ in checks] == evaluator.strategy.entry_conditions
+        for condition, check in checks:
+            compiled = check(sample_quote, bull_trend_historical, bull_trend_indicators)
+            assert compiled == expected[condition.type](condition)
+
+    def test_compile_conditions_unknown_type(
+        self,
+        sample_quote: Quote,
+        bull_trend_historical: list[OHLCV],
+        bull_trend_indicators: TechnicalIndicators,
+    ) -> None:
+        """Unknown condition types compile to a check that never matches."""
+        strategy = Strategy(
+            name="Unknown",
+            version="1.0.0",
+            description="Unknown condition",
+            stock_criteria=StockCriteria(),
+            entry_conditions=[Condition(type="unknown_type", rule="some_rule")],
+            option_screening=OptionScreening(),
+        )
+
+        ((_, check),) = RuleEvaluator(strategy).compile_conditions()
+
+        assert check(sample_quote, bull_trend_historical, bull_trend_indicators) == (
+            ConditionResult(
+                matches=False, value=None, reason="Unknown condition type: unknown_type"
+            )
+        )
+
     def test_check_price_min_price(self, evaluator: RuleEvaluator, sample_quote: Quote) -> None:
         """Test price condition with minimum price check."""
         condition = Condition(
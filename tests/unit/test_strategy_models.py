@@ -298,3 +298,20 @@ class TestOptionRecommendation:
         assert rec.implied_volatility is None
         assert rec.delta is None
         assert rec.reason == ""
+
+    def test_recommendation_is_slotted(self) -> None:
+        """Test that recommendations carry no per-instance __dict__."""
+        rec = OptionRecommendation(
+            symbol="AAPL240119P00150000",
+            underlying_symbol="AAPL",
+            strike=150.0,
+            expiration=None,
+            option_type="put",
+            bid=2.50,
+            ask=2.60,
+            mid_price=2.55,
+            premium_yield=0.15,
+            volume=500,
+            open_interest=1000,
+        )
+        assert not hasattr(rec, "__dict__")
@@ -0,0 +1,278 @@
+"""Unit tests for the Yahoo Finance provider (no network access)."""
+
+import threading
+from datetime import date
+from types import SimpleNamespace
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pytest
+from orion.data.models import OhlcvSeries
+from orion.data.providers import yahoo_finance
+from orion.data.providers.yahoo_finance import YahooFinanceProvider
+
+
+class FakeTicker:
+    """Stand-in for yf.Ticker returning a fixed history frame."""
+
+    periods: list[str] = []
+
+    def __init__(self, symbol: str) -> None:
+        """Store the symbol."""
+        self.symbol = symbol
+
+    def history(self, period: str, **kwargs: Any) -> pd.DataFrame:
+        """Record the requested period and return two daily bars."""
+        self.periods.append(period)
+        return pd.DataFrame(
+            {
+                "Open": [99.0, 100.0],
+                "High": [101.0, 103.0],
+                "Low": [98.0, 99.5],
+                "Close": [100.0, 102.0],
+                "Volume": [1_000, 2_000],
+            },
+            index=pd.to_datetime(["2024-01-02", "2024-01-03"]),
+        )
+
+
+class TestGetQuote:
+    """Tests for YahooFinanceProvider.get_quote."""
+
+    async def test_quote_from_two_day_history(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The quote uses the latest bar and the prior close from one 2-day request."""
+        FakeTicker.periods = []
+        monkeypatch.setattr(yahoo_finance.yf, "Ticker", FakeTicker)
+        provider = YahooFinanceProvider(rate_limit_delay=0)
+
+        quote = await provider.get_quote("AAPL")
+
+        assert FakeTicker.periods == ["2d"]
+        assert quote.price == 102.0
+        assert quote.previous_close == 100.0
+        assert quote.volume == 2_000
+        assert quote.high == 103.0
+
+
+class FakeOptionTicker:
+    """Stand-in for yf.Ticker with a one-expiration option chain."""
+
+    options = ("2024-02-16",)
+    info = {"currentPrice": 150.0}
+    underlying: dict[str, float] | None = None
+
+    def __init__(self, symbol: str) -> None:
+        """Store the symbol."""
+        self.symbol = symbol
+
+    def option_chain(self, expiration: str) -> SimpleNamespace:
+        """Return two puts, no calls and the configured underlying quote."""
+        puts = pd.DataFrame(
+            {
+                "contractSymbol": ["AAPL240216P00140000", "AAPL240216P00145000"],
+                "strike": [140.0, 145.0],
+                "lastTradeDate": [1_706_000_000, 1_706_000_000],
+                "bid": [1.0, 2.0],
+                "ask": [1.1, 2.2],
+                "lastPrice": [1.05, 2.1],
+                "volume": [10.0, float("nan")],
+                "openInterest": [100, 200],
+                "impliedVolatility": [0.3, 0.25],
+            }
+        )
+        return SimpleNamespace(calls=pd.DataFrame(), puts=puts, underlying=self.underlying)
+
+
+class TestGetOptionChain:
+    """Tests for YahooFinanceProvider.get_option_chain."""
+
+    async def test_parses_contract_rows(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Every put row becomes a contract, NaN counts become 0 and empty calls yield none."""
+        monkeypatch.setattr(yahoo_finance.yf, "Ticker", FakeOptionTicker)
+        provider = YahooFinanceProvider(rate_limit_delay=0)
+
+        chain = await provider.get_option_chain("AAPL")
+
+        assert chain.calls == []
+        assert [put.strike for put in chain.puts] == [140.0, 145.0]
+        assert chain.puts[0].symbol == "AAPL240216P00140000"
+        assert chain.puts[0].volume == 10
+        assert chain.puts[1].volume == 0
+        assert chain.puts[1].open_interest == 200
+        assert chain.underlying_price == 150.0
+        assert chain.expiration == date(2024, 2, 16)
+
+    async def test_underlying_price_from_chain_response(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The underlying price comes from the chain response without fetching info."""
+
+        class QuotedTicker(FakeOptionTicker):
+            underlying = {"regularMarketPrice": 151.5}
+
+            @property
+            def info(self) -> dict[str, float]:  # type: ignore[override]
+                raise AssertionError("ticker.info should not be requested")
+
+        monkeypatch.setattr(yahoo_finance.yf, "Ticker", QuotedTicker)
+        provider = YahooFinanceProvider(rate_limit_delay=0)
+
+        chain = await provider.get_option_chain("AAPL")
+
+        assert chain.underlying_price == 151.5
+
+    def test_trade_dates_from_seconds_or_timestamps(self) -> None:
+        """Epoch seconds and tz-aware timestamps both convert to UTC dates."""
+        seconds = pd.Series([1_706_000_000, 1_706_140_800])
+        stamps = pd.Series(pd.to_datetime(["2024-01-23 09:30", "2024-01-24 23:30"]))
+
+        assert YahooFinanceProvider._column_dates(seconds) == [date(2024, 1, 23), date(2024, 1, 25)]
+        assert YahooFinanceProvider._column_dates(stamps.dt.tz_localize("UTC")) == [
+            date(2024, 1, 23),
+            date(2024, 1, 24),
+        ]
+
+
+class TestAvailableExpirations:
+    """Tests for YahooFinanceProvider.get_available_expirations."""
+
+    async def test_parses_iso_dates(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Expiration strings are returned as dates in order."""
+
+        class ExpirationsTicker(FakeOptionTicker):
+            options = ("2024-02-16", "2024-03-15")
+
+        monkeypatch.setattr(yahoo_finance.yf, "Ticker", ExpirationsTicker)
+        provider = YahooFinanceProvider(rate_limit_delay=0)
+
+        expirations = await provider.get_available_expirations("AAPL")
+
+        assert expirations == [date(2024, 2, 16), date(2024, 3, 15)]
+
+
+class TestTickerCache:
+    """Tests for reusing yfinance Ticker objects."""
+
+    def test_ticker_reused_per_symbol(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Repeated lookups for one symbol return the same Ticker."""
+        monkeypatch.setattr(yahoo_finance.yf, "Ticker", FakeTicker)
+        provider = YahooFinanceProvider(rate_limit_delay=0)
+
+        aapl = provider._ticker("AAPL")
+
+        assert provider._ticker("AAPL") is aapl
+        assert provider._ticker("MSFT") is not aapl
+
+
+class TestExecutor:
+    """Tests for the dedicated yfinance thread pool."""
+
+    async def test_calls_run_on_bounded_pool(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Blocking calls run on the provider's named, bounded pool."""
+        thread_names: list[str] = []
+
+        class RecordingTicker(FakeTicker):
+            def history(self, period: str, **kwargs: Any) -> pd.DataFrame:
+                """Record the calling thread."""
+                thread_names.append(threading.current_thread().name)
+                return super().history(period, **kwargs)
+
+        monkeypatch.setattr(yahoo_finance.yf, "Ticker", RecordingTicker)
+        provider = YahooFinanceProvider(rate_limit_delay=0, executor_workers=2)
+
+        await provider.get_quote("AAPL")
+
+        assert thread_names[0].startswith("yf")
+        executor = provider._executor
+        assert executor is not None
+        assert executor._max_workers == 2
+
+        await provider.aclose()
+
+        assert provider._executor is None
+        assert executor._shutdown
+
+
+class TestBatchHistorical:
+    """Tests for YahooFinanceProvider.get_batch_historical."""
+
+    @staticmethod
+    def download_frame() -> pd.DataFrame:
+        """Build a grouped download where MSFT lacks the first date."""
+        index = pd.to_datetime(["2024-01-02", "2024-01-03"])
+        fields = ["Open", "High", "Low", "Close", "Adj Close", "Volume"]
+        aapl = pd.DataFrame(
+            [[1.0, 2.0, 0.5, 1.5, 1.4, 100.0], [1.5, 2.5, 1.0, 2.0, 1.9, 200.0]],
+            index=index,
+            columns=fields,
+        )
+        msft = pd.DataFrame(
+            [[np.nan] * 6, [10.0, 11.0, 9.0, 10.5, 10.4, 300.0]], index=index, columns=fields
+        )
+        return pd.concat({"AAPL": aapl, "MSFT": msft}, axis=1)
+
+    async def test_splits_download_per_symbol(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """One download is split into per-symbol series; missing symbols get errors."""
+        calls: list[list[str]] = []
+
+        def fake_download(tickers: list[str], **kwargs: Any) -> pd.DataFrame:
+            calls.append(tickers)
+            return self.download_frame()
+
+        monkeypatch.setattr(yahoo_finance.yf, "download", fake_download)
+        provider = YahooFinanceProvider(rate_limit_delay=0)
+
+        results = await provider.get_batch_historical(
+            ["AAPL", "MSFT", "XBAD"], date(2024, 1, 1), date(2024, 1, 31)
+        )
+
+        assert calls == [["AAPL", "MSFT", "XBAD"]]
+        aapl, msft = results["AAPL"], results["MSFT"]
+        assert isinstance(aapl, OhlcvSeries)
+        assert isinstance(msft, OhlcvSeries)
+        assert aapl.close.tolist() == [1.5, 2.0]
+        assert msft.close.tolist() == [10.5]
+        assert msft.volume.tolist() == [300]
+        assert isinstance(results["XBAD"], ValueError)
+
+    async def test_download_failure_maps_to_every_symbol(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A failed download is reported for each requested symbol."""
+
+        def failing_download(tickers: list[str], **kwargs: Any) -> pd.DataFrame:
+            raise RuntimeError("network down")
+
+        monkeypatch.setattr(yahoo_finance.yf, "download", failing_download)
+        provider = YahooFinanceProvider(rate_limit_delay=0)
+
+        results = await provider.get_batch_historical(
+            ["AAPL", "MSFT"], date(2024, 1, 1), date(2024, 1, 31)
+        )
+
+        assert all(isinstance(error, RuntimeError) for error in results.values())
+
+
+class TestRetries:
+    """Tests for the retry policy."""
+
+    async def test_missing_data_is_not_retried(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A ValueError for missing data fails immediately instead of backing off."""
+        requests: list[str] = []
+
+        class EmptyTicker:
+            def __init__(self, symbol: str) -> None:
+                self.symbol = symbol
+
+            def history(self, period: str, **kwargs: Any) -> pd.DataFrame:
+                requests.append(self.symbol)
+                return pd.DataFrame()
+
+        monkeypatch.setattr(yahoo_finance.yf, "Ticker", EmptyTicker)
+        provider = YahooFinanceProvider(rate_limit_delay=0)
+
+        with pytest.raises(ValueError, match="No data found"):
+            await provider.get_quote("NOPE")
+
+        assert requests == ["NOPE"]